@@ -366,6 +366,11 @@ class BoatStructure(object):
         """Computes the shiptrack coordinates, along track distance, and distance made
         good for the selected boat reference.
 
+        The track is intentionally recomputed on every call. The processed
+        velocities it depends on are modified in place by the filter and
+        interpolation methods, so a cached result would have no reliable
+        way to be invalidated.
+
         Parameters
         ----------
         transect: TransectData
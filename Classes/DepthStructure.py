@@ -28,6 +28,16 @@ class DepthStructure(object):
         self.ds_depths = None  # object of DepthData for depth sounder depth data
         self.composite = "On"  # Turn composite depths "on" or "off"
 
+    @property
+    def active(self):
+        """Returns the selected DepthData object.
+
+        Centralizes the getattr on the selected name used by callers to
+        access the depth data for the selected reference.
+        """
+
+        return getattr(self, self.selected)
+
     def add_depth_object(self, depth_in, source_in, freq_in, draft_in, cell_depth_in, cell_size_in):
         """Adds a DepthData object to the depth structure for the specified type of depths.
 
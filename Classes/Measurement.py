@@ -1,8 +1,12 @@
 import os
+import re
+import math
+import time
 import datetime
+import concurrent.futures
+from functools import cached_property
 import numpy as np
 import xml.etree.ElementTree as ETree
-from xml.dom.minidom import parseString
 from Classes.MMT_TRDI import MMTtrdi
 from Classes.TransectData import TransectData, allocate_transects, allocate_rti_transects
 from Classes.PreMeasurement import PreMeasurement
@@ -20,6 +24,530 @@ from MiscLibs.common_functions import cart2pol, pol2cart, rad2azdeg, nans, azdeg
 # from profilehooks import profile
 from Classes.RTT_Rowe import RTTrowe
 
+# Lookup tables used to remap Matlab variable conventions to Python
+_NAVREF_MAP = {'btVel': 'bt_vel', 'ggaVel': 'gga_vel', 'vtgVel': 'vtg_vel'}
+_DEPTHREF_MAP = {'btDepths': 'bt_depths', 'vbDepths': 'vb_depths', 'dsDepths': 'ds_depths'}
+_WTDEPTH_MAP = {'Off': False, 'On': True, 0: False, 1: True}
+
+# Maps SonTek moving-bed test file prefixes to test types
+_MB_TEST_PREFIX_MAP = {'loop': 'Loop', 'smba': 'Stationary'}
+
+# Matches the compass evaluation error reported by StreamPro and
+# RiverRay (Typical Heading Error) or Rio Grande (Total error) ADCPs.
+_COMPASS_ERR_RE = re.compile(r'Typical Heading Error:\s*<\s*([\d.]+)|>>> Total error:\s*([\d.]+)')
+
+# Note lists at least this long are concatenated in bulk with np.char
+_NOTE_BULK_THRESHOLD = 8
+
+# Default WT SNR filter by ADCP manufacturer. SNR is only reported by
+# SonTek style ADCPs, so TRDI defaults to Off.
+_WT_SNR_FILTER_BY_MFR = {'TRDI': 'Off'}
+
+# Static portion of the QRev default settings. The measurement dependent
+# keys (NavRef, WTsnrFilter, WTExcludedDistance, depthComposite, and the
+# interpolation settings) are filled in by qrev_default_settings.
+_QREV_DEFAULT_TEMPLATE = {
+    'CompTracks': 'Off',
+    'WTbeamFilter': -1,
+    'WTdFilter': 'Auto',
+    'WTdFilterThreshold': np.nan,
+    'WTwFilter': 'Auto',
+    'WTwFilterThreshold': np.nan,
+    'WTsmoothFilter': 'Off',
+    'BTbeamFilter': -1,
+    'BTdFilter': 'Auto',
+    'BTdFilterThreshold': np.nan,
+    'BTwFilter': 'Auto',
+    'BTwFilterThreshold': np.nan,
+    'BTsmoothFilter': 'Off',
+    'ggaDiffQualFilter': 2,
+    'ggaAltitudeFilter': 'Auto',
+    'ggaAltitudeFilterChange': np.nan,
+    'vtgsmoothFilter': 'Off',
+    'GPSHDOPFilter': 'Auto',
+    'GPSHDOPFilterMax': np.nan,
+    'GPSHDOPFilterChange': np.nan,
+    'GPSSmoothFilter': 'Off',
+    'depthAvgMethod': 'IDW',
+    'depthValidMethod': 'QRev',
+    'depthReference': 'bt_depths',
+    'depthFilterType': 'Smooth',
+    'edgeVelMethod': 'MeasMag',
+    'edgeRecEdgeMethod': 'Fixed',
+    'extrapTop': 'Power',
+    'extrapBot': 'Power',
+    'extrapExp': 0.1667}
+
+# Static portion of the settings that turn off all filters and
+# interpolations. NavRef and WTExcludedDistance are measurement dependent
+# and are filled in by no_filter_interp_settings.
+_NO_FILTER_TEMPLATE = {
+    'CompTracks': 'Off',
+    'WTbeamFilter': 3,
+    'WTdFilter': 'Off',
+    'WTdFilterThreshold': np.nan,
+    'WTwFilter': 'Off',
+    'WTwFilterThreshold': np.nan,
+    'WTsmoothFilter': 'Off',
+    'WTsnrFilter': 'Off',
+    'BTbeamFilter': 3,
+    'BTdFilter': 'Off',
+    'BTdFilterThreshold': np.nan,
+    'BTwFilter': 'Off',
+    'BTwFilterThreshold': np.nan,
+    'BTsmoothFilter': 'Off',
+    'ggaDiffQualFilter': 1,
+    'ggaAltitudeFilter': 'Off',
+    'ggaAltitudeFilterChange': np.nan,
+    'vtgsmoothFilter': 'Off',
+    'GPSHDOPFilter': 'Off',
+    'GPSHDOPFilterMax': np.nan,
+    'GPSHDOPFilterChange': np.nan,
+    'GPSSmoothFilter': 'Off',
+    'depthAvgMethod': 'IDW',
+    'depthValidMethod': 'QRev',
+    'depthReference': 'btDepths',
+    'depthFilterType': 'None',
+    'depthComposite': 'Off',
+    'BTInterpolation': 'None',
+    'WTEnsInterpolation': 'None',
+    'WTCellInterpolation': 'None',
+    'GPSInterpolation': 'None',
+    'depthInterpolation': 'None',
+    'WTwtDepthFilter': 'Off',
+    'edgeVelMethod': 'MeasMag',
+    'edgeRecEdgeMethod': 'Fixed'}
+
+
+# Filter specs mapping filter kwargs to settings keys. Each entry is
+# (kwarg, settings key, threshold entries) where the threshold entries are
+# only applied when the filter is set to Manual.
+_BT_FILTER_SPEC = (
+    ('difference', 'BTdFilter', (('difference_threshold', 'BTdFilterThreshold'),)),
+    ('vertical', 'BTwFilter', (('vertical_threshold', 'BTwFilterThreshold'),)),
+    ('beam', 'BTbeamFilter', ()),
+    ('other', 'BTsmoothFilter', ()))
+
+_GGA_FILTER_SPEC = (
+    ('differential', 'ggaDiffQualFilter', ()),
+    ('altitude', 'ggaAltitudeFilter', (('altitude_threshold', 'ggaAltitudeFilterChange'),)),
+    ('hdop', 'GPSHDOPFilter', (('hdop_max_threshold', 'GPSHDOPFilterMax'),
+                               ('hdop_change_threshold', 'GPSHDOPFilterChange'))),
+    ('other', 'GPSSmoothFilter', ()))
+
+_VTG_FILTER_SPEC = (
+    ('hdop', 'GPSHDOPFilter', (('hdop_max_threshold', 'GPSHDOPFilterMax'),
+                               ('hdop_change_threshold', 'GPSHDOPFilterChange'))),
+    ('other', 'GPSSmoothFilter', ()))
+
+_WT_FILTER_SPEC = (
+    ('difference', 'WTdFilter', (('difference_threshold', 'WTdFilterThreshold'),)),
+    ('vertical', 'WTwFilter', (('vertical_threshold', 'WTwFilterThreshold'),)),
+    ('beam', 'WTbeamFilter', ()),
+    ('other', 'WTsmoothFilter', ()),
+    ('snr', 'WTsnrFilter', ()),
+    ('wt_depth', 'WTwtDepthFilter', ()),
+    ('excluded', 'WTExcludedDistance', ()))
+
+
+def _filter_kwargs(settings, spec):
+    """Builds filter kwargs from settings using a filter spec.
+
+    Parameters
+    ----------
+    settings: dict
+        Dictionary of reference, filter, and interpolation settings
+    spec: tuple
+        Filter spec, one of the module level _*_FILTER_SPEC tuples
+
+    Returns
+    -------
+    kwargs: dict
+        Keyword arguments for the filter method
+    """
+
+    kwargs = {}
+    for kwarg, key, thresholds in spec:
+        value = settings[key]
+        kwargs[kwarg] = value
+        if value == 'Manual':
+            for threshold_kwarg, threshold_key in thresholds:
+                kwargs[threshold_kwarg] = settings[threshold_key]
+    return kwargs
+
+
+# Edge-shape coefficients used to estimate the edge cross sectional area.
+# The Custom shape is handled separately since its coefficient depends on
+# the user supplied value.
+_EDGE_COEF = {'Triangular': 0.5, 'Rectangular': 1.0, 'User Q': 0.5}
+
+
+def _edge_area(edge, edge_depth):
+    """Computes the approximate cross sectional area of an edge.
+
+    Parameters
+    ----------
+    edge: EdgeData
+        Object of EdgeData for the edge
+    edge_depth: float
+        Mean depth of the edge ensembles in m
+
+    Returns
+    -------
+    area: float
+        Edge area in m**2
+    """
+
+    if edge.type == 'Custom':
+        coef = 0.5 + (edge.cust_coef - 0.3535)
+    else:
+        coef = _EDGE_COEF.get(edge.type, 1)
+    return edge_depth * edge.distance_m * coef
+
+
+def _nansum_scalars(*values):
+    """Nan-aware sum of a few scalars.
+
+    Equivalent to np.nansum on a short list but without the list, array,
+    and ufunc dispatch overhead, which dominates for a handful of values.
+
+    Parameters
+    ----------
+    values: float
+        Scalars to be summed
+
+    Returns
+    -------
+    total: float
+        Sum of the values that are not nan
+    """
+
+    return sum(value for value in values if not math.isnan(value))
+
+
+def _format_notes(notes):
+    """Formats mmt file notes as comment strings.
+
+    Long note lists are concatenated in the NumPy C layer; short lists use
+    plain f-strings to avoid the array construction overhead.
+
+    Parameters
+    ----------
+    notes: list
+        List of note dictionaries from the mmt file
+
+    Returns
+    -------
+    comments: list
+        List of formatted comment strings
+    """
+
+    if len(notes) >= _NOTE_BULK_THRESHOLD:
+        files = np.array([note['NoteFileNo'] for note in notes])
+        dates = np.array([note['NoteDate'] for note in notes])
+        texts = np.array([note['NoteText'] for note in notes])
+        result = np.char.add(np.char.add(' File: ', files),
+                             np.char.add(np.char.add(' ', dates),
+                                         np.char.add(': ', texts)))
+        return result.tolist()
+    return [f" File: {note['NoteFileNo']} {note['NoteDate']}: {note['NoteText']}"
+            for note in notes]
+
+
+_SENTINEL = object()
+
+
+def _all_same(values):
+    """Checks whether all values of an iterable are equal.
+
+    Short-circuits on the first mismatch, which avoids hashing every
+    value into a set when only uniformity matters. An empty iterable is
+    considered uniform.
+
+    Parameters
+    ----------
+    values: iterable
+        Values to be compared
+
+    Returns
+    -------
+    same: bool
+        True if all values are equal
+    """
+
+    iterator = iter(values)
+    first = next(iterator, _SENTINEL)
+    return all(value == first for value in iterator)
+
+
+# Uncertainty nodes written to the xml ChannelSummary. Each entry is
+# (tag, Uncertainty attribute, optional); optional nodes are skipped when
+# the value is nan.
+_UNC_AUTO_FIELDS = (
+    ('COV', 'cov', True),
+    ('AutoRandom', 'cov_95', True),
+    ('AutoInvalidData', 'invalid_95', False),
+    ('AutoEdge', 'edges_95', False),
+    ('AutoExtrapolation', 'extrapolation_95', False),
+    ('AutoMovingBed', 'moving_bed_95', False),
+    ('AutoSystematic', 'systematic', False),
+    ('AutoTotal', 'total_95', True))
+
+# User supplied uncertainty nodes, written only when the value is set
+_UNC_USER_FIELDS = (
+    ('UserRandom', 'cov_95_user'),
+    ('UserInvalidData', 'invalid_95_user'),
+    ('UserEdge', 'edges_95_user'),
+    ('UserExtrapolation', 'extrapolation_95_user'),
+    ('UserMovingBed', 'moving_bed_95_user'),
+    ('UserSystematic', 'systematic_user'))
+
+# Combined uncertainty nodes as (tag, user attribute, auto attribute,
+# optional); a set user value overrides the automatic value
+_UNC_COMBINED_FIELDS = (
+    ('Random', 'cov_95_user', 'cov_95', True),
+    ('InvalidData', 'invalid_95_user', 'invalid_95', False),
+    ('Edge', 'edges_95_user', 'edges_95', False),
+    ('Extrapolation', 'extrapolation_95_user', 'extrapolation_95', False),
+    ('MovingBed', 'moving_bed_95_user', 'moving_bed_95', False),
+    ('Systematic', 'systematic_user', 'systematic', False))
+
+
+def _selected(container):
+    """Returns the selected data object of a sensor or reference container.
+
+    Centralizes the getattr on the selected name used when reading the
+    active data source of the sensor, depth, and boat velocity
+    containers.
+
+    Parameters
+    ----------
+    container: object
+        Object with a selected attribute naming one of its attributes
+
+    Returns
+    -------
+    data: object
+        Object named by selected
+    """
+
+    return getattr(container, container.selected)
+
+
+def _uniform(values, varies='Varies'):
+    """Returns the common value of an iterable or the varies label.
+
+    Used for the xml nodes that report a setting as its value when all
+    checked transects agree and as 'Varies' otherwise. Stops at the
+    first mismatch.
+
+    Parameters
+    ----------
+    values: iterable
+        Values to be compared, must not be empty
+    varies: str
+        Label returned when the values differ
+
+    Returns
+    -------
+    value: str, float
+        Common value or the varies label
+    """
+
+    iterator = iter(values)
+    first = next(iterator)
+    if all(value == first for value in iterator):
+        return first
+    return varies
+
+
+def _nan_padded_stack(arrays):
+    """Stacks 1-D arrays of different lengths into a nan padded 2-D array.
+
+    The padding allows per-transect statistics to be computed with a
+    single axis reduction instead of one NumPy call per transect; the
+    nan-aware reductions ignore the padding.
+
+    Parameters
+    ----------
+    arrays: list
+        List of 1-D arrays or scalars
+
+    Returns
+    -------
+    stacked: np.array
+        2-D array with one row per input array
+    """
+
+    arrays = [np.atleast_1d(np.asarray(array, dtype=float)) for array in arrays]
+    stacked = np.full((len(arrays), max(array.size for array in arrays)), np.nan)
+    for row, array in zip(stacked, arrays):
+        row[:array.size] = array
+    return stacked
+
+
+def _percentile99(values):
+    """Computes the 99th percentile of the valid values.
+
+    Matches np.nanpercentile(values, 99) with the default linear
+    interpolation but selects the two bracketing order statistics with
+    np.partition, which is O(n) rather than the O(n log n) full sort.
+
+    Parameters
+    ----------
+    values: np.array
+        Data for which the percentile is computed, may contain nan
+
+    Returns
+    -------
+    percentile: float
+        99th percentile or nan if there are no valid values
+    """
+
+    valid = values[np.logical_not(np.isnan(values))].ravel()
+    if valid.size == 0:
+        return np.nan
+    index = 0.99 * (valid.size - 1)
+    k = int(index)
+    if k + 1 >= valid.size:
+        return np.partition(valid, k)[k]
+    part = np.partition(valid, (k, k + 1))
+    return part[k] + (index - k) * (part[k + 1] - part[k])
+
+
+def _fmt_ts(serial_time):
+    """Formats a serial time as a UTC date time string for the xml output.
+
+    Formats the struct_time fields directly, which avoids the datetime
+    allocation and strftime call used previously.
+
+    Parameters
+    ----------
+    serial_time: float
+        Seconds since the epoch
+
+    Returns
+    -------
+    formatted: str
+        Date and time as mm/dd/yyyy HH:MM:SS in UTC
+    """
+
+    ts = time.gmtime(int(serial_time))
+    return (f'{ts.tm_mon:02d}/{ts.tm_mday:02d}/{ts.tm_year:04d} '
+            f'{ts.tm_hour:02d}:{ts.tm_min:02d}:{ts.tm_sec:02d}')
+
+
+def _indent(element, level=0):
+    """Indents an xml tree in place for readable output.
+
+    Sets the text and tail whitespace so the serialized tree matches the
+    tab indented layout previously produced by minidom, without the
+    serialize / reparse / pretty print round trip.
+
+    Parameters
+    ----------
+    element: Element
+        Element to indent, children are indented recursively
+    level: int
+        Depth of element in the tree
+    """
+
+    pad = '\n' + '\t' * level
+    if len(element):
+        if not element.text or not element.text.strip():
+            element.text = pad + '\t'
+        child = None
+        for child in element:
+            _indent(child, level + 1)
+            if not child.tail or not child.tail.strip():
+                child.tail = pad + '\t'
+        if not child.tail or not child.tail.strip():
+            child.tail = pad
+    elif level and (not element.tail or not element.tail.strip()):
+        element.tail = pad
+
+
+# Attribute dicts shared by the xml output. Element copies the dict it is
+# given, so one dict per combination replaces the fresh keyword dict that
+# would otherwise be built at every SubElement call.
+_ATTR_CHAR = {'type': 'char'}
+_ATTR_DOUBLE = {'type': 'double'}
+_ATTR_INT = {'type': 'integer'}
+_ATTR_CMS = {'type': 'double', 'unitsCode': 'cms'}
+_ATTR_M = {'type': 'double', 'unitsCode': 'm'}
+_ATTR_MPS = {'type': 'double', 'unitsCode': 'mps'}
+_ATTR_DEG = {'type': 'double', 'unitsCode': 'deg'}
+_ATTR_DEGC = {'type': 'double', 'unitsCode': 'degC'}
+_ATTR_SQM = {'type': 'double', 'unitsCode': 'sqm'}
+_ATTR_SEC = {'type': 'double', 'unitsCode': 'sec'}
+_ATTR_PPT = {'type': 'double', 'unitsCode': 'ppt'}
+_ATTR_CHAR_M = {'type': 'char', 'unitsCode': 'm'}
+_ATTR_CHAR_MPS = {'type': 'char', 'unitsCode': 'mps'}
+_ATTR_CHAR_PPT = {'type': 'char', 'unitsCode': 'ppt'}
+_ATTR_CHAR_KHZ = {'type': 'char', 'unitsCode': 'kHz'}
+
+
+def _add(parent, tag, value, fmt=None, attrib=None):
+    """Adds a child element with formatted text to an xml element.
+
+    Centralizes the repeated SubElement / format pattern used to build the
+    xml output. Elements with a value of None or nan are not created, which
+    replaces the guard blocks used for optional nodes.
+
+    Parameters
+    ----------
+    parent: Element
+        Parent element the child is added to
+    tag: str
+        Tag of the child element
+    value: str, float, int
+        Value used for the element text
+    fmt: str
+        Format specification applied to value, if None str is used
+    attrib: dict
+        Attributes of the child element
+
+    Returns
+    -------
+    element: Element
+        Element created or None if the value was missing
+    """
+
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return _sub(parent, tag, value, fmt, attrib)
+
+
+def _sub(parent, tag, value, spec=None, attrib=None):
+    """Adds a child element with formatted text to an xml element.
+
+    Unlike _add the element is always created, matching the inline
+    SubElement assignments it replaces.
+
+    Parameters
+    ----------
+    parent: Element
+        Parent element the child is added to
+    tag: str
+        Tag of the child element
+    value: str, float, int
+        Value used for the element text
+    spec: str
+        Format specification applied to value, if None str is used
+    attrib: dict
+        Attributes of the child element
+
+    Returns
+    -------
+    element: Element
+        Element created
+    """
+
+    element = ETree.SubElement(parent, tag, attrib if attrib is not None else {})
+    element.text = format(value, spec) if spec else str(value)
+    return element
+
+
 class Measurement(object):
     """Class to hold all measurement details.
 
@@ -91,15 +619,28 @@ class Measurement(object):
         self.extrap_fit = None
         self.processing = None
         self.discharge = []
-        self.uncertainty = None
         self.initial_settings = None
-        self.qa = None
         self.user_rating = None
         self.comments = []
         self.ext_temp_chk = {'user': np.nan, 'units': 'C', 'adcp': np.nan, 'user_orig': np.nan, 'adcp_orig': np.nan}
         self.checked_transect_idx = []
         self.oursin = None
 
+        # Cache for current_settings. None indicates the cache is stale and
+        # the settings must be rebuilt from the transect data.
+        self._settings_cache = None
+
+        # Default settings keyed by the signature of the measurement state
+        # they were built from
+        self._default_settings_cache = {}
+
+        # Extrapolation sensitivity cache. The revision counter is bumped
+        # whenever the transect data the sensitivity is computed from may
+        # have changed.
+        self._transect_data_rev = 0
+        self._qsens_signature = None
+        self._qsens_cached = None
+
         # Load data from selected source
         if source == 'QRev':
             self.load_qrev_mat(mat_data=in_file)
@@ -147,31 +688,10 @@ class Measurement(object):
                         moving_bed_tests=self.mb_tests, boat_ref=ref)
 
                 # Set processing type
-                if proc_type == 'QRev':
-                    # Apply QRev default settings
-                    settings = self.qrev_default_settings(check_user_excluded_dist=True)
-
-                    settings['Processing'] = 'QRev'
-                    self.apply_settings(settings)
-
-                elif proc_type == 'None':
-                    # Processing with no filters and interpolation
-                    settings = self.no_filter_interp_settings(self)
-                    settings['Processing'] = 'None'
-                    self.apply_settings(settings)
-
-                elif proc_type == 'Original':
-                    # Processing for original settings
-                    # from manufacturer software
-                    for transect in self.transects:
-                        q = QComp()
-                        q.populate_data(data_in=transect,
-                                        moving_bed_data=self.mb_tests)
-                        self.discharge.append(q)
-                self.uncertainty = Uncertainty()
-                self.uncertainty.compute_uncertainty(self)
-
-                self.qa = QAData(self)
+                proc_method = self._PROC_DISPATCH.get(proc_type)
+                if proc_method is not None:
+                    proc_method(self)
+                # self.uncertainty and self.qa are computed on first access
                 # if self.run_oursin:
                 #     self.oursin = Oursin()
                 #     self.oursin.compute_oursin(self)
@@ -179,6 +699,55 @@ class Measurement(object):
                 # self.oursin_orig = Oursin_orig()
                 # self.oursin_orig.compute_oursin(self)
 
+    def _proc_qrev(self):
+        """Processes the measurement with QRev default settings."""
+
+        settings = self.qrev_default_settings(check_user_excluded_dist=True)
+        settings['Processing'] = 'QRev'
+        self.apply_settings(settings)
+
+    def _proc_none(self):
+        """Processes the measurement with no filters and interpolation."""
+
+        settings = self.no_filter_interp_settings(self)
+        settings['Processing'] = 'None'
+        self.apply_settings(settings)
+
+    def _proc_original(self):
+        """Processes the measurement with the original settings from the
+        manufacturer software."""
+
+        for transect in self.transects:
+            q = QComp()
+            q.populate_data(data_in=transect,
+                            moving_bed_data=self.mb_tests)
+            self.discharge.append(q)
+
+    # Dispatch table mapping proc_type to the processing method
+    _PROC_DISPATCH = {'QRev': _proc_qrev, 'None': _proc_none, 'Original': _proc_original}
+
+    @cached_property
+    def uncertainty(self):
+        """Computes the uncertainty on first access.
+
+        Assigning to self.uncertainty, as apply_settings does, replaces the
+        cached value.
+        """
+
+        uncertainty = Uncertainty()
+        uncertainty.compute_uncertainty(self)
+        return uncertainty
+
+    @cached_property
+    def qa(self):
+        """Computes the quality assurance data on first access.
+
+        Assigning to self.qa, as apply_settings does, replaces the cached
+        value.
+        """
+
+        return QAData(self)
+
     def load_trdi(self, mmt_file, transect_type='Q', checked=False):
         """Method to load TRDI data.
 
@@ -194,10 +763,11 @@ class Measurement(object):
 
         # Read mmt file
         mmt = MMTtrdi(mmt_file)
+        site = mmt.site_info
 
         # Get properties if they exist, otherwise set them as blank strings
-        self.station_name = str(mmt.site_info['Name'])
-        self.station_number = str(mmt.site_info['Number'])
+        self.station_name = str(site['Name'])
+        self.station_number = str(site['Number'])
 
         # Initialize processing variable
         self.processing = 'WR2'
@@ -215,20 +785,18 @@ class Measurement(object):
             self.qaqc_trdi(mmt)
         
         # Save comments from mmt file in comments
-        self.comments.append('MMT Remarks: ' + mmt.site_info['Remarks'])
+        self.comments.append('MMT Remarks: ' + site['Remarks'])
 
         for t in range(len(self.transects)):
             notes = getattr(mmt.transects[t], 'Notes')
-            for note in notes:
-                note_text = ' File: ' + note['NoteFileNo'] + ' ' \
-                            + note['NoteDate'] + ': ' + note['NoteText']
-                self.comments.append(note_text)
-                
+            self.comments.extend(_format_notes(notes))
+
         # Get external temperature
-        if type(mmt.site_info['Water_Temperature']) is float:
-            self.ext_temp_chk['user'] = mmt.site_info['Water_Temperature']
+        water_temperature = site.get('Water_Temperature')
+        if isinstance(water_temperature, float):
+            self.ext_temp_chk['user'] = water_temperature
             self.ext_temp_chk['units'] = 'C'
-            self.ext_temp_chk['user_orig'] = mmt.site_info['Water_Temperature']
+            self.ext_temp_chk['user_orig'] = water_temperature
 
         # Initialize thresholds settings dictionary
         threshold_settings = dict()
@@ -242,95 +810,119 @@ class Measurement(object):
         else:
             ref_transect = 0
 
+        # Cache the reference mmt transect and its configuration dictionary
+        ref_mmt_transect = mmt.transects[ref_transect]
+        ref_config = ref_mmt_transect.active_config
+
         # Water track filter threshold settings
         threshold_settings['wt_settings']['beam'] = \
-            self.set_num_beam_wt_threshold_trdi(mmt.transects[ref_transect])
+            self.set_num_beam_wt_threshold_trdi(ref_mmt_transect)
         threshold_settings['wt_settings']['difference'] = 'Manual'
         threshold_settings['wt_settings']['difference_threshold'] = \
-            mmt.transects[ref_transect].active_config['Proc_WT_Error_Velocity_Threshold']
+            ref_config['Proc_WT_Error_Velocity_Threshold']
         threshold_settings['wt_settings']['vertical'] = 'Manual'
         threshold_settings['wt_settings']['vertical_threshold'] = \
-            mmt.transects[ref_transect].active_config['Proc_WT_Up_Vel_Threshold']
+            ref_config['Proc_WT_Up_Vel_Threshold']
 
         # Bottom track filter threshold settings
         threshold_settings['bt_settings']['beam'] = \
-            self.set_num_beam_bt_threshold_trdi(mmt.transects[ref_transect])
+            self.set_num_beam_bt_threshold_trdi(ref_mmt_transect)
         threshold_settings['bt_settings']['difference'] = 'Manual'
         threshold_settings['bt_settings']['difference_threshold'] = \
-            mmt.transects[ref_transect].active_config['Proc_BT_Error_Vel_Threshold']
+            ref_config['Proc_BT_Error_Vel_Threshold']
         threshold_settings['bt_settings']['vertical'] = 'Manual'
         threshold_settings['bt_settings']['vertical_threshold'] = \
-            mmt.transects[ref_transect].active_config['Proc_BT_Up_Vel_Threshold']
+            ref_config['Proc_BT_Up_Vel_Threshold']
 
         # Depth filter and averaging settings
         threshold_settings['depth_settings']['depth_weighting'] = \
-            self.set_depth_weighting_trdi(mmt.transects[ref_transect])
+            self.set_depth_weighting_trdi(ref_mmt_transect)
         threshold_settings['depth_settings']['depth_valid_method'] = 'TRDI'
         threshold_settings['depth_settings']['depth_screening'] = \
-            self.set_depth_screening_trdi(mmt.transects[ref_transect])
+            self.set_depth_screening_trdi(ref_mmt_transect)
 
         # Determine reference used in WR2 if available
-        reference = 'BT'
-        if 'Reference' in mmt.site_info.keys():
-            reference = mmt.site_info['Reference']
-            if reference == 'BT':
-                target = 'bt_vel'
-            elif reference == 'GGA':
-                target = 'gga_vel'
-            elif reference == 'VTG':
-                target = 'vtg_vel'
-            else:
-                target = 'bt_vel'
+        reference = site.get('Reference', 'BT')
+        if reference == 'GGA':
+            target = 'gga_vel'
+        elif reference == 'VTG':
+            target = 'vtg_vel'
+        else:
+            target = 'bt_vel'
+
+        if any(getattr(transect.boat_vel, target) is None
+               for transect in self.transects):
+            reference = 'BT'
+
+        # Process each transect. Transects are independent of each other so the
+        # NumPy heavy processing can run in parallel threads.
+        configs = [mmt_transect.active_config for mmt_transect in mmt.transects]
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, max(1, len(self.transects)))) as executor:
+            list(executor.map(self.process_trdi_transect,
+                              self.transects,
+                              configs,
+                              [reference] * len(self.transects),
+                              [threshold_settings] * len(self.transects)))
 
-            for transect in self.transects:
-                if getattr(transect.boat_vel, target) is None:
-                    reference = 'BT'
+    @staticmethod
+    def process_trdi_transect(transect, active_config, reference, threshold_settings):
+        """Applies coordinate transformation, filters, and interpolation to a
+        single TRDI transect.
+
+        Parameters
+        ----------
+        transect: TransectData
+            Object of TransectData
+        active_config: dict
+            Dictionary of active configuration settings from the mmt file
+        reference: str
+            Navigation reference (BT, GGA, VTG)
+        threshold_settings: dict
+            Threshold settings from the mmt file
+        """
 
         # Convert to earth coordinates
-        for transect_idx, transect in enumerate(self.transects):
-            # Convert to earth coordinates
-            transect.change_coord_sys(new_coord_sys='Earth')
+        transect.change_coord_sys(new_coord_sys='Earth')
 
-            # Set navigation reference
-            transect.change_nav_reference(update=False, new_nav_ref=reference)
+        # Set navigation reference
+        transect.change_nav_reference(update=False, new_nav_ref=reference)
 
-            # Apply WR2 thresholds
-            self.thresholds_trdi(transect, threshold_settings)
+        # Apply WR2 thresholds
+        Measurement.thresholds_trdi(transect, threshold_settings)
 
-            # Apply boat interpolations
+        # Apply boat interpolations
+        transect.boat_interpolations(update=False,
+                                     target='BT',
+                                     method='None')
+        if transect.gps is not None:
             transect.boat_interpolations(update=False,
-                                         target='BT',
-                                         method='None')
-            if transect.gps is not None:
-                transect.boat_interpolations(update=False,
-                                             target='GPS',
-                                             method='HoldLast')
+                                         target='GPS',
+                                         method='HoldLast')
 
-            # Update water data for changes in boat velocity
-            transect.update_water()
+        # Update water data for changes in boat velocity
+        transect.update_water()
 
-            # Filter water data
-            transect.w_vel.apply_filter(transect=transect, wt_depth=True)
+        # Filter water data
+        transect.w_vel.apply_filter(transect=transect, wt_depth=True)
 
-            # Interpolate water data
-            transect.w_vel.apply_interpolation(transect=transect,
-                                               ens_interp='None',
-                                               cells_interp='None')
+        # Interpolate water data
+        transect.w_vel.apply_interpolation(transect=transect,
+                                           ens_interp='None',
+                                           cells_interp='None')
 
-            # Apply speed of sound computations as required
-            mmt_sos_method = mmt.transects[transect_idx].active_config[
-                'Proc_Speed_of_Sound_Correction']
+        # Apply speed of sound computations as required
+        mmt_sos_method = active_config['Proc_Speed_of_Sound_Correction']
 
-            # Speed of sound computed based on user supplied values
-            if mmt_sos_method == 1:
-                transect.change_sos(parameter='salinity')
-            elif mmt_sos_method == 2:
-                # Speed of sound set by user
-                speed = mmt.transects[transect_idx].active_config[
-                    'Proc_Fixed_Speed_Of_Sound']
-                transect.change_sos(parameter='sosSrc',
-                                    selected='user',
-                                    speed=speed)
+        # Speed of sound computed based on user supplied values
+        if mmt_sos_method == 1:
+            transect.change_sos(parameter='salinity')
+        elif mmt_sos_method == 2:
+            # Speed of sound set by user
+            speed = active_config['Proc_Fixed_Speed_Of_Sound']
+            transect.change_sos(parameter='sosSrc',
+                                selected='user',
+                                speed=speed)
 
     def qaqc_trdi(self, mmt):
         """Processes qaqc test, calibrations, and evaluations
@@ -379,27 +971,31 @@ class Measurement(object):
 
             # Process moving-bed tests
             if len(transects) > 0:
-                self.mb_tests = []
+                self.mb_tests = [None] * len(transects)
+                notes_buf = []
                 for n in range(len(transects)):
 
                     # Create moving-bed test object
                     mb_test = MovingBedTests()
                     mb_test.populate_data('TRDI', transects[n],
                                           mmt.mbt_transects[n].moving_bed_type)
-                    
+
                     # Save notes from mmt files in comments
                     notes = getattr(mmt.mbt_transects[n], 'Notes')
-                    for note in notes:
-                        note_text = ' File: ' + note['NoteFileNo'] + ' ' \
-                                    + note['NoteDate'] + ': ' + note['NoteText']
-                        self.comments.append(note_text)
+                    notes_buf.extend(_format_notes(notes))
 
-                    self.mb_tests.append(mb_test)
+                    self.mb_tests[n] = mb_test
+                self.comments.extend(notes_buf)
 
     @staticmethod
     def thresholds_trdi(transect, settings):
         """Retrieve and apply manual filter settings from mmt file
 
+        Filters are intentionally applied one transect at a time. The Auto
+        filter thresholds are statistics of the individual transect, so
+        batching the arrays of several transects through a single filter call
+        would change the computed thresholds and the results.
+
         Parameters
         ----------
         transect: TransectData
@@ -589,14 +1185,18 @@ class Measurement(object):
         rsdata = None
         pathname = None
 
-        for file in fullnames:
-            # Read data file
-            rsdata = MatSonTek(file)
-            pathname, file_name = os.path.split(file)
+        # Create transect objects for each discharge transect
+        self.transects = [TransectData() for _ in fullnames]
 
-            # Create transect objects for each discharge transect
-            self.transects.append(TransectData())
-            self.transects[-1].sontek(rsdata, file_name)
+        # Read the independent data files in parallel
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, max(1, len(fullnames)))) as executor:
+            rsdata_list = list(executor.map(MatSonTek, fullnames))
+
+        for n, file in enumerate(fullnames):
+            rsdata = rsdata_list[n]
+            pathname, file_name = os.path.split(file)
+            self.transects[n].sontek(rsdata, file_name)
 
         # Identify checked transects
         self.checked_transect_idx = self.checked_transects(self)
@@ -654,43 +1254,48 @@ class Measurement(object):
         compass_cal_folder = os.path.join(pathname, 'CompassCal')
         time_stamp = None
         if os.path.isdir(compass_cal_folder):
-            for file in os.listdir(compass_cal_folder):
-                valid_file = False
-                # G3 compasses
-                if file.endswith('.ccal'):
-                    time_stamp = file.split('_')
-                    time_stamp = time_stamp[0] + '_' + time_stamp[1]
-                    valid_file = True
-
-                # G2 compasses
-                elif file.endswith('.txt'):
-                    prefix, _ = os.path.splitext(file)
-                    time_stamp = prefix.split('l')[1]
-                    valid_file = True
-
-            # for file in compass_cal_files:
-                if valid_file:
-                    with open(os.path.join(compass_cal_folder, file)) as f:
-                        cal_data = f.read()
-                        cal = PreMeasurement()
-                        cal.populate_data(time_stamp, cal_data, 'SCC')
-                        self.compass_cal.append(cal)
+            with os.scandir(compass_cal_folder) as entries:
+                for entry in entries:
+                    file = entry.name
+                    valid_file = False
+                    # G3 compasses
+                    if file.endswith('.ccal'):
+                        time_stamp = file.split('_')
+                        time_stamp = time_stamp[0] + '_' + time_stamp[1]
+                        valid_file = True
+
+                    # G2 compasses
+                    elif file.endswith('.txt'):
+                        prefix, _ = os.path.splitext(file)
+                        time_stamp = prefix.split('l')[1]
+                        valid_file = True
+
+                    if valid_file:
+                        # Read as binary and decode latin-1 to bypass the
+                        # text-IO newline and locale handling
+                        with open(entry.path, 'rb') as f:
+                            cal_data = f.read().decode('latin-1')
+                            cal = PreMeasurement()
+                            cal.populate_data(time_stamp, cal_data, 'SCC')
+                            self.compass_cal.append(cal)
 
         # System Test
         system_test_folder = os.path.join(pathname, 'SystemTest')
         if os.path.isdir(system_test_folder):
-            for file in os.listdir(system_test_folder):
-                # Find system test files.
-                if file.startswith('SystemTest'):
-                    with open(os.path.join(system_test_folder, file)) as f:
-                        test_data = f.read()
-                        test_data = test_data.replace('\x00', '')
-                    time_stamp = file[10:24]
-                    sys_test = PreMeasurement()
-                    sys_test.populate_data(time_stamp=time_stamp,
-                                           data_in=test_data,
-                                           data_type='SST')
-                    self.system_tst.append(sys_test)
+            with os.scandir(system_test_folder) as entries:
+                for entry in entries:
+                    file = entry.name
+                    # Find system test files.
+                    if file.startswith('SystemTest'):
+                        with open(entry.path, 'rb') as f:
+                            test_data = f.read().decode('latin-1')
+                            test_data = test_data.replace('\x00', '')
+                        time_stamp = file[10:24]
+                        sys_test = PreMeasurement()
+                        sys_test.populate_data(time_stamp=time_stamp,
+                                               data_in=test_data,
+                                               data_type='SST')
+                        self.system_tst.append(sys_test)
 
         # Moving-bed tests
         self.sontek_moving_bed_tests(pathname)
@@ -706,21 +1311,18 @@ class Measurement(object):
         pathname: str
             Path to discharge transect files.
         """
-        for file in os.listdir(pathname):
-            # Find moving-bed test files.
-            if file.endswith('.mat'):
-                # Process Loop test
-                if file.lower().startswith('loop'):
-                    self.mb_tests.append(MovingBedTests())
-                    self.mb_tests[-1].populate_data(source='SonTek',
-                                                    file=os.path.join(pathname, file),
-                                                    test_type='Loop')
-                # Process Stationary test
-                elif file.lower().startswith('smba'):
+        with os.scandir(pathname) as entries:
+            for entry in entries:
+                file = entry.name
+                # Find moving-bed test files.
+                if not file.endswith('.mat'):
+                    continue
+                test_type = _MB_TEST_PREFIX_MAP.get(file[:4].lower())
+                if test_type is not None:
                     self.mb_tests.append(MovingBedTests())
                     self.mb_tests[-1].populate_data(source='SonTek',
-                                                    file=os.path.join(pathname, file),
-                                                    test_type='Stationary')
+                                                    file=entry.path,
+                                                    test_type=test_type)
 
     def load_qrev_mat(self, mat_data):
         """Loads and coordinates the mapping of existing QRev Matlab files
@@ -771,19 +1373,17 @@ class Measurement(object):
         self.initial_settings = vars(meas_struct.initialSettings)
 
         # Update initial settings to agree with Python definitions
-        nav_dict = {'btVel': 'bt_vel', 'ggaVel': 'gga_vel', 'vtgVel': 'vtg_vel',
-                    'bt_vel': 'bt_vel', 'gga_vel': 'gga_vel', 'vtg_vel': 'vtg_vel'}
-        self.initial_settings['NavRef'] = nav_dict[self.initial_settings['NavRef']]
+        self.initial_settings['NavRef'] = \
+            _NAVREF_MAP.get(self.initial_settings['NavRef'], self.initial_settings['NavRef'])
 
-        on_off_dict = {'Off': False, 'On': True, 0: False, 1: True}
-        self.initial_settings['WTwtDepthFilter'] = on_off_dict[self.initial_settings['WTwtDepthFilter']]
+        self.initial_settings['WTwtDepthFilter'] = \
+            _WTDEPTH_MAP.get(self.initial_settings['WTwtDepthFilter'], self.initial_settings['WTwtDepthFilter'])
 
         if type(self.initial_settings['WTsnrFilter']) is np.ndarray:
             self.initial_settings['WTsnrFilter'] = 'Off'
 
-        nav_dict = {'btDepths': 'bt_depths', 'vbDepths': 'vb_depths', 'dsDepths': 'ds_depths',
-                    'bt_depths': 'bt_depths', 'vb_depths': 'vb_depths', 'ds_depths': 'ds_depths'}
-        self.initial_settings['depthReference'] = nav_dict[self.initial_settings['depthReference']]
+        self.initial_settings['depthReference'] = \
+            _DEPTHREF_MAP.get(self.initial_settings['depthReference'], self.initial_settings['depthReference'])
 
         self.ext_temp_chk = {'user': meas_struct.extTempChk.user,
                              'units': meas_struct.extTempChk.units,
@@ -799,22 +1399,8 @@ class Measurement(object):
         else:
             self.ext_temp_chk['adcp_orig'] = meas_struct.extTempChk.adcp
 
-        if type(self.ext_temp_chk['user']) is str:
-            self.ext_temp_chk['user'] = np.nan
-        if type(self.ext_temp_chk['adcp']) is str:
-            self.ext_temp_chk['adcp'] = np.nan
-        if type(self.ext_temp_chk['user']) is np.ndarray:
-            self.ext_temp_chk['user'] = np.nan
-        if type(self.ext_temp_chk['adcp']) is np.ndarray:
-            self.ext_temp_chk['adcp'] = np.nan
-        if type(self.ext_temp_chk['user_orig']) is str:
-            self.ext_temp_chk['user_orig'] = np.nan
-        if type(self.ext_temp_chk['adcp_orig']) is str:
-            self.ext_temp_chk['adcp_orig'] = np.nan
-        if type(self.ext_temp_chk['user_orig']) is np.ndarray:
-            self.ext_temp_chk['user_orig'] = np.nan
-        if type(self.ext_temp_chk['adcp_orig']) is np.ndarray:
-            self.ext_temp_chk['adcp_orig'] = np.nan
+        for key in ('user', 'adcp', 'user_orig', 'adcp_orig'):
+            self.ext_temp_chk[key] = self._coerce_temp(self.ext_temp_chk[key])
 
         self.system_tst = PreMeasurement.sys_test_qrev_mat_in(meas_struct)
 
@@ -837,6 +1423,16 @@ class Measurement(object):
             self.compass_eval = []
 
         self.transects = TransectData.qrev_mat_in(meas_struct)
+
+        # Arrays from sio.loadmat can be Fortran ordered; convert to C order
+        # once so the filter and interpolation kernels get unit-stride input
+        for transect in self.transects:
+            self._ensure_contiguous(transect.w_vel)
+            for name in ('bt_vel', 'gga_vel', 'vtg_vel'):
+                self._ensure_contiguous(getattr(transect.boat_vel, name))
+            for name in ('bt_depths', 'vb_depths', 'ds_depths'):
+                self._ensure_contiguous(getattr(transect.depths, name))
+
         self.mb_tests = MovingBedTests.qrev_mat_in(meas_struct)
         self.extrap_fit = ComputeExtrap()
         self.extrap_fit.populate_from_qrev_mat(meas_struct)
@@ -862,6 +1458,41 @@ class Measurement(object):
         self.uncertainty.populate_from_qrev_mat(meas_struct)
         self.qa = QAData(self, mat_struct=meas_struct, compute=False)
 
+    @staticmethod
+    def _ensure_contiguous(data_object):
+        """Converts ndarray attributes of an object to C order in place.
+
+        Parameters
+        ----------
+        data_object:
+            Object whose ndarray attributes should be C-contiguous. None is
+            allowed and ignored.
+        """
+
+        if data_object is None:
+            return
+        for name, value in vars(data_object).items():
+            if isinstance(value, np.ndarray) and not isinstance(value, np.ma.MaskedArray) \
+                    and not value.flags['C_CONTIGUOUS']:
+                setattr(data_object, name, np.ascontiguousarray(value))
+
+    @staticmethod
+    def _coerce_temp(value):
+        """Coerces non-numeric temperature entries from Matlab files to nan.
+
+        Parameters
+        ----------
+        value:
+            Temperature value read from the Matlab file.
+
+        Returns
+        -------
+        value: float
+            Original value or nan if the value was not numeric.
+        """
+
+        return np.nan if isinstance(value, (str, np.ndarray)) else value
+
     @staticmethod
     def set_num_beam_wt_threshold_trdi(mmt_transect):
         """Get number of beams to use in processing for WT from mmt file
@@ -992,6 +1623,23 @@ class Measurement(object):
         # Reapply settings to newly adjusted data
         self.apply_settings(s)
 
+    def _heading_source_selected(self, source):
+        """Determines if any transect uses the specified heading source.
+
+        Parameters
+        ----------
+        source: str
+            Heading source (internal or external)
+
+        Returns
+        -------
+        bool
+            True if any transect has the source selected
+        """
+
+        return any(transect.sensors.heading_deg.selected == source
+                   for transect in self.transects)
+
     def change_magvar(self, magvar, transect_idx=None):
         """Coordinates changing the magnetic variation.
 
@@ -1006,16 +1654,8 @@ class Measurement(object):
         # Get current settings
         s = self.current_settings()
 
-        # Initialize variables
-        n_transects = len(self.transects)
-        recompute = False
-        n = 0
-
         # If the internal compass is used the recompute is necessary
-        while n < n_transects and recompute == False:
-            if self.transects[n].sensors.heading_deg.selected == 'internal':
-                recompute = True
-            n += 1
+        recompute = self._heading_source_selected('internal')
 
         # Apply change
         if transect_idx is None:
@@ -1053,16 +1693,8 @@ class Measurement(object):
         # Get current settings
         s = self.current_settings()
 
-        # Initialize variables
-        n_transects = len(self.transects)
-        recompute = False
-        n = 0
-
         # If external compass is used then a recompute is necessary
-        while n < n_transects and recompute == False:
-            if self.transects[n].sensors.heading_deg.selected == 'external':
-                recompute = True
-            n += 1
+        recompute = self._heading_source_selected('external')
 
         # Apply change
         if transect_idx is None:
@@ -1172,51 +1804,89 @@ class Measurement(object):
         Parameters
         ----------
         settings: dict
-            Dictionary of reference, filter, and interpolation settings
+            Dictionary of reference, filter, and interpolation settings. The
+            dictionary form is the contract with the GUI and persistence
+            layers, which build and modify settings by key, so it is kept
+            rather than converted to a fixed-attribute settings object. The
+            per-key lookups are hoisted out of the per-transect work, so the
+            dictionary is only read once per key per call.
         force_abba: bool
             Allows the above, below, before, after interpolation to be applied even when the data use another approach.
         """
 
-        for transect in self.transects:
+        # The applied settings will change the data the settings and the
+        # extrapolation sensitivity are built from, so mark the cached
+        # settings and sensitivity stale
+        self._settings_cache = None
+        self._transect_data_rev += 1
+
+        # The settings do not depend on the transect, so the lookups and the
+        # kwargs for the various filters are done once before the loop
+        proc_method = settings.get('Processing')
+        if proc_method is not None:
+            self.processing = proc_method
+
+        nav_ref = settings['NavRef']
+        comp_tracks = settings['CompTracks']
+
+        # Set BT filters
+        bt_kwargs = _filter_kwargs(settings, _BT_FILTER_SPEC)
+        bt_interpolation = settings['BTInterpolation']
+
+        # Set GPS filters, only if the measurement has GPS data
+        gga_kwargs = None
+        vtg_kwargs = None
+        gps_interpolation = None
+        if any(transect.gps is not None for transect in self.transects):
+            gga_kwargs = _filter_kwargs(settings, _GGA_FILTER_SPEC)
+            vtg_kwargs = _filter_kwargs(settings, _VTG_FILTER_SPEC)
+            gps_interpolation = settings['GPSInterpolation']
+
+        # Depth settings
+        depth_kwargs = {'filter_method': settings['depthFilterType'],
+                        'interpolation_method': settings['depthInterpolation'],
+                        'composite_setting': settings['depthComposite'],
+                        'avg_method': settings['depthAvgMethod'],
+                        'valid_method': settings['depthValidMethod']}
+        depth_reference = settings['depthReference']
+
+        # Set WT filters
+        wt_kwargs = _filter_kwargs(settings, _WT_FILTER_SPEC)
+
+        # Data loaded from old QRev.mat files will be set to use this new interpolation method. When reprocessing
+        # any data the interpolation method should be 'abba'
+        if force_abba:
+            settings['WTEnsInterpolation'] = 'abba'
+            settings['WTCellInterpolation'] = 'abba'
+
+        # Edge methods
+        edge_rec_edge_method = settings['edgeRecEdgeMethod']
+        edge_vel_method = settings['edgeVelMethod']
+
+        # MovingBedTests.auto_use_2_correct mutates shared state, so the
+        # moving-bed test update triggered by a navigation reference change
+        # is applied once here rather than inside the parallel section
+        if len(self.mb_tests) > 0 and any(
+                transect.boat_vel.selected != nav_ref for transect in self.transects):
+            self.mb_tests = MovingBedTests.auto_use_2_correct(
+                moving_bed_tests=self.mb_tests,
+                boat_ref=nav_ref)
+
+        def apply_per_transect(transect):
+            """Applies the settings to a single transect."""
 
             # Moving-boat ensembles
-            if 'Processing' in settings.keys():
-                transect.change_q_ensembles(proc_method=settings['Processing'])
-                self.processing = settings['Processing']
+            if proc_method is not None:
+                transect.change_q_ensembles(proc_method=proc_method)
 
             # Navigation reference
-            if transect.boat_vel.selected != settings['NavRef']:
-                transect.change_nav_reference(update=False, new_nav_ref=settings['NavRef'])
-                if len(self.mb_tests) > 0:
-                    self.mb_tests = MovingBedTests.auto_use_2_correct(
-                        moving_bed_tests=self.mb_tests,
-                        boat_ref=settings['NavRef'])
+            if transect.boat_vel.selected != nav_ref:
+                transect.change_nav_reference(update=False, new_nav_ref=nav_ref)
 
             # Changing the nav reference applies the current setting for
             # Composite tracks, check to see if a change is needed
-            if transect.boat_vel.composite != settings['CompTracks']:
-                transect.composite_tracks(update=False, setting=settings['CompTracks'])
-
-            # Set difference velocity BT filter
-            bt_kwargs = {}
-            if settings['BTdFilter'] == 'Manual':
-                bt_kwargs['difference'] = settings['BTdFilter']
-                bt_kwargs['difference_threshold'] = settings['BTdFilterThreshold']
-            else:
-                bt_kwargs['difference'] = settings['BTdFilter']
-
-            # Set vertical velocity BT filter
-            if settings['BTwFilter'] == 'Manual':
-                bt_kwargs['vertical'] = settings['BTwFilter']
-                bt_kwargs['vertical_threshold'] = settings['BTwFilterThreshold']
-            else:
-                bt_kwargs['vertical'] = settings['BTwFilter']
-
-            # Apply beam filter
-                bt_kwargs['beam'] = settings['BTbeamFilter']
-
-            # Apply smooth filter
-                bt_kwargs['other'] = settings['BTsmoothFilter']
+            if transect.boat_vel.composite != comp_tracks:
+                transect.composite_tracks(update=False, setting=comp_tracks)
 
             # Apply BT settings
             transect.boat_filters(update=False, **bt_kwargs)
@@ -1224,94 +1894,45 @@ class Measurement(object):
             # BT Interpolation
             transect.boat_interpolations(update=False,
                                          target='BT',
-                                         method=settings['BTInterpolation'])
+                                         method=bt_interpolation)
 
             # GPS filter settings
             if transect.gps is not None:
-                gga_kwargs = {}
                 if transect.boat_vel.gga_vel is not None:
-                    # GGA
-                    gga_kwargs['differential'] = settings['ggaDiffQualFilter']
-                    if settings['ggaAltitudeFilter'] == 'Manual':
-                        gga_kwargs['altitude'] = settings['ggaAltitudeFilter']
-                        gga_kwargs['altitude_threshold'] = settings['ggaAltitudeFilterChange']
-                    else:
-                        gga_kwargs['altitude'] = settings['ggaAltitudeFilter']
-
-                    # Set GGA HDOP Filter
-                    if settings['GPSHDOPFilter'] == 'Manual':
-                        gga_kwargs['hdop'] = settings['GPSHDOPFilter']
-                        gga_kwargs['hdop_max_threshold'] = settings['GPSHDOPFilterMax']
-                        gga_kwargs['hdop_change_threshold'] = settings['GPSHDOPFilterChange']
-                    else:
-                        gga_kwargs['hdop'] = settings['GPSHDOPFilter']
-
-                    gga_kwargs['other'] = settings['GPSSmoothFilter']
                     # Apply GGA filters
                     transect.gps_filters(update=False, **gga_kwargs)
 
                 if transect.boat_vel.vtg_vel is not None:
-                    vtg_kwargs = {}
-                    if settings['GPSHDOPFilter'] == 'Manual':
-                        vtg_kwargs['hdop'] = settings['GPSHDOPFilter']
-                        vtg_kwargs['hdop_max_threshold'] = settings['GPSHDOPFilterMax']
-                        vtg_kwargs['hdop_change_threshold'] = settings['GPSHDOPFilterChange']
-                        vtg_kwargs['other'] = settings['GPSSmoothFilter']
-                    else:
-                        vtg_kwargs['hdop'] = settings['GPSHDOPFilter']
-                        vtg_kwargs['other'] = settings['GPSSmoothFilter']
-
                     # Apply VTG filters
                     transect.gps_filters(update=False, **vtg_kwargs)
 
                 transect.boat_interpolations(update=False,
                                              target='GPS',
-                                             method=settings['GPSInterpolation'])
+                                             method=gps_interpolation)
 
             # Set depth reference
-            transect.set_depth_reference(update=False, setting=settings['depthReference'])
-
-            transect.process_depths(update=True,
-                                    filter_method=settings['depthFilterType'],
-                                    interpolation_method=settings['depthInterpolation'],
-                                    composite_setting=settings['depthComposite'],
-                                    avg_method=settings['depthAvgMethod'],
-                                    valid_method=settings['depthValidMethod'])
-
-            # Set WT difference velocity filter
-            wt_kwargs = {}
-            if settings['WTdFilter'] == 'Manual':
-                wt_kwargs['difference'] = settings['WTdFilter']
-                wt_kwargs['difference_threshold'] = settings['WTdFilterThreshold']
-            else:
-                wt_kwargs['difference'] = settings['WTdFilter']
+            transect.set_depth_reference(update=False, setting=depth_reference)
 
-            # Set WT vertical velocity filter
-            if settings['WTwFilter'] == 'Manual':
-                wt_kwargs['vertical'] = settings['WTwFilter']
-                wt_kwargs['vertical_threshold'] = settings['WTwFilterThreshold']
-            else:
-                wt_kwargs['vertical'] = settings['WTwFilter']
-
-            wt_kwargs['beam'] = settings['WTbeamFilter']
-            wt_kwargs['other'] = settings['WTsmoothFilter']
-            wt_kwargs['snr'] = settings['WTsnrFilter']
-            wt_kwargs['wt_depth'] = settings['WTwtDepthFilter']
-            wt_kwargs['excluded'] = settings['WTExcludedDistance']
+            transect.process_depths(update=True, **depth_kwargs)
 
             # Data loaded from old QRev.mat files will be set to use this new interpolation method. When reprocessing
             # any data the interpolation method should be 'abba'
             if force_abba:
                 transect.w_vel.interpolate_cells = 'abba'
                 transect.w_vel.interpolate_ens = 'abba'
-                settings['WTEnsInterpolation'] = 'abba'
-                settings['WTCellInterpolation'] = 'abba'
 
             transect.w_vel.apply_filter(transect=transect, **wt_kwargs)
 
             # Edge methods
-            transect.edges.rec_edge_method = settings['edgeRecEdgeMethod']
-            transect.edges.vel_method = settings['edgeVelMethod']
+            transect.edges.rec_edge_method = edge_rec_edge_method
+            transect.edges.vel_method = edge_vel_method
+
+        # Transects are independent of each other until the extrapolation
+        # fit, so the NumPy heavy filtering and interpolation can run in
+        # parallel threads.
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, max(1, len(self.transects)))) as executor:
+            list(executor.map(apply_per_transect, self.transects))
 
         # Recompute extrapolations
         # NOTE: Extrapolations should be determined prior to WT
@@ -1331,7 +1952,7 @@ class Measurement(object):
             elif self.extrap_fit.fit_method == 'Automatic':
                 self.change_extrapolation(self.extrap_fit.fit_method, compute_q=False)
             else:
-                if 'extrapTop' not in settings.keys():
+                if 'extrapTop' not in settings:
                     settings['extrapTop'] = self.extrap_fit.sel_fit[-1].top_method
                     settings['extrapBot'] = self.extrap_fit.sel_fit[-1].bot_method
                     settings['extrapExp'] = self.extrap_fit.sel_fit[-1].exponent
@@ -1356,7 +1977,7 @@ class Measurement(object):
         elif self.extrap_fit.fit_method == 'Automatic':
             self.change_extrapolation(self.extrap_fit.fit_method, compute_q=False)
         else:
-            if 'extrapTop' not in settings.keys():
+            if 'extrapTop' not in settings:
                 settings['extrapTop'] = self.extrap_fit.sel_fit[-1].top_method
                 settings['extrapBot'] = self.extrap_fit.sel_fit[-1].bot_method
                 settings['extrapExp'] = self.extrap_fit.sel_fit[-1].exponent
@@ -1367,61 +1988,102 @@ class Measurement(object):
                                   exp=settings['extrapExp'],
                                   compute_q=False)
 
-        self.extrap_fit.q_sensitivity = ExtrapQSensitivity()
-        self.extrap_fit.q_sensitivity.populate_data(transects=self.transects,
-                                                    extrap_fits=self.extrap_fit.sel_fit)
-
-        self.compute_discharge()
-
-        self.uncertainty = Uncertainty()
-        self.uncertainty.compute_uncertainty(self)
-        self.qa = QAData(self)
+        self._recompute_q_sensitivity_and_discharge()
         if self.run_oursin:
             self.oursin = Oursin()
             self.oursin.compute_oursin(self)
 
+    def _update_q_sensitivity(self):
+        """Updates the extrapolation sensitivity analysis.
+
+        The sensitivity is a pure function of the transect data and the
+        selected fit, so it is only recomputed when the fit parameters or
+        the transect data revision have changed since the last computation.
+        """
+
+        sel_fit = self.extrap_fit.sel_fit[-1]
+        signature = (self._transect_data_rev,
+                     self.extrap_fit.fit_method,
+                     sel_fit.top_method,
+                     sel_fit.bot_method,
+                     sel_fit.exponent)
+        if signature != self._qsens_signature:
+            q_sensitivity = ExtrapQSensitivity()
+            q_sensitivity.populate_data(transects=self.transects,
+                                        extrap_fits=self.extrap_fit.sel_fit)
+            self._qsens_cached = q_sensitivity
+            self._qsens_signature = signature
+        self.extrap_fit.q_sensitivity = self._qsens_cached
+
+    def _recompute_q_sensitivity_and_discharge(self):
+        """Recomputes the extrapolation sensitivity and the discharges.
+
+        Shared tail of apply_settings and selected_transects_changed. The
+        cached uncertainty and QA values are dropped so they are rebuilt
+        from the new discharges on the next access.
+        """
+
+        self._update_q_sensitivity()
+
+        self.compute_discharge()
+
+        self.__dict__.pop('uncertainty', None)
+        self.__dict__.pop('qa', None)
+
     def current_settings(self):
         """Saves the current settings for a measurement. Since all settings
         in QRev are consistent among all transects in a measurement only the
         settings from the first transect are saved
+
+        The settings are cached so repeated calls between changes, as occur
+        with GUI interactions, return a copy of the cached dictionary rather
+        than rebuilding it from the transect data. Methods changing the data
+        the settings are built from invalidate the cache.
         """
 
-        settings = {}
+        # Return a copy of the cached settings if still valid. The extrap
+        # entries are always rebuilt from the current fit because the GUI
+        # changes the fit through extrap_fit directly, which does not
+        # invalidate the cache
+        if self._settings_cache is not None:
+            settings = dict(self._settings_cache)
+            if self.extrap_fit is not None:
+                sel_fit = self.extrap_fit.sel_fit[-1]
+                settings.update({'extrapTop': sel_fit.top_method,
+                                 'extrapBot': sel_fit.bot_method,
+                                 'extrapExp': sel_fit.exponent})
+            return settings
 
         if len(self.checked_transect_idx) > 0:
             ref_transect = self.checked_transect_idx[0]
         else:
             ref_transect = 0
         transect = self.transects[ref_transect]
-        
-        # Navigation reference
-        settings['NavRef'] = transect.boat_vel.selected
-        
-        # Composite tracks
-        settings['CompTracks'] = transect.boat_vel.composite
-        
-        # Water track settings
-        settings['WTbeamFilter'] = transect.w_vel.beam_filter
-        settings['WTdFilter'] = transect.w_vel.d_filter
-        settings['WTdFilterThreshold'] = transect.w_vel.d_filter_threshold
-        settings['WTwFilter'] = transect.w_vel.w_filter
-        settings['WTwFilterThreshold'] = transect.w_vel.w_filter_threshold
-        settings['WTsmoothFilter'] = transect.w_vel.smooth_filter
-        settings['WTsnrFilter'] = transect.w_vel.snr_filter
-        settings['WTwtDepthFilter'] = transect.w_vel.wt_depth_filter
-        settings['WTEnsInterpolation'] = transect.w_vel.interpolate_ens
-        settings['WTCellInterpolation'] = transect.w_vel.interpolate_cells
-        settings['WTExcludedDistance'] = transect.w_vel.excluded_dist_m
-        
-        # Bottom track settings
-        settings['BTbeamFilter'] = transect.boat_vel.bt_vel.beam_filter
-        settings['BTdFilter'] = transect.boat_vel.bt_vel.d_filter
-        settings['BTdFilterThreshold'] = transect.boat_vel.bt_vel.d_filter_threshold
-        settings['BTwFilter'] = transect.boat_vel.bt_vel.w_filter
-        settings['BTwFilterThreshold'] = transect.boat_vel.bt_vel.w_filter_threshold
-        settings['BTsmoothFilter'] = transect.boat_vel.bt_vel.smooth_filter
-        settings['BTInterpolation'] = transect.boat_vel.bt_vel.interpolate
-        
+
+        # Navigation, composite track, water track, and bottom track
+        # settings built in a single literal so the dict is sized once
+        settings = {
+            'NavRef': transect.boat_vel.selected,
+            'CompTracks': transect.boat_vel.composite,
+            'WTbeamFilter': transect.w_vel.beam_filter,
+            'WTdFilter': transect.w_vel.d_filter,
+            'WTdFilterThreshold': transect.w_vel.d_filter_threshold,
+            'WTwFilter': transect.w_vel.w_filter,
+            'WTwFilterThreshold': transect.w_vel.w_filter_threshold,
+            'WTsmoothFilter': transect.w_vel.smooth_filter,
+            'WTsnrFilter': transect.w_vel.snr_filter,
+            'WTwtDepthFilter': transect.w_vel.wt_depth_filter,
+            'WTEnsInterpolation': transect.w_vel.interpolate_ens,
+            'WTCellInterpolation': transect.w_vel.interpolate_cells,
+            'WTExcludedDistance': transect.w_vel.excluded_dist_m,
+            'BTbeamFilter': transect.boat_vel.bt_vel.beam_filter,
+            'BTdFilter': transect.boat_vel.bt_vel.d_filter,
+            'BTdFilterThreshold': transect.boat_vel.bt_vel.d_filter_threshold,
+            'BTwFilter': transect.boat_vel.bt_vel.w_filter,
+            'BTwFilterThreshold': transect.boat_vel.bt_vel.w_filter_threshold,
+            'BTsmoothFilter': transect.boat_vel.bt_vel.smooth_filter,
+            'BTInterpolation': transect.boat_vel.bt_vel.interpolate}
+
         # Gps Settings
         # if transect.gps is not None:
 
@@ -1434,29 +2096,28 @@ class Measurement(object):
 
         # GGA settings
         if gga_present:
-            settings['ggaDiffQualFilter'] = transect.boat_vel.gga_vel.gps_diff_qual_filter
-            settings['ggaAltitudeFilter'] = transect.boat_vel.gga_vel.gps_altitude_filter
-            settings['ggaAltitudeFilterChange'] = \
-                transect.boat_vel.gga_vel.gps_altitude_filter_change
-            settings['GPSHDOPFilter'] = transect.boat_vel.gga_vel.gps_HDOP_filter
-            settings['GPSHDOPFilterMax'] = transect.boat_vel.gga_vel.gps_HDOP_filter_max
-            settings['GPSHDOPFilterChange'] = transect.boat_vel.gga_vel.gps_HDOP_filter_change
-            settings['GPSSmoothFilter'] = transect.boat_vel.gga_vel.smooth_filter
-            settings['GPSInterpolation'] = transect.boat_vel.gga_vel.interpolate
+            gga_vel = transect.boat_vel.gga_vel
+            settings.update({
+                'ggaDiffQualFilter': gga_vel.gps_diff_qual_filter,
+                'ggaAltitudeFilter': gga_vel.gps_altitude_filter,
+                'ggaAltitudeFilterChange': gga_vel.gps_altitude_filter_change,
+                'GPSHDOPFilter': gga_vel.gps_HDOP_filter,
+                'GPSHDOPFilterMax': gga_vel.gps_HDOP_filter_max,
+                'GPSHDOPFilterChange': gga_vel.gps_HDOP_filter_change,
+                'GPSSmoothFilter': gga_vel.smooth_filter,
+                'GPSInterpolation': gga_vel.interpolate})
         else:
             settings['ggaDiffQualFilter'] = 1
             settings['ggaAltitudeFilter'] = 'Off'
             settings['ggaAltitudeFilterChange'] = []
 
             settings['ggaSmoothFilter'] = 'Off'
-            if 'GPSInterpolation' not in settings.keys():
-                settings['GPSInterpolation'] = 'None'
-            if 'GPSHDOPFilter' not in settings.keys():
+            settings.setdefault('GPSInterpolation', 'None')
+            if 'GPSHDOPFilter' not in settings:
                 settings['GPSHDOPFilter'] = 'Off'
                 settings['GPSHDOPFilterMax'] = []
                 settings['GPSHDOPFilterChange'] = []
-            if 'GPSSmoothFilter' not in settings.keys():
-                settings['GPSSmoothFilter'] = 'Off'
+            settings.setdefault('GPSSmoothFilter', 'Off')
 
         # VTG settings
         vtg_present = False
@@ -1467,136 +2128,117 @@ class Measurement(object):
                 break
 
         if vtg_present:
-            settings['GPSHDOPFilter'] = transect.boat_vel.vtg_vel.gps_HDOP_filter
-            settings['GPSHDOPFilterMax'] = transect.boat_vel.vtg_vel.gps_HDOP_filter_max
-            settings['GPSHDOPFilterChange'] = transect.boat_vel.vtg_vel.gps_HDOP_filter_change
-            settings['GPSSmoothFilter'] = transect.boat_vel.vtg_vel.smooth_filter
-            settings['GPSInterpolation'] = transect.boat_vel.vtg_vel.interpolate
-
-        # Depth Settings
-        settings['depthAvgMethod'] = transect.depths.bt_depths.avg_method
-        settings['depthValidMethod'] = transect.depths.bt_depths.valid_data_method
-        
+            vtg_vel = transect.boat_vel.vtg_vel
+            settings.update({
+                'GPSHDOPFilter': vtg_vel.gps_HDOP_filter,
+                'GPSHDOPFilterMax': vtg_vel.gps_HDOP_filter_max,
+                'GPSHDOPFilterChange': vtg_vel.gps_HDOP_filter_change,
+                'GPSSmoothFilter': vtg_vel.smooth_filter,
+                'GPSInterpolation': vtg_vel.interpolate})
+
         # Depth settings are always applied to all available depth sources.
-        # Only those saved in the bt_depths are used here but are applied to all sources
-        settings['depthFilterType'] = transect.depths.bt_depths.filter_type
-        settings['depthReference'] = transect.depths.selected
-        settings['depthComposite'] = transect.depths.composite
-        select = getattr(transect.depths, transect.depths.selected)
-        settings['depthInterpolation'] = select.interp_type
-        
+        # Only those saved in the bt_depths are used here but are applied to
+        # all sources
+        settings.update({
+            'depthAvgMethod': transect.depths.bt_depths.avg_method,
+            'depthValidMethod': transect.depths.bt_depths.valid_data_method,
+            'depthFilterType': transect.depths.bt_depths.filter_type,
+            'depthReference': transect.depths.selected,
+            'depthComposite': transect.depths.composite,
+            'depthInterpolation': transect.depths.active.interp_type})
+
         # Extrap Settings
         if self.extrap_fit is None:
-            settings['extrapTop'] = transect.extrap.top_method
-            settings['extrapBot'] = transect.extrap.bot_method
-            settings['extrapExp'] = transect.extrap.exponent
+            settings.update({'extrapTop': transect.extrap.top_method,
+                             'extrapBot': transect.extrap.bot_method,
+                             'extrapExp': transect.extrap.exponent})
         else:
-            settings['extrapTop'] = self.extrap_fit.sel_fit[-1].top_method
-            settings['extrapBot'] = self.extrap_fit.sel_fit[-1].bot_method
-            settings['extrapExp'] = self.extrap_fit.sel_fit[-1].exponent
-        
+            sel_fit = self.extrap_fit.sel_fit[-1]
+            settings.update({'extrapTop': sel_fit.top_method,
+                             'extrapBot': sel_fit.bot_method,
+                             'extrapExp': sel_fit.exponent})
+
         # Edge Settings
         settings['edgeVelMethod'] = transect.edges.vel_method
         settings['edgeRecEdgeMethod'] = transect.edges.rec_edge_method
-        
+
+        # Cache a copy so later mutation of the returned dict by the caller
+        # does not corrupt the cache
+        self._settings_cache = dict(settings)
+
         return settings
 
     def qrev_default_settings(self, check_user_excluded_dist=False):
         """QRev default and filter settings for a measurement.
-        """
 
-        settings = dict()
+        The defaults depend only on a small signature of the measurement
+        state (navigation reference, ADCP, excluded distance, and depth
+        sources), so the built dictionary is cached by that signature.
+        """
 
         if len(self.checked_transect_idx) > 0:
             ref_transect = self.checked_transect_idx[0]
         else:
             ref_transect = 0
-
-        # Navigation reference
-        settings['NavRef'] = self.transects[ref_transect].boat_vel.selected
-
-        # Composite tracks
-        settings['CompTracks'] = 'Off'
-
-        # Water track filter settings
-        settings['WTbeamFilter'] = -1
-        settings['WTdFilter'] = 'Auto'
-        settings['WTdFilterThreshold'] = np.nan
-        settings['WTwFilter'] = 'Auto'
-        settings['WTwFilterThreshold'] = np.nan
-        settings['WTsmoothFilter'] = 'Off'
-
-        if self.transects[ref_transect].adcp.manufacturer == 'TRDI':
-            settings['WTsnrFilter'] = 'Off'
-        else:
-            settings['WTsnrFilter'] = 'Auto'
+        adcp = self.transects[ref_transect].adcp
 
         if check_user_excluded_dist:
-            temp = [x.w_vel for x in self.transects]
-            excluded_dist = np.nanmin([x.excluded_dist_m for x in temp])
+            # A generator min avoids the intermediate lists and array that
+            # np.nanmin would build for a handful of scalars. It also beats
+            # np.fromiter + np.nanmin until measurements reach hundreds of
+            # transects, far beyond a typical measurement.
+            excluded_dist = min((transect.w_vel.excluded_dist_m
+                                 for transect in self.transects
+                                 if not math.isnan(transect.w_vel.excluded_dist_m)),
+                                default=np.nan)
         else:
             excluded_dist = 0
-        if excluded_dist < 0.158 and self.transects[ref_transect].adcp.model == 'M9':
-            settings['WTExcludedDistance'] = 0.16
-        elif excluded_dist < 0.248 and self.transects[ref_transect].adcp.model == 'RioPro':
-            settings['WTExcludedDistance'] = 0.25
-        else:
-            settings['WTExcludedDistance'] = excluded_dist
-
-        # Bottom track filter settings
-        settings['BTbeamFilter'] = -1
-        settings['BTdFilter'] = 'Auto'
-        settings['BTdFilterThreshold'] = np.nan
-        settings['BTwFilter'] = 'Auto'
-        settings['BTwFilterThreshold'] = np.nan
-        settings['BTsmoothFilter'] = 'Off'
-
-        # GGA Filter settings
-        settings['ggaDiffQualFilter'] = 2
-        settings['ggaAltitudeFilter'] = 'Auto'
-        settings['ggaAltitudeFilterChange'] = np.nan
 
-        # VTG filter settings
-        settings['vtgsmoothFilter'] = 'Off'
-
-        # GGA and VTG filter settings
-        settings['GPSHDOPFilter'] = 'Auto'
-        settings['GPSHDOPFilterMax'] = np.nan
-        settings['GPSHDOPFilterChange'] = np.nan
-        settings['GPSSmoothFilter'] = 'Off'
-
-        # Depth Averaging
-        settings['depthAvgMethod'] = 'IDW'
-        settings['depthValidMethod'] = 'QRev'
-
-        # Depth Reference
-
-        # Default to 4 beam depth average
-        settings['depthReference'] = 'bt_depths'
-        # Depth settings
-        settings['depthFilterType'] = 'Smooth'
-        settings['depthComposite'] = 'Off'
+        # Composite depths are on when any checked transect has another
+        # depth source available
+        depth_composite = 'Off'
         for transect in self.transects:
             if transect.checked:
 
                 if transect.depths.vb_depths is not None or transect.depths.ds_depths is not None:
-                    settings['depthComposite'] = 'On'
+                    depth_composite = 'On'
                     break
                 else:
-                    settings['depthComposite'] = 'Off'
+                    depth_composite = 'Off'
                     break
 
+        # Return a copy of the cached settings when the signature matches
+        signature = (self.transects[ref_transect].boat_vel.selected,
+                     adcp.manufacturer,
+                     adcp.model,
+                     excluded_dist,
+                     depth_composite)
+        cached = self._default_settings_cache.get(signature)
+        if cached is not None:
+            return dict(cached)
+
+        # Start from the static defaults built once at import
+        settings = dict(_QREV_DEFAULT_TEMPLATE)
+
+        # Navigation reference
+        settings['NavRef'] = self.transects[ref_transect].boat_vel.selected
+
+        settings['WTsnrFilter'] = _WT_SNR_FILTER_BY_MFR.get(adcp.manufacturer, 'Auto')
+
+        if excluded_dist < 0.158 and adcp.model == 'M9':
+            settings['WTExcludedDistance'] = 0.16
+        elif excluded_dist < 0.248 and adcp.model == 'RioPro':
+            settings['WTExcludedDistance'] = 0.25
+        else:
+            settings['WTExcludedDistance'] = excluded_dist
+
+        settings['depthComposite'] = depth_composite
+
         # Interpolation settings
         settings = self.qrev_default_interpolation_methods(settings)
 
-        # Edge settings
-        settings['edgeVelMethod'] = 'MeasMag'
-        settings['edgeRecEdgeMethod'] = 'Fixed'
-
-        # Extrapolation Settings
-        settings['extrapTop'] = 'Power'
-        settings['extrapBot'] = 'Power'
-        settings['extrapExp'] = 0.1667
+        # Cache a copy so later mutation by the caller does not corrupt it
+        self._default_settings_cache[signature] = dict(settings)
 
         return settings
 
@@ -1613,7 +2255,9 @@ class Measurement(object):
             Dictionary of all processing settings.
         """
 
-        settings = dict()
+        # Start from the static defaults built once at import
+        settings = dict(_NO_FILTER_TEMPLATE)
+
         if len(self.checked_transect_idx) > 0:
             ref_transect = self.checked_transect_idx[0]
         else:
@@ -1621,70 +2265,13 @@ class Measurement(object):
 
         settings['NavRef'] = self.transects[ref_transect].boatVel.selected
 
-        # Composite tracks
-        settings['CompTracks'] = 'Off'
-
-        # Water track filter settings
-        settings['WTbeamFilter'] = 3
-        settings['WTdFilter'] = 'Off'
-        settings['WTdFilterThreshold'] = np.nan
-        settings['WTwFilter'] = 'Off'
-        settings['WTwFilterThreshold'] = np.nan
-        settings['WTsmoothFilter'] = 'Off'
-        settings['WTsnrFilter'] = 'Off'
-
-        temp = [x.w_vel for x in self.transects]
-        excluded_dist = np.nanmin([x.excluded_dist_m for x in temp])
+        excluded_dist = min((transect.w_vel.excluded_dist_m
+                             for transect in self.transects
+                             if not math.isnan(transect.w_vel.excluded_dist_m)),
+                            default=np.nan)
 
         settings['WTExcludedDistance'] = excluded_dist
 
-        # Bottom track filter settings
-        settings['BTbeamFilter'] = 3
-        settings['BTdFilter'] = 'Off'
-        settings['BTdFilterThreshold'] = np.nan
-        settings['BTwFilter'] = 'Off'
-        settings['BTwFilterThreshold'] = np.nan
-        settings['BTsmoothFilter'] = 'Off'
-
-        # GGA filter settings
-        settings['ggaDiffQualFilter'] = 1
-        settings['ggaAltitudeFilter'] = 'Off'
-        settings['ggaAltitudeFilterChange'] = np.nan
-
-        # VTG filter settings
-        settings['vtgsmoothFilter'] = 'Off'
-
-        # GGA and VTG filter settings
-        settings['GPSHDOPFilter'] = 'Off'
-        settings['GPSHDOPFilterMax'] = np.nan
-        settings['GPSHDOPFilterChange'] = np.nan
-        settings['GPSSmoothFilter'] = 'Off'
-
-        # Depth Averaging
-        settings['depthAvgMethod'] = 'IDW'
-        settings['depthValidMethod'] = 'QRev'
-
-        # Depth Reference
-
-        # Default to 4 beam depth average
-        settings['depthReference'] = 'btDepths'
-        # Depth settings
-        settings['depthFilterType'] = 'None'
-        settings['depthComposite'] = 'Off'
-
-        # Interpolation settings
-        settings['BTInterpolation'] = 'None'
-        settings['WTEnsInterpolation'] = 'None'
-        settings['WTCellInterpolation'] = 'None'
-        settings['GPSInterpolation'] = 'None'
-        settings['depthInterpolation'] = 'None'
-        settings['WTwtDepthFilter'] = 'Off'
-
-        # Edge Settings
-        settings['edgeVelMethod'] = 'MeasMag'
-        # settings['edgeVelMethod'] = 'Profile'
-        settings['edgeRecEdgeMethod'] = 'Fixed'
-
         return settings
 
     def selected_transects_changed(self, selected_transects_idx):
@@ -1703,23 +2290,27 @@ class Measurement(object):
             else:
                 self.transects[n].checked = False
 
+        # Refresh the checked transect indices and invalidate the cached
+        # settings and sensitivity since the reference transect and the
+        # transects contributing to the sensitivity may have changed
+        self.checked_transect_idx = self.checked_transects(self)
+        self._settings_cache = None
+        self._transect_data_rev += 1
+
         # Changes in the transects selected may cause a change in extrapolation.
         self.extrap_fit = ComputeExtrap()
         self.extrap_fit.populate_data(transects=self.transects, compute_sensitivity=False)
         top = self.extrap_fit.sel_fit[-1].top_method
         bot = self.extrap_fit.sel_fit[-1].bot_method
         exp = self.extrap_fit.sel_fit[-1].exponent
-        self.change_extrapolation(self.extrap_fit.fit_method, top=top, bot=bot, exp=exp)
 
-        self.extrap_fit.q_sensitivity = ExtrapQSensitivity()
-        self.extrap_fit.q_sensitivity.populate_data(transects=self.transects,
-                                                    extrap_fits=self.extrap_fit.sel_fit)
+        # The sensitivity and discharge are computed by the shared recompute
+        # below, so they are not also computed here
+        self.change_extrapolation(self.extrap_fit.fit_method, top=top, bot=bot, exp=exp,
+                                  compute_q=False)
 
         # Update computations
-        self.compute_discharge()
-        self.uncertainty = Uncertainty()
-        self.uncertainty.compute_uncertainty(self)
-        self.qa = QAData(self)
+        self._recompute_q_sensitivity_and_discharge()
         self.oursin = Oursin()
         self.oursin.compute_oursin(self)
 
@@ -1727,11 +2318,20 @@ class Measurement(object):
         """Computes the discharge for all transects in the measurement.
         """
 
-        self.discharge = []
-        for transect in self.transects:
+        # Read once to avoid repeated attribute lookups in the workers. The
+        # moving-bed data are only read by QComp.
+        mb_tests = self.mb_tests
+
+        def compute_q(transect):
             q = QComp()
-            q.populate_data(data_in=transect, moving_bed_data=self.mb_tests)
-            self.discharge.append(q)
+            q.populate_data(data_in=transect, moving_bed_data=mb_tests)
+            return q
+
+        # The discharge computations are independent per transect, so run
+        # them in parallel threads. executor.map preserves transect order.
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, max(1, len(self.transects)))) as executor:
+            self.discharge = list(executor.map(compute_q, self.transects))
 
     @staticmethod
     def compute_edi(meas, selected_idx, percents):
@@ -1777,9 +2377,9 @@ class Measurement(object):
         for percent in percents:
             q_target.append(q_cum[-1] * percent / 100)
             if q_target[-1] > 0:
-                ensembles.append(np.where(q_cum > q_target[-1])[0][0])
+                ensembles.append(np.flatnonzero(q_cum > q_target[-1])[0])
             if q_target[-1] < 0:
-                ensembles.append(np.where(q_cum < q_target[-1])[0][0])
+                ensembles.append(np.flatnonzero(q_cum < q_target[-1])[0])
 
         # Compute distance from start bank
         boat_vel_selected = getattr(transect.boat_vel, transect.boat_vel.selected)
@@ -1869,6 +2469,9 @@ class Measurement(object):
             Specifies if the discharge should be computed
         """
 
+        # The extrapolation settings are about to change
+        self._settings_cache = None
+
         if top is None:
             top = self.extrap_fit.sel_fit[-1].top_method
         if bot is None:
@@ -1898,9 +2501,7 @@ class Measurement(object):
                                                 exp=self.extrap_fit.sel_fit[-1].exponent)
 
         if compute_q:
-            self.extrap_fit.q_sensitivity = ExtrapQSensitivity()
-            self.extrap_fit.q_sensitivity.populate_data(transects=self.transects,
-                                                        extrap_fits=self.extrap_fit.sel_fit)
+            self._update_q_sensitivity()
 
             self.compute_discharge()
 
@@ -1910,9 +2511,8 @@ class Measurement(object):
         """
 
         duration = 0
-        for transect in self.transects:
-            if transect.checked:
-                duration += transect.date_time.transect_duration_sec
+        for idx in self.checked_transect_idx:
+            duration += self.transects[idx].date_time.transect_duration_sec
         return duration
 
     @staticmethod
@@ -1920,38 +2520,21 @@ class Measurement(object):
         """Computes the mean discharge for the measurement.
         """
 
-        # Initialize lists
-        total_q = []
-        uncorrected_q = []
-        top_q = []
-        bot_q = []
-        mid_q = []
-        left_q = []
-        right_q = []
-        int_cells_q = []
-        int_ensembles_q = []
-
-        for n, transect in enumerate(self.transects):
-            if transect.checked:
-                total_q.append(self.discharge[n].total)
-                uncorrected_q.append(self.discharge[n].total_uncorrected)
-                top_q.append(self.discharge[n].top)
-                mid_q.append(self.discharge[n].middle)
-                bot_q.append(self.discharge[n].bottom)
-                left_q.append(self.discharge[n].left)
-                right_q.append(self.discharge[n].right)
-                int_cells_q.append(self.discharge[n].int_cells)
-                int_ensembles_q.append(self.discharge[n].int_ens)
-
-        discharge = {'total_mean': np.mean(total_q),
-                     'uncorrected_mean': np.mean(uncorrected_q),
-                     'top_mean': np.mean(top_q),
-                     'mid_mean': np.mean(mid_q),
-                     'bot_mean': np.mean(bot_q),
-                     'left_mean': np.mean(left_q),
-                     'right_mean': np.mean(right_q),
-                     'int_cells_mean': np.mean(int_cells_q),
-                     'int_ensembles_mean': np.mean(int_ensembles_q)}
+        # Fill a preallocated array with one row per checked transect so the
+        # means reduce to a single vectorized computation
+        checked_idx = self.checked_transect_idx
+        discharges = np.empty((len(checked_idx), 9))
+        for row, n in enumerate(checked_idx):
+            q = self.discharge[n]
+            discharges[row] = (q.total, q.total_uncorrected, q.top, q.middle,
+                               q.bottom, q.left, q.right, q.int_cells,
+                               q.int_ens)
+
+        means = discharges.mean(axis=0)
+        discharge = dict(zip(('total_mean', 'uncorrected_mean', 'top_mean',
+                              'mid_mean', 'bot_mean', 'left_mean',
+                              'right_mean', 'int_cells_mean',
+                              'int_ensembles_mean'), means))
 
         return discharge
 
@@ -1989,21 +2572,20 @@ class Measurement(object):
         """
 
         # Initialize variables
-        checked_idx = np.array([], dtype=int)
+        checked_idx = []
         n_transects = len(self.transects)
-        trans_prop = {'width': np.array([np.nan] * (n_transects + 1)),
-                      'width_cov': np.array([np.nan] * (n_transects + 1)),
-                      'area': np.array([np.nan] * (n_transects + 1)),
-                      'area_cov': np.array([np.nan] * (n_transects + 1)),
-                      'avg_boat_speed': np.array([np.nan] * (n_transects + 1)),
-                      'avg_boat_course': np.array([np.nan] * n_transects),
-                      'avg_water_speed': np.array([np.nan] * (n_transects + 1)),
-                      'avg_water_dir': np.array([np.nan] * (n_transects + 1)),
-                      'avg_depth': np.array([np.nan] * (n_transects + 1)),
-                      'max_depth': np.array([np.nan] * (n_transects + 1)),
-                      'max_water_speed': np.array([np.nan] * (n_transects + 1))}
-
-        # Process each transect
+        trans_prop = {key: np.full(n_transects + 1, np.nan)
+                      for key in ('width', 'width_cov', 'area', 'area_cov',
+                                  'avg_boat_speed', 'avg_water_speed',
+                                  'avg_water_dir', 'avg_depth', 'max_depth',
+                                  'max_water_speed')}
+        # The boat course has no measurement-level average
+        trans_prop['avg_boat_course'] = np.full(n_transects, np.nan)
+
+        # Process each transect. The transects have differing ensemble
+        # counts, so the velocity arrays are not stacked across transects;
+        # the per-transect reductions run at the C level on each transect's
+        # own contiguous arrays.
         for n, transect in enumerate(self.transects):
 
             # Compute boat track properties
@@ -2011,72 +2593,55 @@ class Measurement(object):
 
             # Get boat speeds
             in_transect_idx = transect.in_transect_idx
-            if getattr(transect.boat_vel, transect.boat_vel.selected) is not None:
-                boat_selected = getattr(transect.boat_vel, transect.boat_vel.selected)
+            boat_selected = getattr(transect.boat_vel, transect.boat_vel.selected)
+            if boat_selected is not None:
                 u_boat = boat_selected.u_processed_mps[in_transect_idx]
                 v_boat = boat_selected.v_processed_mps[in_transect_idx]
             else:
                 u_boat = nans(transect.boat_vel.bt_vel.u_processed_mps[in_transect_idx].shape)
                 v_boat = nans(transect.boat_vel.bt_vel.v_processed_mps[in_transect_idx].shape)
 
-            if np.logical_not(np.all(np.isnan(boat_track['track_x_m']))):
+            # The full array must be checked, a transect with only the last
+            # track positions invalid still has valid properties.
+            if not np.isnan(boat_track['track_x_m']).all():
 
                 # Compute boat course and mean speed
                 [course_radians, dmg] = cart2pol(boat_track['track_x_m'][-1], boat_track['track_y_m'][-1])
                 trans_prop['avg_boat_course'][n] = rad2azdeg(course_radians)
-                trans_prop['avg_boat_speed'][n] = np.nanmean(np.sqrt(u_boat**2 + v_boat**2))
+                trans_prop['avg_boat_speed'][n] = np.nanmean(np.hypot(u_boat, v_boat))
 
                 # Compute width
-                trans_prop['width'][n] = np.nansum([dmg, transect.edges.left.distance_m,
-                                                    transect.edges.right.distance_m])
+                trans_prop['width'][n] = _nansum_scalars(dmg, transect.edges.left.distance_m,
+                                                         transect.edges.right.distance_m)
 
-                # Project the shiptrack onto a line from the beginning to end of the transect
+                # Project the shiptrack onto a line from the beginning to end of the
+                # transect. Since (unit_x, unit_y) is a unit vector the projected
+                # distance reduces to the absolute value of the dot product.
                 unit_x, unit_y = pol2cart(course_radians, 1)
-                bt = np.array([boat_track['track_x_m'], boat_track['track_y_m']]).T
-                dot_prod = bt @ np.array([unit_x, unit_y])
-                projected_x = dot_prod * unit_x
-                projected_y = dot_prod * unit_y
-                station = np.sqrt(projected_x**2 + projected_y**2)
+                station = np.abs(boat_track['track_x_m'] * unit_x +
+                                 boat_track['track_y_m'] * unit_y)
 
                 # Get selected depth object
-                depth = getattr(transect.depths, transect.depths.selected)
-                depth_a = np.copy(depth.depth_processed_m)
+                depth = transect.depths.active
+                depth_arr = depth.depth_processed_m
+                depth_a = np.copy(depth_arr)
                 depth_a[np.isnan(depth_a)] = 0
                 # Compute area of the moving-boat portion of the cross section using trapezoidal integration.
                 # This method is consistent with AreaComp but is different from QRev in Matlab
                 area_moving_boat = np.abs(np.trapz(depth_a[in_transect_idx], station[in_transect_idx]))
 
                 # Compute area of left edge
-                edge_type = transect.edges.left.type
-                coef = 1
-                if edge_type == 'Triangular':
-                    coef = 0.5
-                elif edge_type == 'Rectangular':
-                    coef = 1.0
-                elif edge_type == 'Custom':
-                    coef = 0.5 + (transect.edges.left.cust_coef - 0.3535)
-                elif edge_type == 'User Q':
-                    coef = 0.5
                 edge_idx = QComp.edge_ensembles('left', transect)
-                edge_depth = np.nanmean(depth.depth_processed_m[edge_idx])
-                area_left = edge_depth * transect.edges.left.distance_m * coef
+                area_left = _edge_area(transect.edges.left,
+                                       np.nanmean(depth_arr[edge_idx]))
 
                 # Compute area of right edge
-                edge_type = transect.edges.right.type
-                if edge_type == 'Triangular':
-                    coef = 0.5
-                elif edge_type == 'Rectangular':
-                    coef = 1.0
-                elif edge_type == 'Custom':
-                    coef = 0.5 + (transect.edges.right.cust_coef - 0.3535)
-                elif edge_type == 'User Q':
-                    coef = 0.5
                 edge_idx = QComp.edge_ensembles('right', transect)
-                edge_depth = np.nanmean(depth.depth_processed_m[edge_idx])
-                area_right = edge_depth * transect.edges.right.distance_m * coef
+                area_right = _edge_area(transect.edges.right,
+                                        np.nanmean(depth_arr[edge_idx]))
 
                 # Compute total cross sectional area
-                trans_prop['area'][n] = np.nansum([area_left, area_moving_boat, area_right])
+                trans_prop['area'][n] = _nansum_scalars(area_left, area_moving_boat, area_right)
 
                 # Compute average water speed
                 trans_prop['avg_water_speed'][n] = self.discharge[n].total / trans_prop['area'][n]
@@ -2085,8 +2650,9 @@ class Measurement(object):
                 u_water = transect.w_vel.u_processed_mps[:, in_transect_idx]
                 v_water = transect.w_vel.v_processed_mps[:, in_transect_idx]
                 weight = np.abs(self.discharge[n].middle_cells)
-                u = np.nansum(np.nansum(u_water * weight)) / np.nansum(np.nansum(weight))
-                v = np.nansum(np.nansum(v_water * weight)) / np.nansum(np.nansum(weight))
+                weight_sum = np.nansum(weight)
+                u = np.nansum(u_water * weight) / weight_sum
+                v = np.nansum(v_water * weight) / weight_sum
                 trans_prop['avg_water_dir'][n] = np.arctan2(u, v) * 180 / np.pi
                 if trans_prop['avg_water_dir'][n] < 0:
                     trans_prop['avg_water_dir'][n] = trans_prop['avg_water_dir'][n] + 360
@@ -2094,40 +2660,36 @@ class Measurement(object):
                 # Compute average and max depth
                 # This is a deviation from QRev in Matlab which simply averaged all the depths
                 trans_prop['avg_depth'][n] = trans_prop['area'][n] / trans_prop['width'][n]
-                trans_prop['max_depth'][n] = np.nanmax(depth.depth_processed_m[in_transect_idx])
+                trans_prop['max_depth'][n] = np.nanmax(depth_arr[in_transect_idx])
 
                 # Compute max water speed using the 99th percentile
-                water_speed = np.sqrt(u_water**2 + v_water**2)
-                trans_prop['max_water_speed'][n] = np.nanpercentile(water_speed, 99)
+                water_speed = np.hypot(u_water, v_water)
+                trans_prop['max_water_speed'][n] = _percentile99(water_speed)
                 if transect.checked:
-                    checked_idx = np.append(checked_idx, n)
-
-            # Only transects used for discharge are included in measurement properties
-            if len(checked_idx) > 0:
-                n = n_transects
-                trans_prop['width'][n] = np.nanmean(trans_prop['width'][checked_idx])
-                trans_prop['width_cov'][n] = (np.nanstd(trans_prop['width'][checked_idx], ddof=1) /
-                                              trans_prop['width'][n]) * 100
-                trans_prop['area'][n] = np.nanmean(trans_prop['area'][checked_idx])
-                trans_prop['area_cov'][n] = (np.nanstd(trans_prop['area'][checked_idx], ddof=1) /
-                                             trans_prop['area'][n]) * 100
-                trans_prop['avg_boat_speed'][n] = np.nanmean(trans_prop['avg_boat_speed'][checked_idx])
-                trans_prop['avg_water_speed'][n] = np.nanmean(trans_prop['avg_water_speed'][checked_idx])
-                trans_prop['avg_depth'][n] = np.nanmean(trans_prop['avg_depth'][checked_idx])
-                trans_prop['max_depth'][n] = np.nanmax(trans_prop['max_depth'][checked_idx])
-                trans_prop['max_water_speed'][n] = np.nanmax(trans_prop['max_water_speed'][checked_idx])
-
-                # Compute average water direction using vector coordinates to avoid the problem of averaging
-                # fluctuations that cross zero degrees
-                x_coord = []
-                y_coord = []
-                for idx in checked_idx:
-                    water_dir_rad = azdeg2rad(trans_prop['avg_water_dir'][idx])
-                    x, y = pol2cart(water_dir_rad, 1)
-                    x_coord.append(x)
-                    y_coord.append(y)
-                avg_water_dir_rad, _ = cart2pol(np.mean(x_coord), np.mean(y_coord))
-                trans_prop['avg_water_dir'][n] = rad2azdeg(avg_water_dir_rad)
+                    checked_idx.append(n)
+
+        # Only transects used for discharge are included in measurement properties
+        if len(checked_idx) > 0:
+            checked_idx = np.array(checked_idx, dtype=int)
+            n = n_transects
+            trans_prop['width'][n] = np.nanmean(trans_prop['width'][checked_idx])
+            trans_prop['width_cov'][n] = (np.nanstd(trans_prop['width'][checked_idx], ddof=1) /
+                                          trans_prop['width'][n]) * 100
+            trans_prop['area'][n] = np.nanmean(trans_prop['area'][checked_idx])
+            trans_prop['area_cov'][n] = (np.nanstd(trans_prop['area'][checked_idx], ddof=1) /
+                                         trans_prop['area'][n]) * 100
+            trans_prop['avg_boat_speed'][n] = np.nanmean(trans_prop['avg_boat_speed'][checked_idx])
+            trans_prop['avg_water_speed'][n] = np.nanmean(trans_prop['avg_water_speed'][checked_idx])
+            trans_prop['avg_depth'][n] = np.nanmean(trans_prop['avg_depth'][checked_idx])
+            trans_prop['max_depth'][n] = np.nanmax(trans_prop['max_depth'][checked_idx])
+            trans_prop['max_water_speed'][n] = np.nanmax(trans_prop['max_water_speed'][checked_idx])
+
+            # Compute average water direction using vector coordinates to avoid the problem of averaging
+            # fluctuations that cross zero degrees
+            water_dir_rad = azdeg2rad(trans_prop['avg_water_dir'][checked_idx])
+            x_coord, y_coord = pol2cart(water_dir_rad, 1)
+            avg_water_dir_rad, _ = cart2pol(np.mean(x_coord), np.mean(y_coord))
+            trans_prop['avg_water_dir'][n] = rad2azdeg(avg_water_dir_rad)
 
         return trans_prop
 
@@ -2136,11 +2698,7 @@ class Measurement(object):
         """Create a list of indices of the checked transects.
         """
 
-        checked_transect_idx = []
-        for n in range(len(meas.transects)):
-            if meas.transects[n].checked:
-                checked_transect_idx.append(n)
-        return checked_transect_idx
+        return [n for n, transect in enumerate(meas.transects) if transect.checked]
 
     @staticmethod
     def compute_time_series(meas, variable=None):
@@ -2155,36 +2713,44 @@ class Measurement(object):
         """
 
         # Initialize variables
-        data = np.array([])
-        serial_time = np.array([])
+        data_parts = []
+        time_parts = []
         idx_transects = Measurement.checked_transects(meas)
 
-        # Process transects
+        # Process transects, collecting the per-transect arrays and joining
+        # them once to avoid repeatedly reallocating growing arrays
         for idx in idx_transects:
             if variable == 'Temperature':
-                data = np.append(data, meas.transects[idx].sensors.temperature_deg_c.internal.data)
+                data_parts.append(meas.transects[idx].sensors.temperature_deg_c.internal.data)
             ens_cum_time = np.nancumsum(meas.transects[idx].date_time.ens_duration_sec)
             ens_time = meas.transects[idx].date_time.start_serial_time + ens_cum_time
-            serial_time = np.append(serial_time, ens_time)
+            time_parts.append(ens_time)
+
+        data = np.concatenate(data_parts) if data_parts else np.array([])
+        serial_time = np.concatenate(time_parts) if time_parts else np.array([])
 
         return data, serial_time
 
     def xml_output(self, version, file_name):
         channel = ETree.Element('Channel', QRevFilename=os.path.basename(file_name[:-4]), QRevVersion=version)
 
+        # The checked transects are scanned repeatedly below, filter them once
+        checked_idx = [n for n, transect in enumerate(self.transects) if transect.checked]
+        checked = [self.transects[n] for n in checked_idx]
+
         # (2) SiteInformation Node
         if self.station_name or self.station_number:
             site_info = ETree.SubElement(channel, 'SiteInformation')
 
             # (3) StationName Node
             if self.station_name:
-                ETree.SubElement(site_info, 'StationName', type='char').text = self.station_name
+                ETree.SubElement(site_info, 'StationName', attrib=_ATTR_CHAR).text = self.station_name
 
             # (3) SiteID Node
             if type(self.station_number) is str:
-                ETree.SubElement(site_info, 'SiteID', type='char').text = self.station_number
+                ETree.SubElement(site_info, 'SiteID', attrib=_ATTR_CHAR).text = self.station_number
             else:
-                ETree.SubElement(site_info, 'SiteID', type='char').text = str(self.station_number)
+                ETree.SubElement(site_info, 'SiteID', attrib=_ATTR_CHAR).text = str(self.station_number)
 
         # (2) QA Node
         qa = ETree.SubElement(channel, 'QA')
@@ -2199,57 +2765,39 @@ class Measurement(object):
                 test_result = str(failed_idx) + ' Failed'
         else:
             test_result = 'None'
-        ETree.SubElement(qa, 'DiagnosticTestResult', type='char').text = test_result
+        ETree.SubElement(qa, 'DiagnosticTestResult', attrib=_ATTR_CHAR).text = test_result
 
         # (3) CompassCalibrationResult Node
         try:
             last_eval = self.compass_eval[-1]
-            # StreamPro, RR
-            idx = last_eval.data.find('Typical Heading Error: <')
-            if idx == (-1):
-                # Rio Grande
-                idx = last_eval.data.find('>>> Total error:')
-                if idx != (-1):
-                    idx_start = idx + 17
-                    idx_end = idx_start + 10
-                    comp_error = last_eval.data[idx_start:idx_end]
-                    comp_error = ''.join([n for n in comp_error if n.isdigit() or n == '.'])
-                else:
-                    comp_error = ''
-            else:
-                # StreamPro, RR
-                idx_start = idx + 24
-                idx_end = idx_start + 10
-                comp_error = last_eval.data[idx_start:idx_end]
-                comp_error = ''.join([n for n in comp_error if n.isdigit() or n == '.'])
-
-            # Evaluation could not be determined
-            if not comp_error:
-                ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'Yes'
-            elif comp_error == '':
-                ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'No'
+            match = _COMPASS_ERR_RE.search(last_eval.data)
+            comp_error = (match.group(1) or match.group(2)) if match else ''
+
+            if comp_error:
+                ETree.SubElement(qa, 'CompassCalibrationResult', attrib=_ATTR_CHAR).text = 'Max ' + comp_error
             else:
-                ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'Max ' + comp_error
+                # Evaluation could not be determined
+                ETree.SubElement(qa, 'CompassCalibrationResult', attrib=_ATTR_CHAR).text = 'Yes'
 
         except (IndexError, TypeError, AttributeError):
             try:
                 if len(self.compass_eval) > 0:
-                    ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'Yes'
+                    ETree.SubElement(qa, 'CompassCalibrationResult', attrib=_ATTR_CHAR).text = 'Yes'
                 else:
-                    ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'No'
+                    ETree.SubElement(qa, 'CompassCalibrationResult', attrib=_ATTR_CHAR).text = 'No'
             except (IndexError, TypeError):
-                ETree.SubElement(qa, 'CompassCalibrationResult', type='char').text = 'No'
+                ETree.SubElement(qa, 'CompassCalibrationResult', attrib=_ATTR_CHAR).text = 'No'
 
         # (3) MovingBedTestType Node
         if not self.mb_tests:
-            ETree.SubElement(qa, 'MovingBedTestType', type='char').text = 'None'
+            ETree.SubElement(qa, 'MovingBedTestType', attrib=_ATTR_CHAR).text = 'None'
         else:
             selected_idx = [i for (i, val) in enumerate(self.mb_tests) if val.selected is True]
             if len(selected_idx) >= 1:
                 temp = self.mb_tests[selected_idx[0]].type
             else:
                 temp = self.mb_tests[-1].type
-            ETree.SubElement(qa, 'MovingBedTestType', type='char').text = str(temp)
+            ETree.SubElement(qa, 'MovingBedTestType', attrib=_ATTR_CHAR).text = str(temp)
 
             # MovingBedTestResult Node
             temp = 'Unknown'
@@ -2260,40 +2808,39 @@ class Measurement(object):
                 elif self.mb_tests[idx].moving_bed == 'No':
                     temp = 'No'
 
-            ETree.SubElement(qa, 'MovingBedTestResult', type='char').text = temp
+            ETree.SubElement(qa, 'MovingBedTestResult', attrib=_ATTR_CHAR).text = temp
 
         # (3) DiagnosticTest and Text Node
         if self.system_tst:
-            test_text = ''
-            for test in self.system_tst:
-                test_text += test.data
+            test_text = ''.join(test.data for test in self.system_tst)
             diag_test = ETree.SubElement(qa, 'DiagnosticTest')
-            ETree.SubElement(diag_test, 'Text', type='char').text = test_text
+            ETree.SubElement(diag_test, 'Text', attrib=_ATTR_CHAR).text = test_text
 
         # (3) CompassCalibration and Text Node
-        compass_text = ''
+        compass_parts = []
         try:
+            sontek = checked[0].adcp.manufacturer == 'SonTek'
             for each in self.compass_cal:
-                if self.transects[self.checked_transect_idx[0]].adcp.manufacturer == 'SonTek':
-                    idx = each.data.find('CAL_TIME')
-                    compass_text += each.data[idx:]
+                if sontek:
+                    compass_parts.append(each.data[each.data.find('CAL_TIME'):])
                 else:
-                    compass_text += each.data
+                    compass_parts.append(each.data)
         except (IndexError, TypeError, AttributeError):
             pass
         try:
+            sontek = checked[0].adcp.manufacturer == 'SonTek'
             for each in self.compass_eval:
-                if self.transects[self.checked_transect_idx[0]].adcp.manufacturer == 'SonTek':
-                    idx = each.data.find('CAL_TIME')
-                    compass_text += each.data[idx:]
+                if sontek:
+                    compass_parts.append(each.data[each.data.find('CAL_TIME'):])
                 else:
-                    compass_text += each.data
+                    compass_parts.append(each.data)
         except (IndexError, TypeError, AttributeError):
             pass
+        compass_text = ''.join(compass_parts)
 
         if len(compass_text) > 0:
             comp_cal = ETree.SubElement(qa, 'CompassCalibration')
-            ETree.SubElement(comp_cal, 'Text', type='char').text = compass_text
+            ETree.SubElement(comp_cal, 'Text', attrib=_ATTR_CHAR).text = compass_text
 
         # (3) MovingBedTest Node
         if self.mb_tests:
@@ -2301,111 +2848,104 @@ class Measurement(object):
                 mbt = ETree.SubElement(qa, 'MovingBedTest')
 
                 # (4) Filename Node
-                ETree.SubElement(mbt, 'Filename', type='char').text = each.transect.file_name
+                ETree.SubElement(mbt, 'Filename', attrib=_ATTR_CHAR).text = each.transect.file_name
 
                 # (4) TestType Node
-                ETree.SubElement(mbt, 'TestType', type='char').text = each.type
+                ETree.SubElement(mbt, 'TestType', attrib=_ATTR_CHAR).text = each.type
 
                 # (4) Duration Node
-                ETree.SubElement(mbt, 'Duration', type='double',
-                                 unitsCode='sec').text = '{:.2f}'.format(each.duration_sec)
+                _sub(mbt, 'Duration', each.duration_sec, '.2f', _ATTR_SEC)
 
                 # (4) PercentInvalidBT Node
-                ETree.SubElement(mbt, 'PercentInvalidBT', type='double').text = '{:.4f}'.format(each.percent_invalid_bt)
+                _sub(mbt, 'PercentInvalidBT', each.percent_invalid_bt, '.4f', _ATTR_DOUBLE)
 
                 # (4) HeadingDifference Node
                 if each.compass_diff_deg:
-                    temp = '{:.2f}'.format(each.compass_diff_deg)
+                    temp = f'{each.compass_diff_deg:.2f}'
                 else:
                     temp = ''
-                ETree.SubElement(mbt, 'HeadingDifference', type='double', unitsCode='deg').text = temp
+                ETree.SubElement(mbt, 'HeadingDifference', attrib=_ATTR_DEG).text = temp
 
                 # (4) MeanFlowDirection Node
                 if each.flow_dir:
-                    temp = '{:.2f}'.format(each.flow_dir)
+                    temp = f'{each.flow_dir:.2f}'
                 else:
                     temp = ''
-                ETree.SubElement(mbt, 'MeanFlowDirection', type='double', unitsCode='deg').text = temp
+                ETree.SubElement(mbt, 'MeanFlowDirection', attrib=_ATTR_DEG).text = temp
 
                 # (4) MovingBedDirection Node
                 if each.mb_dir:
-                    temp = '{:.2f}'.format(each.mb_dir)
+                    temp = f'{each.mb_dir:.2f}'
                 else:
                     temp = ''
-                ETree.SubElement(mbt, 'MovingBedDirection', type='double', unitsCode='deg').text = temp
+                ETree.SubElement(mbt, 'MovingBedDirection', attrib=_ATTR_DEG).text = temp
 
                 # (4) DistanceUpstream Node
-                ETree.SubElement(mbt, 'DistanceUpstream', type='double', unitsCode='m').text = \
-                    '{:.4f}'.format(each.dist_us_m)
+                ETree.SubElement(mbt, 'DistanceUpstream', attrib=_ATTR_M).text = \
+                    f'{each.dist_us_m:.4f}'
 
                 # (4) MeanFlowSpeed Node
-                ETree.SubElement(mbt, 'MeanFlowSpeed', type='double', unitsCode='mps').text = \
-                    '{:.4f}'.format(each.flow_spd_mps)
+                ETree.SubElement(mbt, 'MeanFlowSpeed', attrib=_ATTR_MPS).text = \
+                    f'{each.flow_spd_mps:.4f}'
 
                 # (4) MovingBedSpeed Node
-                ETree.SubElement(mbt, 'MovingBedSpeed', type='double', unitsCode='mps').text = \
-                    '{:.4f}'.format(each.mb_spd_mps)
+                ETree.SubElement(mbt, 'MovingBedSpeed', attrib=_ATTR_MPS).text = \
+                    f'{each.mb_spd_mps:.4f}'
 
                 # (4) PercentMovingBed Node
-                ETree.SubElement(mbt, 'PercentMovingBed', type='double').text = '{:.2f}'.format(each.percent_mb)
+                _sub(mbt, 'PercentMovingBed', each.percent_mb, '.2f', _ATTR_DOUBLE)
 
                 # (4) TestQuality Node
-                ETree.SubElement(mbt, 'TestQuality', type='char').text = each.test_quality
+                ETree.SubElement(mbt, 'TestQuality', attrib=_ATTR_CHAR).text = each.test_quality
 
                 # (4) MovingBedPresent Node
-                ETree.SubElement(mbt, 'MovingBedPresent', type='char').text = each.moving_bed
+                ETree.SubElement(mbt, 'MovingBedPresent', attrib=_ATTR_CHAR).text = each.moving_bed
 
                 # (4) UseToCorrect Node
                 if each.use_2_correct:
-                    ETree.SubElement(mbt, 'UseToCorrect', type='char').text = 'Yes'
+                    ETree.SubElement(mbt, 'UseToCorrect', attrib=_ATTR_CHAR).text = 'Yes'
                 else:
-                    ETree.SubElement(mbt, 'UseToCorrect', type='char').text = 'No'
+                    ETree.SubElement(mbt, 'UseToCorrect', attrib=_ATTR_CHAR).text = 'No'
 
                 # (4) UserValid Node
                 if each.user_valid:
-                    ETree.SubElement(mbt, 'UserValid', type='char').text = 'Yes'
+                    ETree.SubElement(mbt, 'UserValid', attrib=_ATTR_CHAR).text = 'Yes'
                 else:
-                    ETree.SubElement(mbt, 'UserValid', type='char').text = 'No'
+                    ETree.SubElement(mbt, 'UserValid', attrib=_ATTR_CHAR).text = 'No'
 
                 # (4) Message Node
                 if len(each.messages) > 0:
-                    str_out = ''
-                    for message in each.messages:
-                        str_out = str_out + message + '; '
-                    ETree.SubElement(mbt, 'Message', type='char').text = str_out
+                    str_out = ''.join(message + '; ' for message in each.messages)
+                    ETree.SubElement(mbt, 'Message', attrib=_ATTR_CHAR).text = str_out
 
         # (3) TemperatureCheck Node
         temp_check = ETree.SubElement(qa, 'TemperatureCheck')
 
         # (4) VerificationTemperature Node
-        if not np.isnan(self.ext_temp_chk['user']):
-            ETree.SubElement(temp_check, 'VerificationTemperature', type='double', unitsCode='degC').text = \
-                '{:.2f}'.format(self.ext_temp_chk['user'])
+        _add(temp_check, 'VerificationTemperature', float(self.ext_temp_chk['user']),
+             '.2f', attrib=_ATTR_DEGC)
 
         # (4) InstrumentTemperature Node
-        if not np.isnan(self.ext_temp_chk['adcp']):
-            ETree.SubElement(temp_check, 'InstrumentTemperature', type='double',
-                             unitsCode='degC').text = '{:.2f}'.format(self.ext_temp_chk['adcp'])
+        _add(temp_check, 'InstrumentTemperature', float(self.ext_temp_chk['adcp']),
+             '.2f', attrib=_ATTR_DEGC)
 
         # (4) TemperatureChange Node:
-        temp_all = np.array([np.nan])
+        temp_parts = [np.array([np.nan])]
         for each in self.transects:
             # Check for situation where user has entered a constant temperature
-            temperature_selected = getattr(each.sensors.temperature_deg_c, each.sensors.temperature_deg_c.selected)
-            temperature = temperature_selected.data
+            temperature = _selected(each.sensors.temperature_deg_c).data
             if each.sensors.temperature_deg_c.selected != 'user':
                 # Temperatures for ADCP.
-                temp_all = np.concatenate((temp_all, temperature))
+                temp_parts.append(temperature)
             else:
                 # User specified constant temperature.
-                # Concatenate a matrix of size of internal data with repeated user values.
-                user_arr = np.tile(each.sensors.temperature_deg_c.user.data,
-                                   (np.size(each.sensors.temperature_deg_c.internal.data)))
-                temp_all = np.concatenate((temp_all, user_arr))
+                # Repeat the user value to the size of the internal data.
+                temp_parts.append(np.full(np.size(each.sensors.temperature_deg_c.internal.data),
+                                          each.sensors.temperature_deg_c.user.data))
 
+        temp_all = np.concatenate(temp_parts)
         t_range = np.nanmax(temp_all) - np.nanmin(temp_all)
-        ETree.SubElement(temp_check, 'TemperatureChange', type='double',
-                         unitsCode='degC').text = '{:.2f}'.format(t_range)
+        _sub(temp_check, 'TemperatureChange', t_range, '.2f', _ATTR_DEGC)
 
         # (3) QRev_Message Node
         qa_check_keys = ['bt_vel', 'compass', 'depths', 'edges', 'extrapolation', 'gga_vel', 'movingbed', 'system_tst',
@@ -2429,267 +2969,238 @@ class Measurement(object):
         messages.sort(key=lambda x: x[1])
 
         if len(messages) > 0:
-            temp = ''
-            for message in messages:
-                temp = temp + message[0]
-            ETree.SubElement(qa, 'QRev_Message', type='char').text = temp
+            _sub(qa, 'QRev_Message', ''.join(message[0] for message in messages), attrib=_ATTR_CHAR)
 
         # (2) Instrument Node
         instrument = ETree.SubElement(channel, 'Instrument')
 
+        # The first checked transect supplies the measurement-level
+        # instrument and processing settings
+        first_transect = checked[0]
+
         # (3) Manufacturer Node
-        ETree.SubElement(instrument, 'Manufacturer', type='char').text = \
-            self.transects[self.checked_transect_idx[0]].adcp.manufacturer
+        ETree.SubElement(instrument, 'Manufacturer', attrib=_ATTR_CHAR).text = \
+            first_transect.adcp.manufacturer
 
         # (3) Model Node
-        ETree.SubElement(instrument, 'Model', type='char').text = \
-            self.transects[self.checked_transect_idx[0]].adcp.model
+        ETree.SubElement(instrument, 'Model', attrib=_ATTR_CHAR).text = \
+            first_transect.adcp.model
 
         # (3) SerialNumber Node
-        sn = self.transects[self.checked_transect_idx[0]].adcp.serial_num
-        ETree.SubElement(instrument, 'SerialNumber', type='char').text = str(sn)
+        sn = first_transect.adcp.serial_num
+        ETree.SubElement(instrument, 'SerialNumber', attrib=_ATTR_CHAR).text = str(sn)
 
         # (3) FirmwareVersion Node
-        ver = self.transects[self.checked_transect_idx[0]].adcp.firmware
-        ETree.SubElement(instrument, 'FirmwareVersion', type='char').text = str(ver)
+        ver = first_transect.adcp.firmware
+        ETree.SubElement(instrument, 'FirmwareVersion', attrib=_ATTR_CHAR).text = str(ver)
 
         # (3) Frequency Node
-        freq = self.transects[self.checked_transect_idx[0]].adcp.frequency_khz
+        freq = first_transect.adcp.frequency_khz
         if type(freq) == np.ndarray:
             freq = "Multi"
-        ETree.SubElement(instrument, 'Frequency', type='char', unitsCode='kHz').text = str(freq)
+        ETree.SubElement(instrument, 'Frequency', attrib=_ATTR_CHAR_KHZ).text = str(freq)
 
         # (3) BeamAngle Node
-        ang = self.transects[self.checked_transect_idx[0]].adcp.beam_angle_deg
-        ETree.SubElement(instrument, 'BeamAngle', type='double', unitsCode='deg').text = '{:.1f}'.format(ang)
+        ang = first_transect.adcp.beam_angle_deg
+        _sub(instrument, 'BeamAngle', ang, '.1f', _ATTR_DEG)
 
         # (3) BlankingDistance Node
-        w_vel = []
-        for each in self.transects:
-            w_vel.append(each.w_vel)
-        blank = []
-        for each in w_vel:
-            blank.append(each.blanking_distance_m)
+        blank = [each.w_vel.blanking_distance_m for each in self.transects]
         if isinstance(blank[0], float):
             temp = np.mean(blank)
-            if self.transects[self.checked_transect_idx[0]].w_vel.excluded_dist_m > temp:
-                temp = self.transects[self.checked_transect_idx[0]].w_vel.excluded_dist_m
+            if first_transect.w_vel.excluded_dist_m > temp:
+                temp = first_transect.w_vel.excluded_dist_m
         else:
-            temp = self.transects[self.checked_transect_idx[0]].w_vel.excluded_dist_m
-        ETree.SubElement(instrument, 'BlankingDistance', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+            temp = first_transect.w_vel.excluded_dist_m
+        _sub(instrument, 'BlankingDistance', temp, '.4f', _ATTR_M)
 
         # (3) InstrumentConfiguration Node
         commands = ''
-        if self.transects[self.checked_transect_idx[0]].adcp.configuration_commands is not None:
-            for each in self.transects[self.checked_transect_idx[0]].adcp.configuration_commands:
+        if first_transect.adcp.configuration_commands is not None:
+            for each in first_transect.adcp.configuration_commands:
                 if type(each) is str:
                     commands += each + '  '
-            ETree.SubElement(instrument, 'InstrumentConfiguration', type='char').text = commands
+            ETree.SubElement(instrument, 'InstrumentConfiguration', attrib=_ATTR_CHAR).text = commands
 
         # (2) Processing Node
         processing = ETree.SubElement(channel, 'Processing')
 
         # (3) SoftwareVersion Node
-        ETree.SubElement(processing, 'SoftwareVersion', type='char').text = version
+        ETree.SubElement(processing, 'SoftwareVersion', attrib=_ATTR_CHAR).text = version
 
         # (3) Type Node
-        ETree.SubElement(processing, 'Type', type='char').text = self.processing
+        ETree.SubElement(processing, 'Type', attrib=_ATTR_CHAR).text = self.processing
 
         # (3) AreaComputationMethod Node
-        ETree.SubElement(processing, 'AreaComputationMethod', type='char').text = 'Parallel'
+        ETree.SubElement(processing, 'AreaComputationMethod', attrib=_ATTR_CHAR).text = 'Parallel'
 
         # (3) Navigation Node
         navigation = ETree.SubElement(processing, 'Navigation')
 
         # (4) Reference Node
-        ETree.SubElement(navigation, 'Reference', type='char').text = \
-            self.transects[self.checked_transect_idx[0]].w_vel.nav_ref
+        ETree.SubElement(navigation, 'Reference', attrib=_ATTR_CHAR).text = \
+            first_transect.w_vel.nav_ref
 
         # (4) CompositeTrack
-        ETree.SubElement(navigation, 'CompositeTrack', type='char').text = \
-            self.transects[self.checked_transect_idx[0]].boat_vel.composite
+        ETree.SubElement(navigation, 'CompositeTrack', attrib=_ATTR_CHAR).text = \
+            first_transect.boat_vel.composite
 
         # (4) MagneticVariation Node
-        mag_var = self.transects[self.checked_transect_idx[0]].sensors.heading_deg.internal.mag_var_deg
-        ETree.SubElement(navigation, 'MagneticVariation', type='double',
-                         unitsCode='deg').text = '{:.2f}'.format(mag_var)
+        mag_var = first_transect.sensors.heading_deg.internal.mag_var_deg
+        _sub(navigation, 'MagneticVariation', mag_var, '.2f', _ATTR_DEG)
 
         # (4) BeamFilter
-        nav_data = getattr(self.transects[self.checked_transect_idx[0]].boat_vel,
-                           self.transects[self.checked_transect_idx[0]].boat_vel.selected)
+        nav_data = _selected(first_transect.boat_vel)
         temp = nav_data.beam_filter
         if temp < 0:
             temp = 'Auto'
         else:
             temp = str(temp)
-        ETree.SubElement(navigation, 'BeamFilter', type='char').text = temp
+        ETree.SubElement(navigation, 'BeamFilter', attrib=_ATTR_CHAR).text = temp
 
         # (4) ErrorVelocityFilter Node
         evf = nav_data.d_filter
         if evf == 'Manual':
-            evf = '{:.4f}'.format(nav_data.d_filter_threshold)
-        ETree.SubElement(navigation, 'ErrorVelocityFilter', type='char', unitsCode='mps').text = evf
+            evf = f'{nav_data.d_filter_threshold:.4f}'
+        ETree.SubElement(navigation, 'ErrorVelocityFilter', attrib=_ATTR_CHAR_MPS).text = evf
 
         # (4) VerticalVelocityFilter Node
         vvf = nav_data.w_filter
         if vvf == 'Manual':
-            vvf = '{:.4f}'.format(nav_data.w_filter_threshold)
-        ETree.SubElement(navigation, 'VerticalVelocityFilter', type='char', unitsCode='mps').text = vvf
+            vvf = f'{nav_data.w_filter_threshold:.4f}'
+        ETree.SubElement(navigation, 'VerticalVelocityFilter', attrib=_ATTR_CHAR_MPS).text = vvf
 
         # (4) OtherFilter Node
         o_f = nav_data.smooth_filter
-        ETree.SubElement(navigation, 'OtherFilter', type='char').text = o_f
+        ETree.SubElement(navigation, 'OtherFilter', attrib=_ATTR_CHAR).text = o_f
 
         # (4) GPSDifferentialQualityFilter Node
         temp = nav_data.gps_diff_qual_filter
         if temp:
             if isinstance(temp, int) or isinstance(temp, float):
                 temp = str(temp)
-            ETree.SubElement(navigation, 'GPSDifferentialQualityFilter', type='char').text = temp
+            ETree.SubElement(navigation, 'GPSDifferentialQualityFilter', attrib=_ATTR_CHAR).text = temp
 
         # (4) GPSAltitudeFilter Node
         temp = nav_data.gps_altitude_filter
         if temp:
             if temp == 'Manual':
-                temp = self.transects[self.checked_transect_idx[0]].boat_vel.gps_altitude_filter_change
-            ETree.SubElement(navigation, 'GPSAltitudeFilter', type='char', unitsCode='m').text = str(temp)
+                temp = first_transect.boat_vel.gps_altitude_filter_change
+            ETree.SubElement(navigation, 'GPSAltitudeFilter', attrib=_ATTR_CHAR_M).text = str(temp)
 
         # (4) HDOPChangeFilter
         temp = nav_data.gps_HDOP_filter
         if temp:
             if temp == 'Manual':
-                temp = '{:.2f}'.format(self.transects[self.checked_transect_idx[0]].boat_vel.gps_hdop_filter_change)
-            ETree.SubElement(navigation, 'HDOPChangeFilter', type='char').text = temp
+                temp = f'{first_transect.boat_vel.gps_hdop_filter_change:.2f}'
+            ETree.SubElement(navigation, 'HDOPChangeFilter', attrib=_ATTR_CHAR).text = temp
 
         # (4) HDOPThresholdFilter
         temp = nav_data.gps_HDOP_filter
         if temp:
             if temp == 'Manual':
-                temp = '{:.2f}'.format(self.transects[self.checked_transect_idx[0]].boat_vel.gps_HDOP_filter_max)
-            ETree.SubElement(navigation, 'HDOPThresholdFilter', type='char').text = temp
+                temp = f'{first_transect.boat_vel.gps_HDOP_filter_max:.2f}'
+            ETree.SubElement(navigation, 'HDOPThresholdFilter', attrib=_ATTR_CHAR).text = temp
 
         # (4) InterpolationType Node
-        temp = nav_data.interpolate
-        ETree.SubElement(navigation, 'InterpolationType', type='char').text = temp
+        _sub(navigation, 'InterpolationType', nav_data.interpolate, attrib=_ATTR_CHAR)
 
         # (3) Depth Node
         depth = ETree.SubElement(processing, 'Depth')
 
         # (4) Reference Node
-        if self.transects[self.checked_transect_idx[0]].depths.selected == 'bt_depths':
+        if first_transect.depths.selected == 'bt_depths':
             temp = 'BT'
-        elif self.transects[self.checked_transect_idx[0]].depths.selected == 'vb_depths':
+        elif first_transect.depths.selected == 'vb_depths':
             temp = 'VB'
-        elif self.transects[self.checked_transect_idx[0]].depths.selected == 'ds_depths':
+        elif first_transect.depths.selected == 'ds_depths':
             temp = 'DS'
-        ETree.SubElement(depth, 'Reference', type='char').text = temp
+        ETree.SubElement(depth, 'Reference', attrib=_ATTR_CHAR).text = temp
 
         # (4) CompositeDepth Node
-        ETree.SubElement(depth, 'CompositeDepth', type='char').text = \
-            self.transects[self.checked_transect_idx[0]].depths.composite
+        ETree.SubElement(depth, 'CompositeDepth', attrib=_ATTR_CHAR).text = \
+            first_transect.depths.composite
 
         # (4) ADCPDepth Node
-        depth_data = getattr(self.transects[self.checked_transect_idx[0]].depths,
-                             self.transects[self.checked_transect_idx[0]].depths.selected)
-        temp = depth_data.draft_use_m
-        ETree.SubElement(depth, 'ADCPDepth', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+        depth_data = first_transect.depths.active
+        _sub(depth, 'ADCPDepth', depth_data.draft_use_m, '.4f', _ATTR_M)
 
         # (4) ADCPDepthConsistent Node
-        drafts = []
-        for transect in self.transects:
-            if transect.checked:
-                transect_depth = getattr(transect.depths, transect.depths.selected)
-                drafts.append(transect_depth.draft_use_m)
-        unique_drafts = set(drafts)
-        num_drafts = len(unique_drafts)
-        if num_drafts > 1:
-            temp = 'No'
-        else:
+        if _all_same(transect.depths.active.draft_use_m for transect in checked):
             temp = 'Yes'
+        else:
+            temp = 'No'
         ETree.SubElement(depth, 'ADCPDepthConsistent', type='boolean').text = temp
 
         # (4) FilterType Node
-        temp = depth_data.filter_type
-        ETree.SubElement(depth, 'FilterType', type='char').text = temp
+        _sub(depth, 'FilterType', depth_data.filter_type, attrib=_ATTR_CHAR)
 
         # (4) InterpolationType Node
-        temp = depth_data.interp_type
-        ETree.SubElement(depth, 'InterpolationType', type='char').text = temp
+        _sub(depth, 'InterpolationType', depth_data.interp_type, attrib=_ATTR_CHAR)
 
         # (4) AveragingMethod Node
-        temp = depth_data.avg_method
-        ETree.SubElement(depth, 'AveragingMethod', type='char').text = temp
+        _sub(depth, 'AveragingMethod', depth_data.avg_method, attrib=_ATTR_CHAR)
 
         # (4) ValidDataMethod Node
-        temp = depth_data.valid_data_method
-        ETree.SubElement(depth, 'ValidDataMethod', type='char').text = temp
+        _sub(depth, 'ValidDataMethod', depth_data.valid_data_method, attrib=_ATTR_CHAR)
 
         # (3) WaterTrack Node
         water_track = ETree.SubElement(processing, 'WaterTrack')
 
         # (4) ExcludedDistance Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.excluded_dist_m
-        ETree.SubElement(water_track, 'ExcludedDistance', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+        _sub(water_track, 'ExcludedDistance', first_transect.w_vel.excluded_dist_m, '.4f', _ATTR_M)
 
         # (4) BeamFilter Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.beam_filter
+        temp = first_transect.w_vel.beam_filter
         if temp < 0:
             temp = 'Auto'
         else:
             temp = str(temp)
-        ETree.SubElement(water_track, 'BeamFilter', type='char').text = temp
+        ETree.SubElement(water_track, 'BeamFilter', attrib=_ATTR_CHAR).text = temp
 
         # (4) ErrorVelocityFilter Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.d_filter
+        temp = first_transect.w_vel.d_filter
         if temp == 'Manual':
-            temp = '{:.4f}'.format(self.transects[self.checked_transect_idx[0]].w_vel.d_filter_threshold)
-        ETree.SubElement(water_track, 'ErrorVelocityFilter', type='char', unitsCode='mps').text = temp
+            temp = f'{first_transect.w_vel.d_filter_threshold:.4f}'
+        ETree.SubElement(water_track, 'ErrorVelocityFilter', attrib=_ATTR_CHAR_MPS).text = temp
 
         # (4) VerticalVelocityFilter Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.w_filter
+        temp = first_transect.w_vel.w_filter
         if temp == 'Manual':
-            temp = '{:.4f}'.format(self.transects[self.checked_transect_idx[0]].w_vel.w_filter_threshold)
-        ETree.SubElement(water_track, 'VerticalVelocityFilter', type='char', unitsCode='mps').text = temp
+            temp = f'{first_transect.w_vel.w_filter_threshold:.4f}'
+        ETree.SubElement(water_track, 'VerticalVelocityFilter', attrib=_ATTR_CHAR_MPS).text = temp
 
         # (4) OtherFilter Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.smooth_filter
-        ETree.SubElement(water_track, 'OtherFilter', type='char').text = temp
+        _sub(water_track, 'OtherFilter', first_transect.w_vel.smooth_filter, attrib=_ATTR_CHAR)
 
         # (4) SNRFilter Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.snr_filter
-        ETree.SubElement(water_track, 'SNRFilter', type='char').text = temp
+        _sub(water_track, 'SNRFilter', first_transect.w_vel.snr_filter, attrib=_ATTR_CHAR)
 
         # (4) CellInterpolation Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.interpolate_cells
-        ETree.SubElement(water_track, 'CellInterpolation', type='char').text = temp
+        _sub(water_track, 'CellInterpolation', first_transect.w_vel.interpolate_cells, attrib=_ATTR_CHAR)
 
         # (4) EnsembleInterpolation Node
-        temp = self.transects[self.checked_transect_idx[0]].w_vel.interpolate_ens
-        ETree.SubElement(water_track, 'EnsembleInterpolation', type='char').text = temp
+        _sub(water_track, 'EnsembleInterpolation', first_transect.w_vel.interpolate_ens, attrib=_ATTR_CHAR)
 
         # (3) Edge Node
         edge = ETree.SubElement(processing, 'Edge')
 
+        # Compute the edge coefficients once for each checked transect. They
+        # are used both for the measurement level uniformity checks and for
+        # the per transect nodes. User Q edges yield an empty list which is
+        # never formatted because every use is guarded by the edge type.
+        left_coefs = [QComp.edge_coef('left', transect) for transect in checked]
+        right_coefs = [QComp.edge_coef('right', transect) for transect in checked]
+
         # (4) RectangularEdgeMethod Node
-        temp = self.transects[self.checked_transect_idx[0]].edges.rec_edge_method
-        ETree.SubElement(edge, 'RectangularEdgeMethod', type='char').text = temp
+        _sub(edge, 'RectangularEdgeMethod', first_transect.edges.rec_edge_method, attrib=_ATTR_CHAR)
 
         # (4) VelocityMethod Node
-        temp = self.transects[self.checked_transect_idx[0]].edges.vel_method
-        ETree.SubElement(edge, 'VelocityMethod', type='char').text = temp
+        _sub(edge, 'VelocityMethod', first_transect.edges.vel_method, attrib=_ATTR_CHAR)
 
         # (4) LeftType Node
-        typ = []
-        for n in self.transects:
-            if n.checked:
-                typ.append(n.edges.left.type)
-        unique_type = set(typ)
-        num_types = len(unique_type)
-        if num_types > 1:
-            temp = 'Varies'
-        else:
-            temp = typ[0]
-        ETree.SubElement(edge, 'LeftType', type='char').text = temp
+        temp = _uniform(transect.edges.left.type for transect in checked)
+        ETree.SubElement(edge, 'LeftType', attrib=_ATTR_CHAR).text = temp
 
         # LeftEdgeCoefficient
         if temp == 'User Q':
@@ -2697,29 +3208,14 @@ class Measurement(object):
         elif temp == 'Varies':
             temp = 'N/A'
         else:
-            coef = []
-            for transect in self.transects:
-                if transect.checked:
-                    coef.append(QComp.edge_coef('left', transect))
-            num_coef = len(set(coef))
-            if num_coef > 1:
-                temp = 'Varies'
-            else:
-                temp = '{:.4f}'.format(coef[0])
-        ETree.SubElement(edge, 'LeftEdgeCoefficient', type='char').text = temp
+            temp = _uniform(left_coefs)
+            if temp != 'Varies':
+                temp = f'{temp:.4f}'
+        ETree.SubElement(edge, 'LeftEdgeCoefficient', attrib=_ATTR_CHAR).text = temp
 
         # (4) RightType Node
-        typ = []
-        for n in self.transects:
-            if n.checked:
-                typ.append(n.edges.right.type)
-        unique_type = set(typ)
-        num_types = len(unique_type)
-        if num_types > 1:
-            temp = 'Varies'
-        else:
-            temp = typ[0]
-        ETree.SubElement(edge, 'RightType', type='char').text = temp
+        temp = _uniform(transect.edges.right.type for transect in checked)
+        ETree.SubElement(edge, 'RightType', attrib=_ATTR_CHAR).text = temp
 
         # RightEdgeCoefficient
         if temp == 'User Q':
@@ -2727,283 +3223,223 @@ class Measurement(object):
         elif temp == 'Varies':
             temp = 'N/A'
         else:
-            coef = []
-            for transect in self.transects:
-                if transect.checked:
-                    coef.append(QComp.edge_coef('right', transect))
-            num_coef = len(set(coef))
-            if num_coef > 1:
-                temp = 'Varies'
-            else:
-                temp = '{:.4f}'.format(coef[0])
-        ETree.SubElement(edge, 'RightEdgeCoefficient', type='char').text = temp
+            temp = _uniform(right_coefs)
+            if temp != 'Varies':
+                temp = f'{temp:.4f}'
+        ETree.SubElement(edge, 'RightEdgeCoefficient', attrib=_ATTR_CHAR).text = temp
 
         # (3) Extrapolation Node
         extrap = ETree.SubElement(processing, 'Extrapolation')
 
         # (4) TopMethod Node
-        temp = self.transects[self.checked_transect_idx[0]].extrap.top_method
-        ETree.SubElement(extrap, 'TopMethod', type='char').text = temp
+        _sub(extrap, 'TopMethod', first_transect.extrap.top_method, attrib=_ATTR_CHAR)
 
         # (4) BottomMethod Node
-        temp = self.transects[self.checked_transect_idx[0]].extrap.bot_method
-        ETree.SubElement(extrap, 'BottomMethod', type='char').text = temp
+        _sub(extrap, 'BottomMethod', first_transect.extrap.bot_method, attrib=_ATTR_CHAR)
 
         # (4) Exponent Node
-        temp = self.transects[self.checked_transect_idx[0]].extrap.exponent
-        ETree.SubElement(extrap, 'Exponent', type='double').text = '{:.4f}'.format(temp)
+        _sub(extrap, 'Exponent', first_transect.extrap.exponent, '.4f', _ATTR_DOUBLE)
 
         # (3) Sensor Node
         sensor = ETree.SubElement(processing, 'Sensor')
 
         # (4) TemperatureSource Node
-        temp = []
-        for n in self.transects:
-            if n.checked:
-                # k+=1
-                temp.append(n.sensors.temperature_deg_c.selected)
-        sources = len(set(temp))
-        if sources > 1:
-            temp = 'Varies'
-        else:
-            temp = temp[0]
-        ETree.SubElement(sensor, 'TemperatureSource', type='char').text = temp
+        temp = _uniform(transect.sensors.temperature_deg_c.selected for transect in checked)
+        ETree.SubElement(sensor, 'TemperatureSource', attrib=_ATTR_CHAR).text = temp
 
         # (4) Salinity
-        temp = np.array([])
-        for transect in self.transects:
-            if transect.checked:
-                sal_selected = getattr(transect.sensors.salinity_ppt, transect.sensors.salinity_ppt.selected)
-                temp = np.append(temp, sal_selected.data)
-        values = np.unique(temp)
-        if len(values) > 1:
+        all_salinity = np.concatenate(
+            [np.atleast_1d(_selected(transect.sensors.salinity_ppt).data) for transect in checked])
+        sal_min = np.nanmin(all_salinity)
+        if sal_min != np.nanmax(all_salinity):
             temp = 'Varies'
         else:
-            temp = '{:2.1f}'.format(values[0])
-        ETree.SubElement(sensor, 'Salinity', type='char', unitsCode='ppt').text = temp
+            temp = f'{sal_min:2.1f}'
+        ETree.SubElement(sensor, 'Salinity', attrib=_ATTR_CHAR_PPT).text = temp
 
         # (4) SpeedofSound Node
-        temp = []
-        for n in self.transects:
-            if n.checked:
-                temp.append(n.sensors.speed_of_sound_mps.selected)
-        sources = len(set(temp))
-        if sources > 1:
-            temp = 'Varies'
-        else:
-            temp = temp[0]
+        temp = _uniform(transect.sensors.speed_of_sound_mps.selected for transect in checked)
         if temp == 'internal':
             temp = 'ADCP'
-        ETree.SubElement(sensor, 'SpeedofSound', type='char', unitsCode='mps').text = temp
+        ETree.SubElement(sensor, 'SpeedofSound', attrib=_ATTR_CHAR_MPS).text = temp
 
         # (2) Transect Node
         other_prop = self.compute_measurement_properties(self)
-        for n in range(len(self.transects)):
-            if self.transects[n].checked:
-                transect = ETree.SubElement(channel, 'Transect')
 
-                # (3) Filename Node
-                temp = self.transects[n].file_name
-                ETree.SubElement(transect, 'Filename', type='char').text = temp
+        # Compute the sensor statistics for all checked transects with single
+        # axis reductions over nan padded stacks rather than per-transect
+        # NumPy calls, which are dispatch bound on these short arrays
+        temp_means = np.nanmean(_nan_padded_stack(
+            [_selected(t.sensors.temperature_deg_c).data for t in checked]), axis=1)
+        sal_means = np.nanmean(_nan_padded_stack(
+            [_selected(t.sensors.salinity_ppt).data for t in checked]), axis=1)
+        sos_means = np.nanmean(_nan_padded_stack(
+            [_selected(t.sensors.speed_of_sound_mps).data for t in checked]), axis=1)
+        pitch_stack = _nan_padded_stack([_selected(t.sensors.pitch_deg).data for t in checked])
+        pitch_means = np.nanmean(pitch_stack, axis=1)
+        pitch_stds = np.nanstd(pitch_stack, axis=1, ddof=1)
+        roll_stack = _nan_padded_stack([_selected(t.sensors.roll_deg).data for t in checked])
+        roll_means = np.nanmean(roll_stack, axis=1)
+        roll_stds = np.nanstd(roll_stack, axis=1, ddof=1)
 
-                # (3) StartDateTime Node
-                temp = int(self.transects[n].date_time.start_serial_time)
-                temp = datetime.datetime.utcfromtimestamp(temp).strftime('%m/%d/%Y %H:%M:%S')
-                ETree.SubElement(transect, 'StartDateTime', type='char').text = temp
+        for i, n in enumerate(checked_idx):
+            transect_data = checked[i]
+            q = self.discharge[n]
+            transect = ETree.SubElement(channel, 'Transect')
 
-                # (3) EndDateTime Node
-                temp = int(self.transects[n].date_time.end_serial_time)
-                temp = datetime.datetime.utcfromtimestamp(temp).strftime('%m/%d/%Y %H:%M:%S')
-                ETree.SubElement(transect, 'EndDateTime', type='char').text = temp
+            # (3) Filename Node
+            _sub(transect, 'Filename', transect_data.file_name, attrib=_ATTR_CHAR)
 
-                # (3) Discharge Node
-                t_q = ETree.SubElement(transect, 'Discharge')
+            # (3) StartDateTime Node
+            _sub(transect, 'StartDateTime', _fmt_ts(transect_data.date_time.start_serial_time),
+                 attrib=_ATTR_CHAR)
 
-                # (4) Top Node
-                temp = self.discharge[n].top
-                ETree.SubElement(t_q, 'Top', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (3) EndDateTime Node
+            _sub(transect, 'EndDateTime', _fmt_ts(transect_data.date_time.end_serial_time),
+                 attrib=_ATTR_CHAR)
 
-                # (4) Middle Node
-                temp = self.discharge[n].middle
-                ETree.SubElement(t_q, 'Middle', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (3) Discharge Node
+            t_q = ETree.SubElement(transect, 'Discharge')
 
-                # (4) Bottom Node
-                temp = self.discharge[n].bottom
-                ETree.SubElement(t_q, 'Bottom', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (4) Top Node
+            _sub(t_q, 'Top', q.top, '.5f', _ATTR_CMS)
 
-                # (4) Left Node
-                temp = self.discharge[n].left
-                ETree.SubElement(t_q, 'Left', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (4) Middle Node
+            _sub(t_q, 'Middle', q.middle, '.5f', _ATTR_CMS)
 
-                # (4) Right Node
-                temp = self.discharge[n].right
-                ETree.SubElement(t_q, 'Right', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (4) Bottom Node
+            _sub(t_q, 'Bottom', q.bottom, '.5f', _ATTR_CMS)
 
-                # (4) Total Node
-                temp = self.discharge[n].total
-                ETree.SubElement(t_q, 'Total', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+            # (4) Left Node
+            _sub(t_q, 'Left', q.left, '.5f', _ATTR_CMS)
 
-                # (4) MovingBedPercentCorrection Node
-                temp = ((self.discharge[n].total / self.discharge[n].total_uncorrected) - 1) * 100
-                ETree.SubElement(t_q, 'MovingBedPercentCorrection', type='double').text = '{:.2f}'.format(temp)
+            # (4) Right Node
+            _sub(t_q, 'Right', q.right, '.5f', _ATTR_CMS)
 
-                # (3) Edge Node
-                t_edge = ETree.SubElement(transect, 'Edge')
+            # (4) Total Node
+            _sub(t_q, 'Total', q.total, '.5f', _ATTR_CMS)
 
-                # (4) StartEdge Node
-                temp = self.transects[n].start_edge
-                ETree.SubElement(t_edge, 'StartEdge', type='char').text = temp
+            # (4) MovingBedPercentCorrection Node
+            _sub(t_q, 'MovingBedPercentCorrection', ((q.total / q.total_uncorrected) - 1) * 100, '.2f', _ATTR_DOUBLE)
 
-                # (4) RectangularEdgeMethod Node
-                temp = self.transects[n].edges.rec_edge_method
-                ETree.SubElement(t_edge, 'RectangularEdgeMethod', type='char').text = temp
+            # (3) Edge Node
+            t_edge = ETree.SubElement(transect, 'Edge')
 
-                # (4) VelocityMethod Node
-                temp = self.transects[n].edges.vel_method
-                ETree.SubElement(t_edge, 'VelocityMethod', type='char').text = temp
+            # (4) StartEdge Node
+            _sub(t_edge, 'StartEdge', transect_data.start_edge, attrib=_ATTR_CHAR)
 
-                # (4) LeftType Node
-                temp = self.transects[n].edges.left.type
-                ETree.SubElement(t_edge, 'LeftType', type='char').text = temp
+            # (4) RectangularEdgeMethod Node
+            _sub(t_edge, 'RectangularEdgeMethod', transect_data.edges.rec_edge_method, attrib=_ATTR_CHAR)
 
-                # (4) LeftEdgeCoefficient Node
-                if temp == 'User Q':
-                    temp = ''
-                else:
-                    temp = '{:.4f}'.format(QComp.edge_coef('left', self.transects[n]))
-                ETree.SubElement(t_edge, 'LeftEdgeCoefficient', type='double').text = temp
+            # (4) VelocityMethod Node
+            _sub(t_edge, 'VelocityMethod', transect_data.edges.vel_method, attrib=_ATTR_CHAR)
 
-                # (4) LeftDistance Node
-                temp = '{:.4f}'.format(self.transects[n].edges.left.distance_m)
-                ETree.SubElement(t_edge, 'LeftDistance', type='double', unitsCode='m').text = temp
+            # (4) LeftType Node
+            temp = transect_data.edges.left.type
+            ETree.SubElement(t_edge, 'LeftType', attrib=_ATTR_CHAR).text = temp
 
-                # (4) LeftNumberEnsembles
-                temp = '{:.0f}'.format(self.transects[n].edges.left.number_ensembles)
-                ETree.SubElement(t_edge, 'LeftNumberEnsembles', type='double').text = temp
+            # (4) LeftEdgeCoefficient Node
+            if temp == 'User Q':
+                temp = ''
+            else:
+                temp = f'{left_coefs[i]:.4f}'
+            ETree.SubElement(t_edge, 'LeftEdgeCoefficient', attrib=_ATTR_DOUBLE).text = temp
 
-                # (4) RightType Node
-                temp = self.transects[n].edges.right.type
-                ETree.SubElement(t_edge, 'RightType', type='char').text = temp
+            # (4) LeftDistance Node
+            _sub(t_edge, 'LeftDistance', f'{transect_data.edges.left.distance_m:.4f}', attrib=_ATTR_M)
 
-                # (4) RightEdgeCoefficient Node
-                if temp == 'User Q':
-                    temp = ''
-                else:
-                    temp = '{:.4f}'.format(QComp.edge_coef('right', self.transects[n]))
-                ETree.SubElement(t_edge, 'RightEdgeCoefficient', type='double').text = temp
-
-                # (4) RightDistance Node
-                temp = '{:.4f}'.format(self.transects[n].edges.right.distance_m)
-                ETree.SubElement(t_edge, 'RightDistance', type='double', unitsCode='m').text = temp
-
-                # (4) RightNumberEnsembles Node
-                temp = '{:.0f}'.format(self.transects[n].edges.right.number_ensembles)
-                ETree.SubElement(t_edge, 'RightNumberEnsembles', type='double').text = temp
-
-                # (3) Sensor Node
-                t_sensor = ETree.SubElement(transect, 'Sensor')
-
-                # (4) TemperatureSource Node
-                temp = self.transects[n].sensors.temperature_deg_c.selected
-                ETree.SubElement(t_sensor, 'TemperatureSource', type='char').text = temp
-
-                # (4) MeanTemperature Node
-                dat = getattr(self.transects[n].sensors.temperature_deg_c,
-                              self.transects[n].sensors.temperature_deg_c.selected)
-                temp = np.nanmean(dat.data)
-                temp = '{:.2f}'.format(temp)
-                ETree.SubElement(t_sensor, 'MeanTemperature', type='double', unitsCode='degC').text = temp
-
-                # (4) MeanSalinity
-                sal_data = getattr(self.transects[n].sensors.salinity_ppt,
-                                   self.transects[n].sensors.salinity_ppt.selected)
-                temp = '{:.0f}'.format(np.nanmean(sal_data.data))
-                ETree.SubElement(t_sensor, 'MeanSalinity', type='double', unitsCode='ppt').text = temp
-
-                # (4) SpeedofSoundSource Node
-                sos_selected = getattr(self.transects[n].sensors.speed_of_sound_mps,
-                                       self.transects[n].sensors.speed_of_sound_mps.selected)
-                temp = sos_selected.source
-                ETree.SubElement(t_sensor, 'SpeedofSoundSource', type='char').text = temp
-
-                # (4) SpeedofSound
-                sos_data = getattr(self.transects[n].sensors.speed_of_sound_mps,
-                                   self.transects[n].sensors.speed_of_sound_mps.selected)
-                temp = '{:.4f}'.format(np.nanmean(sos_data.data))
-                ETree.SubElement(t_sensor, 'SpeedofSound', type='double', unitsCode='mps').text = temp
-
-                # (3) Other Node
-                t_other = ETree.SubElement(transect, 'Other')
+            # (4) LeftNumberEnsembles
+            temp = f'{transect_data.edges.left.number_ensembles:.0f}'
+            ETree.SubElement(t_edge, 'LeftNumberEnsembles', attrib=_ATTR_DOUBLE).text = temp
 
-                # (4) Duration Node
-                temp = '{:.2f}'.format(self.transects[n].date_time.transect_duration_sec)
-                ETree.SubElement(t_other, 'Duration', type='double', unitsCode='sec').text = temp
-
-                # (4) Width
-                temp = other_prop['width'][n]
-                ETree.SubElement(t_other, 'Width', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
-
-                # (4) Area
-                temp = other_prop['area'][n]
-                ETree.SubElement(t_other, 'Area', type='double', unitsCode='sqm').text = '{:.4f}'.format(temp)
-
-                # (4) MeanBoatSpeed
-                temp = other_prop['avg_boat_speed'][n]
-                ETree.SubElement(t_other, 'MeanBoatSpeed', type='double', unitsCode='mps').text = '{:.4f}'.format(temp)
-
-                # (4) QoverA
-                temp = other_prop['avg_water_speed'][n]
-                ETree.SubElement(t_other, 'QoverA', type='double', unitsCode='mps').text = '{:.4f}'.format(temp)
-
-                # (4) CourseMadeGood
-                temp = other_prop['avg_boat_course'][n]
-                ETree.SubElement(t_other, 'CourseMadeGood', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) MeanFlowDirection
-                temp = other_prop['avg_water_dir'][n]
-                ETree.SubElement(t_other, 'MeanFlowDirection', type='double',
-                                 unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) NumberofEnsembles
-                temp = len(self.transects[n].boat_vel.bt_vel.u_processed_mps)
-                ETree.SubElement(t_other, 'NumberofEnsembles', type='integer').text = str(temp)
-
-                # (4) PercentInvalidBins
-                valid_ens, valid_cells = TransectData.raw_valid_data(self.transects[n])
-                temp = (1 - (np.nansum(np.nansum(valid_cells))
-                             / np.nansum(np.nansum(self.transects[n].w_vel.cells_above_sl)))) * 100
-                ETree.SubElement(t_other, 'PercentInvalidBins', type='double').text = '{:.2f}'.format(temp)
-
-                # (4) PercentInvalidEnsembles
-                temp = (1 - (np.nansum(valid_ens) / len(self.transects[n].boat_vel.bt_vel.u_processed_mps))) * 100
-                ETree.SubElement(t_other, 'PercentInvalidEns', type='double').text = '{:.2f}'.format(temp)
-
-                pitch_source_selected = getattr(self.transects[n].sensors.pitch_deg,
-                                                self.transects[n].sensors.pitch_deg.selected)
-                roll_source_selected = getattr(self.transects[n].sensors.roll_deg,
-                                               self.transects[n].sensors.roll_deg.selected)
-
-                # (4) MeanPitch
-                temp = np.nanmean(pitch_source_selected.data)
-                ETree.SubElement(t_other, 'MeanPitch', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) MeanRoll
-                temp = np.nanmean(roll_source_selected.data)
-                ETree.SubElement(t_other, 'MeanRoll', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) PitchStdDev
-                temp = np.nanstd(pitch_source_selected.data, ddof=1)
-                ETree.SubElement(t_other, 'PitchStdDev', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) RollStdDev
-                temp = np.nanstd(roll_source_selected.data, ddof=1)
-                ETree.SubElement(t_other, 'RollStdDev', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
-
-                # (4) ADCPDepth
-                depth_source_selected = getattr(self.transects[n].depths,
-                                                self.transects[n].depths.selected)
-                temp = depth_source_selected.draft_use_m
-                ETree.SubElement(t_other, 'ADCPDepth', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+            # (4) RightType Node
+            temp = transect_data.edges.right.type
+            ETree.SubElement(t_edge, 'RightType', attrib=_ATTR_CHAR).text = temp
+
+            # (4) RightEdgeCoefficient Node
+            if temp == 'User Q':
+                temp = ''
+            else:
+                temp = f'{right_coefs[i]:.4f}'
+            ETree.SubElement(t_edge, 'RightEdgeCoefficient', attrib=_ATTR_DOUBLE).text = temp
+
+            # (4) RightDistance Node
+            _sub(t_edge, 'RightDistance', f'{transect_data.edges.right.distance_m:.4f}', attrib=_ATTR_M)
+
+            # (4) RightNumberEnsembles Node
+            temp = f'{transect_data.edges.right.number_ensembles:.0f}'
+            ETree.SubElement(t_edge, 'RightNumberEnsembles', attrib=_ATTR_DOUBLE).text = temp
+
+            # (3) Sensor Node
+            t_sensor = ETree.SubElement(transect, 'Sensor')
+
+            # (4) TemperatureSource Node
+            _sub(t_sensor, 'TemperatureSource', transect_data.sensors.temperature_deg_c.selected, attrib=_ATTR_CHAR)
+
+            # (4) MeanTemperature Node
+            _sub(t_sensor, 'MeanTemperature', f'{temp_means[i]:.2f}', attrib=_ATTR_DEGC)
+
+            # (4) MeanSalinity
+            _sub(t_sensor, 'MeanSalinity', f'{sal_means[i]:.0f}', attrib=_ATTR_PPT)
+
+            # (4) SpeedofSoundSource Node
+            temp = _selected(transect_data.sensors.speed_of_sound_mps).source
+            ETree.SubElement(t_sensor, 'SpeedofSoundSource', attrib=_ATTR_CHAR).text = temp
+
+            # (4) SpeedofSound
+            _sub(t_sensor, 'SpeedofSound', f'{sos_means[i]:.4f}', attrib=_ATTR_MPS)
+
+            # (3) Other Node
+            t_other = ETree.SubElement(transect, 'Other')
+
+            # (4) Duration Node
+            _sub(t_other, 'Duration', f'{transect_data.date_time.transect_duration_sec:.2f}', attrib=_ATTR_SEC)
+
+            # (4) Width
+            _sub(t_other, 'Width', other_prop['width'][n], '.4f', _ATTR_M)
+
+            # (4) Area
+            _sub(t_other, 'Area', other_prop['area'][n], '.4f', _ATTR_SQM)
+
+            # (4) MeanBoatSpeed
+            _sub(t_other, 'MeanBoatSpeed', other_prop['avg_boat_speed'][n], '.4f', _ATTR_MPS)
+
+            # (4) QoverA
+            _sub(t_other, 'QoverA', other_prop['avg_water_speed'][n], '.4f', _ATTR_MPS)
+
+            # (4) CourseMadeGood
+            _sub(t_other, 'CourseMadeGood', other_prop['avg_boat_course'][n], '.2f', _ATTR_DEG)
+
+            # (4) MeanFlowDirection
+            _sub(t_other, 'MeanFlowDirection', other_prop['avg_water_dir'][n], '.2f', _ATTR_DEG)
+
+            # (4) NumberofEnsembles
+            n_ensembles = len(transect_data.boat_vel.bt_vel.u_processed_mps)
+            ETree.SubElement(t_other, 'NumberofEnsembles', attrib=_ATTR_INT).text = str(n_ensembles)
+
+            # (4) PercentInvalidBins
+            valid_ens, valid_cells = TransectData.raw_valid_data(transect_data)
+            temp = (1 - (np.nansum(valid_cells)
+                         / np.nansum(transect_data.w_vel.cells_above_sl))) * 100
+            _sub(t_other, 'PercentInvalidBins', temp, '.2f', _ATTR_DOUBLE)
+
+            # (4) PercentInvalidEnsembles
+            _sub(t_other, 'PercentInvalidEns', (1 - (np.nansum(valid_ens) / n_ensembles)) * 100, '.2f', _ATTR_DOUBLE)
+
+            # (4) MeanPitch
+            _sub(t_other, 'MeanPitch', pitch_means[i], '.2f', _ATTR_DEG)
+
+            # (4) MeanRoll
+            _sub(t_other, 'MeanRoll', roll_means[i], '.2f', _ATTR_DEG)
+
+            # (4) PitchStdDev
+            _sub(t_other, 'PitchStdDev', pitch_stds[i], '.2f', _ATTR_DEG)
+
+            # (4) RollStdDev
+            _sub(t_other, 'RollStdDev', roll_stds[i], '.2f', _ATTR_DEG)
+
+            # (4) ADCPDepth
+            _sub(t_other, 'ADCPDepth', transect_data.depths.active.draft_use_m, '.4f', _ATTR_M)
 
         # (2) ChannelSummary Node
         summary = ETree.SubElement(channel, 'ChannelSummary')
@@ -3013,258 +3449,141 @@ class Measurement(object):
         discharge = self.mean_discharges(self)
 
         # (4) Top
-        temp = discharge['top_mean']
-        ETree.SubElement(s_q, 'Top', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Top', discharge['top_mean'], '.5f', _ATTR_CMS)
 
         # (4) Middle
-        temp = discharge['mid_mean']
-        ETree.SubElement(s_q, 'Middle', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Middle', discharge['mid_mean'], '.5f', _ATTR_CMS)
 
         # (4) Bottom
-        temp = discharge['bot_mean']
-        ETree.SubElement(s_q, 'Bottom', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Bottom', discharge['bot_mean'], '.5f', _ATTR_CMS)
 
         # (4) Left
-        temp = discharge['left_mean']
-        ETree.SubElement(s_q, 'Left', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Left', discharge['left_mean'], '.5f', _ATTR_CMS)
 
         # (4) Right
-        temp = discharge['right_mean']
-        ETree.SubElement(s_q, 'Right', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Right', discharge['right_mean'], '.5f', _ATTR_CMS)
 
         # (4) Total
-        temp = discharge['total_mean']
-        ETree.SubElement(s_q, 'Total', type='double', unitsCode='cms').text = '{:.5f}'.format(temp)
+        _sub(s_q, 'Total', discharge['total_mean'], '.5f', _ATTR_CMS)
 
         # (4) MovingBedPercentCorrection
         temp = ((discharge['total_mean'] / discharge['uncorrected_mean']) - 1) * 100
-        ETree.SubElement(s_q, 'MovingBedPercentCorrection', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_q, 'MovingBedPercentCorrection', temp, '.2f', _ATTR_DOUBLE)
 
         # (3) Uncertainty Node
         s_u = ETree.SubElement(summary, 'Uncertainty')
         uncertainty = self.uncertainty
 
-        # (4) COV Node
-        temp = uncertainty.cov
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'COV', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoRandom Node
-        temp = uncertainty.cov_95
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'AutoRandom', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoInvalidData Node
-        temp = uncertainty.invalid_95
-        ETree.SubElement(s_u, 'AutoInvalidData', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoEdge Node
-        temp = uncertainty.edges_95
-        ETree.SubElement(s_u, 'AutoEdge', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoExtrapolation Node
-        temp = uncertainty.extrapolation_95
-        ETree.SubElement(s_u, 'AutoExtrapolation', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoMovingBed
-        temp = uncertainty.moving_bed_95
-        ETree.SubElement(s_u, 'AutoMovingBed', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoSystematic
-        temp = uncertainty.systematic
-        ETree.SubElement(s_u, 'AutoSystematic', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) AutoTotal
-        temp = uncertainty.total_95
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'AutoTotal', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) UserRandom Node
-        user_random = uncertainty.cov_95_user
-        if user_random:
-            ETree.SubElement(s_u, 'UserRandom', type='double').text = '{:.1f}'.format(user_random)
-
-        # (4) UserInvalidData Node
-        user_invalid = uncertainty.invalid_95_user
-        if user_invalid:
-            ETree.SubElement(s_u, 'UserInvalidData', type='double').text = '{:.1f}'.format(user_invalid)
-
-        # (4) UserEdge
-        user_edge = uncertainty.edges_95_user
-        if user_edge:
-            ETree.SubElement(s_u, 'UserEdge', type='double').text = '{:.1f}'.format(user_edge)
-
-        # (4) UserExtrapolation
-        user_extrap = uncertainty.extrapolation_95_user
-        if user_extrap:
-            ETree.SubElement(s_u, 'UserExtrapolation', type='double').text = '{:.1f}'.format(user_extrap)
-
-        # (4) UserMovingBed
-        user_mb = uncertainty.moving_bed_95_user
-        if user_mb:
-            ETree.SubElement(s_u, 'UserMovingBed', type='double').text = '{:.1f}'.format(user_mb)
-
-        # (4) UserSystematic
-        user_systematic = uncertainty.systematic_user
-        if user_systematic:
-            ETree.SubElement(s_u, 'UserSystematic', type='double').text = '{:.1f}'.format(user_systematic)
-
-        # (4) UserTotal Node
-        temp = uncertainty.total_95_user
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'UserTotal', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) Random
-        if user_random:
-            temp = user_random
-        else:
-            temp = uncertainty.cov_95
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'Random', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) InvalidData
-        if user_invalid:
-            temp = user_invalid
-        else:
-            temp = uncertainty.invalid_95
-        ETree.SubElement(s_u, 'InvalidData', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) Edge
-        if user_edge:
-            temp = user_edge
-        else:
-            temp = uncertainty.edges_95
-        ETree.SubElement(s_u, 'Edge', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) Extrapolation
-        if user_extrap:
-            temp = user_extrap
-        else:
-            temp = uncertainty.extrapolation_95
-        ETree.SubElement(s_u, 'Extrapolation', type='double').text = '{:.1f}'.format(temp)
-
-        # (4) MovingBed
-        if user_mb:
-            temp = user_mb
-        else:
-            temp = uncertainty.moving_bed_95
-        ETree.SubElement(s_u, 'MovingBed', type='double').text = '{:.1f}'.format(temp)
+        # (4) Automatically computed uncertainty nodes
+        for tag, attr, optional in _UNC_AUTO_FIELDS:
+            value = getattr(uncertainty, attr)
+            if optional:
+                _add(s_u, tag, float(value), '.1f', attrib=_ATTR_DOUBLE)
+            else:
+                ETree.SubElement(s_u, tag, attrib=_ATTR_DOUBLE).text = f'{value:.1f}'
 
-        # (4) Systematic
-        if user_systematic:
-            temp = user_systematic
-        else:
-            temp = uncertainty.systematic
-        ETree.SubElement(s_u, 'Systematic', type='double').text = '{:.1f}'.format(temp)
+        # (4) User supplied uncertainty nodes
+        for tag, attr in _UNC_USER_FIELDS:
+            value = getattr(uncertainty, attr)
+            if value:
+                ETree.SubElement(s_u, tag, attrib=_ATTR_DOUBLE).text = f'{value:.1f}'
 
         # (4) UserTotal Node
-        temp = uncertainty.total_95_user
-        if not np.isnan(temp):
-            ETree.SubElement(s_u, 'Total', type='double').text = '{:.1f}'.format(temp)
+        _add(s_u, 'UserTotal', float(uncertainty.total_95_user), '.1f', attrib=_ATTR_DOUBLE)
+
+        # (4) Combined uncertainty nodes, a set user value overrides the
+        # automatic value
+        for tag, user_attr, auto_attr, optional in _UNC_COMBINED_FIELDS:
+            value = getattr(uncertainty, user_attr) or getattr(uncertainty, auto_attr)
+            if optional:
+                _add(s_u, tag, float(value), '.1f', attrib=_ATTR_DOUBLE)
+            else:
+                ETree.SubElement(s_u, tag, attrib=_ATTR_DOUBLE).text = f'{value:.1f}'
+
+        # (4) Total Node
+        _add(s_u, 'Total', float(uncertainty.total_95_user), '.1f', attrib=_ATTR_DOUBLE)
 
         # (3) Other Node
         s_o = ETree.SubElement(summary, 'Other')
 
         # (4) MeanWidth
-        temp = other_prop['width'][-1]
-        ETree.SubElement(s_o, 'MeanWidth', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MeanWidth', other_prop['width'][-1], '.4f', _ATTR_M)
 
         # (4) WidthCOV
-        temp = other_prop['width_cov'][-1]
-        if not np.isnan(temp):
-            ETree.SubElement(s_o, 'WidthCOV', type='double').text = '{:.4f}'.format(temp)
+        _add(s_o, 'WidthCOV', float(other_prop['width_cov'][-1]), '.4f', attrib=_ATTR_DOUBLE)
 
         # (4) MeanArea
-        temp = other_prop['area'][-1]
-        ETree.SubElement(s_o, 'MeanArea', type='double', unitsCode='sqm').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MeanArea', other_prop['area'][-1], '.4f', _ATTR_SQM)
 
         # (4) AreaCOV
-        temp = other_prop['area_cov'][-1]
-        if not np.isnan(temp):
-            ETree.SubElement(s_o, 'AreaCOV', type='double').text = '{:.2f}'.format(temp)
+        _add(s_o, 'AreaCOV', float(other_prop['area_cov'][-1]), '.2f', attrib=_ATTR_DOUBLE)
 
         # (4) MeanBoatSpeed
-        temp = other_prop['avg_boat_speed'][-1]
-        ETree.SubElement(s_o, 'MeanBoatSpeed', type='double', unitsCode='mps').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MeanBoatSpeed', other_prop['avg_boat_speed'][-1], '.4f', _ATTR_MPS)
 
         # (4) MeanQoverA
-        temp = other_prop['avg_water_speed'][-1]
-        ETree.SubElement(s_o, 'MeanQoverA', type='double', unitsCode='mps').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MeanQoverA', other_prop['avg_water_speed'][-1], '.4f', _ATTR_MPS)
 
         # (4) MeanCourseMadeGood
-        temp = other_prop['avg_boat_course'][-1]
-        ETree.SubElement(s_o, 'MeanCourseMadeGood', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'MeanCourseMadeGood', other_prop['avg_boat_course'][-1], '.2f', _ATTR_DEG)
 
         # (4) MeanFlowDirection
-        temp = other_prop['avg_water_dir'][-1]
-        ETree.SubElement(s_o, 'MeanFlowDirection', type='double', unitsCode='deg').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'MeanFlowDirection', other_prop['avg_water_dir'][-1], '.2f', _ATTR_DEG)
 
         # (4) MeanDepth
-        temp = other_prop['avg_depth'][-1]
-        ETree.SubElement(s_o, 'MeanDepth', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MeanDepth', other_prop['avg_depth'][-1], '.4f', _ATTR_M)
 
         # (4) MaximumDepth
-        temp = other_prop['max_depth'][-1]
-        ETree.SubElement(s_o, 'MaximumDepth', type='double', unitsCode='m').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MaximumDepth', other_prop['max_depth'][-1], '.4f', _ATTR_M)
 
         # (4) MaximumWaterSpeed
-        temp = other_prop['max_water_speed'][-1]
-        ETree.SubElement(s_o, 'MaximumWaterSpeed', type='double', unitsCode='mps').text = '{:.4f}'.format(temp)
+        _sub(s_o, 'MaximumWaterSpeed', other_prop['max_water_speed'][-1], '.4f', _ATTR_MPS)
 
         # (4) NumberofTransects
-        temp = len(self.checked_transects(self))
-        ETree.SubElement(s_o, 'NumberofTransects', type='integer').text = str(temp)
+        _sub(s_o, 'NumberofTransects', len(checked), attrib=_ATTR_INT)
 
         # (4) Duration
-        temp = self.measurement_duration(self)
-        ETree.SubElement(s_o, 'Duration', type='double', unitsCode='sec').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'Duration', self.measurement_duration(self), '.2f', _ATTR_SEC)
 
         # (4) LeftQPer
-        temp = 100 * discharge['left_mean'] / discharge['total_mean']
-        ETree.SubElement(s_o, 'LeftQPer', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'LeftQPer', 100 * discharge['left_mean'] / discharge['total_mean'], '.2f', _ATTR_DOUBLE)
 
         # (4) RightQPer
-        temp = 100 * discharge['right_mean'] / discharge['total_mean']
-        ETree.SubElement(s_o, 'RightQPer', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'RightQPer', 100 * discharge['right_mean'] / discharge['total_mean'], '.2f', _ATTR_DOUBLE)
 
         # (4) InvalidCellsQPer
         temp = 100 * discharge['int_cells_mean'] / discharge['total_mean']
-        ETree.SubElement(s_o, 'InvalidCellsQPer', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'InvalidCellsQPer', temp, '.2f', _ATTR_DOUBLE)
 
         # (4) InvalidEnsQPer
         temp = 100 * discharge['int_ensembles_mean'] / discharge['total_mean']
-        ETree.SubElement(s_o, 'InvalidEnsQPer', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'InvalidEnsQPer', temp, '.2f', _ATTR_DOUBLE)
 
         # (4) UserRating
         if self.user_rating:
             temp = self.user_rating
         else:
             temp = 'Not Rated'
-        ETree.SubElement(s_o, 'UserRating', type='char').text = temp
+        ETree.SubElement(s_o, 'UserRating', attrib=_ATTR_CHAR).text = temp
 
         # (4) DischargePPDefault
-        temp = self.extrap_fit.q_sensitivity.q_pp_mean
-        ETree.SubElement(s_o, 'DischargePPDefault', type='double').text = '{:.2f}'.format(temp)
+        _sub(s_o, 'DischargePPDefault', self.extrap_fit.q_sensitivity.q_pp_mean, '.2f', _ATTR_DOUBLE)
 
         # (2) UserComment
         if len(self.comments) > 1:
-            temp = ''
-            for comment in self.comments:
-                temp = temp + comment.replace('\n', ' |||') + ' |||'
-            ETree.SubElement(channel, 'UserComment', type='char').text = temp
+            temp = ''.join(comment.replace('\n', ' |||') + ' |||' for comment in self.comments)
+            ETree.SubElement(channel, 'UserComment', attrib=_ATTR_CHAR).text = temp
 
         # Create xml output file
-        with open(file_name, 'wb') as xml_file:
-            # Create binary coded output file
-            et = ETree.ElementTree(channel)
-            root = et.getroot()
-            xml_out = ETree.tostring(root)
-            # Add stylesheet instructions
-            xml_out = b'<?xml-stylesheet type= "text/xsl" href="QRevStylesheet.xsl"?>' + xml_out
-            # Add tabs to make output more readable and apply utf-8 encoding
-            xml_out = parseString(xml_out).toprettyxml(encoding='utf-8')
-            # Write file
-            xml_file.write(xml_out)
+        _indent(channel)
+        et = ETree.ElementTree(channel)
+        with open(file_name, 'wb', buffering=1024 * 1024) as xml_file:
+            # Write declaration and stylesheet instructions, then serialize
+            # the already indented tree in a single pass
+            xml_file.write(b'<?xml version="1.0" encoding="utf-8"?>\n')
+            xml_file.write(b'<?xml-stylesheet type= "text/xsl" href="QRevStylesheet.xsl"?>\n')
+            et.write(xml_file, encoding='utf-8', xml_declaration=False)
+            xml_file.write(b'\n')
 
 
 if __name__ == '__main__':
@@ -564,6 +564,11 @@ class Python2Matlab(object):
         """Saves the measurement class and all data into a Matlab file using the variable names and structure
         from the QRev Matlab version.
 
+        The file is written in Matlab v5 format with compression. The v7.3
+        (HDF5) format would allow streaming writes but cannot be read by
+        scipy.io.loadmat, which both QRev and the Matlab version rely on to
+        reload saved measurements, so v5 is required for round-tripping.
+
         Parameters
         ----------
         meas: Measurement
@@ -3,7 +3,7 @@ import numpy as np
 from numpy.matlib import repmat
 from scipy import interpolate
 from Classes.BoatData import BoatData
-from MiscLibs.common_functions import cart2pol, pol2cart, iqr
+from MiscLibs.common_functions import cart2pol, pol2cart, iqr, iterative_filter_limits
 from MiscLibs.robust_loess import rloess
 from MiscLibs.abba_2d_interpolation import abba_idw_interpolation
 
@@ -1102,7 +1102,7 @@ class WaterData(object):
         multiplier = 5
 
         # Get difference data from object
-        d_vel = copy.deepcopy(self.d_mps)
+        d_vel = self.d_mps
 
         d_vel_min_ref = None
         d_vel_max_ref = None
@@ -1115,42 +1115,14 @@ class WaterData(object):
             d_vel_max_ref = np.nanmax(np.nanmax(d_vel)) + 1
             d_vel_min_ref = np.nanmin(np.nanmin(d_vel)) - 1
         elif self.d_filter == 'Auto':
-            # Initialize variables
-            d_vel_filtered = copy.deepcopy(d_vel)
-            std_diff = 1
-            i = -1
-            # Loop until no additional data are removed
-            while std_diff != 0 and i < 1000:
-                i = i+1
-
-                # Compute standard deviation
-                d_vel_std = iqr(d_vel_filtered)
-
-                # Compute maximum and minimum thresholds
-                d_vel_max_ref = np.nanmedian(d_vel_filtered) + multiplier * d_vel_std
-                d_vel_min_ref = np.nanmedian(d_vel_filtered) - multiplier * d_vel_std
-
-                # Identify valid and invalid data
-                d_vel_bad_rows, d_vel_bad_cols = np.where(np.logical_or
-                                                          (np.greater(d_vel_filtered, d_vel_max_ref),
-                                                           np.less(d_vel_filtered, d_vel_min_ref)))
-
-                # Update filtered data array
-                d_vel_filtered[d_vel_bad_rows, d_vel_bad_cols] = np.nan
-
-                # Determine differences due to last filter iteration
-                if len(d_vel_filtered) > 0:
-                    d_vel_std2 = iqr(d_vel_filtered)
-                    std_diff = d_vel_std2 - d_vel_std
-                else:
-                    std_diff = 0
+            # Iteratively trim the data until the thresholds stabilize
+            d_vel_min_ref, d_vel_max_ref = iterative_filter_limits(d_vel, multiplier)
 
         # Set valid data row 2 for difference velocity filter results
-        bad_idx_rows, bad_idx_cols = np.where(np.logical_or(np.greater(d_vel, d_vel_max_ref),
-                                              np.less(d_vel, d_vel_min_ref)))
-        valid = copy.deepcopy(self.cells_above_sl)
-        if len(bad_idx_rows) > 0:
-            valid[bad_idx_rows, bad_idx_cols] = False
+        invalid = np.logical_or(np.greater(d_vel, d_vel_max_ref),
+                                np.less(d_vel, d_vel_min_ref))
+        valid = np.copy(self.cells_above_sl)
+        valid[invalid] = False
         # TODO Seems like if the difference velocity doesn't exist due to a 3-beam solution it shouldn't be
         #  flagged as invalid however this is the way it was in Matlab. May change this in future.
         # valid[np.isnan(self.d_mps)] = True
@@ -1191,7 +1163,7 @@ class WaterData(object):
         multiplier = 5
 
         # Get difference data from object
-        w_vel = copy.deepcopy(self.w_mps)
+        w_vel = self.w_mps
 
         w_vel_min_ref = None
         w_vel_max_ref = None
@@ -1204,40 +1176,14 @@ class WaterData(object):
             w_vel_max_ref = np.nanmax(np.nanmax(w_vel)) + 1
             w_vel_min_ref = np.nanmin(np.nanmin(w_vel)) - 1
         elif self.w_filter == 'Auto':
-            # Initialize variables
-            w_vel_filtered = copy.deepcopy(w_vel[:])
-            std_diff = 1
-            i = 0
-            # Loop until no additional data are removed
-            while std_diff != 0 and i < 1000:
-
-                # Computed standard deviation
-                w_vel_std = iqr(w_vel_filtered)
-
-                # Compute maximum and minimum thresholds
-                w_vel_max_ref = np.nanmedian(w_vel_filtered) + multiplier * w_vel_std
-                w_vel_min_ref = np.nanmedian(w_vel_filtered) - multiplier * w_vel_std
-
-                # Identify valid and invalid data
-                w_vel_bad_rows, w_vel_bad_cols = np.where(np.logical_or(np.greater(w_vel_filtered, w_vel_max_ref),
-                                                                        np.less(w_vel_filtered, w_vel_min_ref)))
-
-                # Update filtered data array
-                w_vel_filtered[w_vel_bad_rows, w_vel_bad_cols] = np.nan
-
-                # Determine differences due to last filter iteration
-                if len(w_vel_filtered) > 0:
-                    w_vel_std2 = iqr(w_vel_filtered)
-                    std_diff = w_vel_std2 - w_vel_std
-                else:
-                    std_diff = 0
-                    
+            # Iteratively trim the data until the thresholds stabilize
+            w_vel_min_ref, w_vel_max_ref = iterative_filter_limits(w_vel, multiplier)
+
         # Set valid data row 3 for difference velocity filter results
-        bad_idx_rows, bad_idx_cols = np.where(np.logical_or(np.greater(w_vel, w_vel_max_ref),
-                                              np.less(w_vel, w_vel_min_ref)))
-        valid = copy.deepcopy(self.cells_above_sl)
-        if len(bad_idx_rows) > 0:
-            valid[bad_idx_rows, bad_idx_cols] = False
+        invalid = np.logical_or(np.greater(w_vel, w_vel_max_ref),
+                                np.less(w_vel, w_vel_min_ref))
+        valid = np.copy(self.cells_above_sl)
+        valid[invalid] = False
         self.valid_data[3, :, :] = valid
 
         # Set threshold property
@@ -379,3 +379,63 @@ def convert_temperature(temp_in, units_in, units_out):
             temp_out = (temp_in * (9./5.)) + 32
 
     return temp_out
+
+
+def iterative_filter_limits(data, multiplier):
+    """Computes filter limits using an iterative trimmed approach.
+
+    The filter assumes the data should follow a gaussian distribution, so the
+    specified number of robust standard deviations (iqr) about the median
+    should encompass all of the valid data. The limits are recomputed after
+    removing data outside the limits until removing additional data does not
+    change the computed standard deviation.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        Data to be filtered
+    multiplier: float
+        Number of standard deviations defining the limits
+
+    Returns
+    -------
+    min_ref: float
+        Lower filter limit
+    max_ref: float
+        Upper filter limit
+    """
+
+    # Work on a C-contiguous copy so the original data are not modified
+    data_filtered = np.ascontiguousarray(data, dtype=float)
+    if data_filtered is data:
+        data_filtered = np.copy(data)
+
+    min_ref = np.nan
+    max_ref = np.nan
+    std_diff = 1
+    i = 0
+
+    # Loop until no additional data are removed
+    while std_diff != 0 and i < 1000:
+        i = i + 1
+
+        # Compute standard deviation
+        data_std = iqr(data_filtered)
+
+        # Compute maximum and minimum thresholds
+        data_median = np.nanmedian(data_filtered)
+        max_ref = data_median + multiplier * data_std
+        min_ref = data_median - multiplier * data_std
+
+        # Identify and remove invalid data
+        invalid = np.logical_or(np.greater(data_filtered, max_ref),
+                                np.less(data_filtered, min_ref))
+        data_filtered[invalid] = np.nan
+
+        # Determine differences due to last filter iteration
+        if len(data_filtered) > 0:
+            std_diff = iqr(data_filtered) - data_std
+        else:
+            std_diff = 0
+
+    return min_ref, max_ref
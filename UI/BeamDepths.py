@@ -1,454 +1,522 @@
-import numpy as np
-from PyQt5 import QtCore
-
-
-class BeamDepths(object):
-    """Class to generate cross section using the depths of each beam available.
-    What beams are plotted are controlled by the user through checkboxes.
-
-    Attributes
-    ----------
-    canvas: MplCanvas
-        Object of MplCanvas a FigureCanvas
-    fig: Object
-        Figure object of the canvas
-    units: dict
-        Dictionary of units conversions
-    cb_beam1: QCheckBox
-        Checkbox to plot beam 1
-    cb_beam2: QCheckBox
-        Checkbox to plot beam 2
-    cb_beam3: QCheckBox
-        Checkbox to plot beam 3
-    cb_beam4: QCheckBox
-        Checkbox to plot beam 4
-    cb_vert: QCheckBox
-        Checkbox to plot vertical beam
-    cb_ds: QCheckBox
-        Checkbox to plot depth sounder
-    beam1: list
-        Plot reference for beam 1
-    beam2: list
-        Plot reference for beam 2
-    beam3: list
-        Plot reference for beam 3
-    beam4: list
-        Plot reference for beam 4
-    vb: list
-        Plot reference for vertical beam
-    ds: list
-        Plot reference for depth sounder
-    hover_connection: int
-        Index to data cursor connection
-    annot: Annotation
-        Annotation for data cursor
-    """
-
-    def __init__(self, canvas):
-        """Initialize object using the specified canvas.
-
-        Parameters
-        ----------
-        canvas: MplCanvas
-            Object of MplCanvas
-        """
-
-        # Initialize attributes
-        self.canvas = canvas
-        self.fig = canvas.fig
-        self.units = None
-        self.cb_beam1 = None
-        self.cb_beam2 = None
-        self.cb_beam3 = None
-        self.cb_beam4 = None
-        self.cb_vert = None
-        self.cb_ds = None
-        self.beam1 = None
-        self.beam2 = None
-        self.beam3 = None
-        self.beam4 = None
-        self.vb = None
-        self.ds = None
-        self.hover_connection = None
-        self.annot = None
-
-    def create(self, transect, units, cb_beam1=None, cb_beam2=None, cb_beam3=None, cb_beam4=None,
-               cb_vert=None, cb_ds=None):
-
-        """Create the axes and lines for the figure.
-
-        Parameters
-        ----------
-        transect: TransectData
-            Object of TransectData containing boat speeds to be plotted
-        units: dict
-            Dictionary of units conversions
-        cb_beam1: QCheckBox
-            Checkbox to plot beam 1
-        cb_beam2: QCheckBox
-            Checkbox to plot beam 2
-        cb_beam3: QCheckBox
-            Checkbox to plot beam 3
-        cb_beam4: QCheckBox
-            Checkbox to plot beam 4
-        cb_vert: QCheckBox
-            Checkbox to plot vertical beam
-        cb_ds: QCheckBox
-            Checkbox to plot depth sounder
-        """
-
-        # Assign and save parameters
-        self.cb_beam1 = cb_beam1
-        self.cb_beam2 = cb_beam2
-        self.cb_beam3 = cb_beam3
-        self.cb_beam4 = cb_beam4
-        self.cb_vert = cb_vert
-        self.cb_ds = cb_ds
-
-        # Clear the plot
-        self.fig.clear()
-
-        # Configure axis
-        self.fig.ax = self.fig.add_subplot(1, 1, 1)
-
-        # Set margins and padding for figure
-        self.fig.subplots_adjust(left=0.08, bottom=0.2, right=0.98, top=0.98, wspace=0.1, hspace=0)
-
-        # Configure axes
-        self.fig.ax.set_xlabel(self.canvas.tr('Length' + units['label_L']))
-        self.fig.ax.set_ylabel(self.canvas.tr('Depth' + units['label_L']))
-        self.fig.ax.grid()
-        self.fig.ax.xaxis.label.set_fontsize(12)
-        self.fig.ax.yaxis.label.set_fontsize(12)
-        self.fig.ax.tick_params(axis='both', direction='in', bottom=True, top=True, left=True, right=True)
-
-        # Initialize max trackers
-        max_vert = np.nan
-        max_ds = np.nan
-
-        # Compute x axis data
-        boat_track = transect.boat_vel.compute_boat_track(transect=transect)
-
-        # Check to make sure there is valib boat track data
-        if not np.alltrue(np.isnan(boat_track['track_x_m'])):
-            x = boat_track['distance_m']
-            invalid_beams = np.logical_not(transect.depths.bt_depths.valid_beams)
-            beam_depths = transect.depths.bt_depths.depth_beams_m
-
-            # Plot beams
-            self.beam1 = self.fig.ax.plot(x * units['L'],
-                                          beam_depths[0, :] * units['L'],
-                                          'r-')
-            self.beam1.append(self.fig.ax.plot(x[invalid_beams[0, :]] * units['L'],
-                                               beam_depths[0, invalid_beams[0, :]] * units['L'],
-                                               'r', linestyle='',
-                                               marker='$O$')[0])
-
-            self.beam2 = self.fig.ax.plot(x * units['L'],
-                                          beam_depths[1, :] * units['L'],
-                                          color='#005500')
-            self.beam2.append(self.fig.ax.plot(x[invalid_beams[1, :]] * units['L'],
-                                               beam_depths[1, invalid_beams[1, :]] * units['L'],
-                                               color='#005500',
-                                               linestyle='',
-                                               marker='$O$')[0])
-
-            self.beam3 = self.fig.ax.plot(x * units['L'],
-                                          beam_depths[2, :] * units['L'],
-                                          'b-')
-            self.beam3.append(self.fig.ax.plot(x[invalid_beams[2, :]] * units['L'],
-                                               beam_depths[2, invalid_beams[2, :]] * units['L'],
-                                               'b',
-                                               linestyle='',
-                                               marker='$O$')[0])
-
-            self.beam4 = self.fig.ax.plot(x * units['L'],
-                                          beam_depths[3, :] * units['L'],
-                                          color='#aa5500',
-                                          linestyle='-')
-            self.beam4.append(self.fig.ax.plot(x[invalid_beams[3, :]] * units['L'],
-                                               beam_depths[3, invalid_beams[3, :]] * units['L'],
-                                               color='#aa5500',
-                                               linestyle='',
-                                               marker='$O$')[0])
-            # Compute max depth from beams
-            max_beams = np.nanmax(np.nanmax(transect.depths.bt_depths.depth_beams_m))
-
-            # Based on checkbox control make beams visible
-            if cb_beam1.checkState() == QtCore.Qt.Checked:
-                for item in self.beam1:
-                    item.set_visible(True)
-            else:
-                for item in self.beam1:
-                    item.set_visible(False)
-
-            if cb_beam2.checkState() == QtCore.Qt.Checked:
-                for item in self.beam2:
-                    item.set_visible(True)
-            else:
-                for item in self.beam2:
-                    item.set_visible(False)
-
-            if cb_beam3.checkState() == QtCore.Qt.Checked:
-                for item in self.beam3:
-                    item.set_visible(True)
-            else:
-                for item in self.beam3:
-                    item.set_visible(False)
-
-            if cb_beam4.checkState() == QtCore.Qt.Checked:
-                for item in self.beam4:
-                    item.set_visible(True)
-            else:
-                for item in self.beam4:
-                    item.set_visible(False)
-
-            # Plot vertical beam
-            if transect.depths.vb_depths is not None:
-                invalid_beams = np.logical_not(transect.depths.vb_depths.valid_beams[0, :])
-                beam_depths = transect.depths.vb_depths.depth_beams_m[0, :]
-                self.vb = self.fig.ax.plot(x * units['L'],
-                                           beam_depths * units['L'],
-                                           color='#aa00ff',
-                                           linestyle='-')
-                self.vb.append(self.fig.ax.plot(x[invalid_beams] * units['L'],
-                                                beam_depths[invalid_beams] * units['L'],
-                                                color='#aa00ff',
-                                                linestyle='',
-                                                marker='$O$')[0])
-
-                if cb_vert.checkState() == QtCore.Qt.Checked:
-                    for item in self.vb:
-                        item.set_visible(True)
-                else:
-                    for item in self.vb:
-                        item.set_visible(False)
-
-                max_vert = np.nanmax(beam_depths)
-
-            # Plot depth sounder
-            if transect.depths.ds_depths is not None:
-                invalid_beams = np.logical_not(transect.depths.ds_depths.valid_beams[0, :])
-                beam_depths = transect.depths.ds_depths.depth_beams_m[0, :]
-                self.ds = self.fig.ax.plot(x * units['L'],
-                                           beam_depths * units['L'],
-                                           color='#00aaff')
-                self.ds.append(self.fig.ax.plot(x[invalid_beams] * units['L'],
-                                                beam_depths[invalid_beams] * units['L'],
-                                                color='#00aaff',
-                                                linestyle='',
-                                                marker='$O$')[0])
-
-                if cb_ds.checkState() == QtCore.Qt.Checked:
-                    for item in self.ds:
-                        item.set_visible(True)
-                else:
-                    for item in self.ds:
-                        item.set_visible(False)
-
-                max_ds = np.nanmax(beam_depths)
-
-            # Set axis limits
-            max_y = np.nanmax([max_beams, max_vert, max_ds]) * 1.1
-            self.fig.ax.invert_yaxis()
-            self.fig.ax.set_ylim(bottom=np.ceil(max_y * units['L']), top=0)
-            self.fig.ax.set_xlim(left=-1 * x[-1] * 0.02 * units['L'], right=x[-1] * 1.02 * units['L'])
-
-            # Plot all transects from left to right
-            if transect.start_edge == 'Right':
-                self.fig.ax.invert_xaxis()
-                self.fig.ax.set_xlim(right=-1 * x[-1] * 0.02 * units['L'], left=x[-1] * 1.02 * units['L'])
-
-            self.annot = self.fig.ax.annotate("", xy=(0, 0), xytext=(-20, 20), textcoords="offset points",
-                                              bbox=dict(boxstyle="round", fc="w"),
-                                              arrowprops=dict(arrowstyle="->"))
-
-            self.annot.set_visible(False)
-
-            self.canvas.draw()
-
-    def change(self):
-        """Changes the visibility of the available beams based on user input via checkboxes.
-        """
-
-        # Set visibility of beams based on user input
-        if self.cb_beam1.checkState() == QtCore.Qt.Checked:
-            for item in self.beam1:
-                item.set_visible(True)
-        else:
-            for item in self.beam1:
-                item.set_visible(False)
-
-        if self.cb_beam2.checkState() == QtCore.Qt.Checked:
-            for item in self.beam2:
-                item.set_visible(True)
-        else:
-            for item in self.beam2:
-                item.set_visible(False)
-
-        if self.cb_beam3.checkState() == QtCore.Qt.Checked:
-            for item in self.beam3:
-                item.set_visible(True)
-        else:
-            for item in self.beam3:
-                item.set_visible(False)
-
-        if self.cb_beam4.checkState() == QtCore.Qt.Checked:
-            for item in self.beam4:
-                item.set_visible(True)
-        else:
-            for item in self.beam4:
-                item.set_visible(False)
-
-        if self.cb_vert.isEnabled():
-            if self.cb_vert.checkState() == QtCore.Qt.Checked:
-                for item in self.vb:
-                    item.set_visible(True)
-            else:
-                for item in self.vb:
-                    item.set_visible(False)
-
-        if self.cb_ds.isEnabled():
-            if self.cb_ds.checkState() == QtCore.Qt.Checked:
-                for item in self.ds:
-                    item.set_visible(True)
-            else:
-                for item in self.ds:
-                    item.set_visible(False)
-
-        # Draw canvas
-        self.canvas.draw()
-
-    def update_annot(self, ind, plt_ref, ref_label):
-        """Creates annotation for data cursor event.
-
-        Parameters
-        ----------
-        ind: dict
-            Contains array of position data from mouse click.
-        plt_ref: Line2D
-            Line on graph that was clicked
-        ref_label: str
-            Label for line that was clicked
-
-        """
-
-        pos = plt_ref._xy[ind["ind"][0]]
-
-        # Shift annotation box left or right depending on which half of the axis the pos x is located and the
-        # direction of x increasing.
-        if plt_ref.axes.viewLim.intervalx[0] < plt_ref.axes.viewLim.intervalx[1]:
-            if pos[0] < (plt_ref.axes.viewLim.intervalx[0] + plt_ref.axes.viewLim.intervalx[1]) / 2:
-                self.annot._x = -20
-            else:
-                self.annot._x = -80
-        else:
-            if pos[0] < (plt_ref.axes.viewLim.intervalx[0] + plt_ref.axes.viewLim.intervalx[1]) / 2:
-                self.annot._x = -80
-            else:
-                self.annot._x = -20
-
-        # Shift annotation box up or down depending on which half of the axis the pos y is located and the
-        # direction of y increasing.
-        if plt_ref.axes.viewLim.intervaly[0] < plt_ref.axes.viewLim.intervaly[1]:
-            if pos[1] > (plt_ref.axes.viewLim.intervaly[0] + plt_ref.axes.viewLim.intervaly[1]) / 2:
-                self.annot._y = -40
-            else:
-                self.annot._y = 20
-        else:
-            if pos[1] > (plt_ref.axes.viewLim.intervaly[0] + plt_ref.axes.viewLim.intervaly[1]) / 2:
-                self.annot._y = 20
-            else:
-                self.annot._y = -40
-
-        # Create annotation box
-        self.annot.xy = pos
-        text = 'x: {:.2f}, {}: {:.2f}'.format(pos[0], ref_label, pos[1])
-        self.annot.set_text(text)
-
-    def hover(self, event):
-        """Handles data cursor events.
-
-        Parameters
-        ----------
-        event: MouseEvent
-            Results of mouse click
-        """
-
-        vis = self.annot.get_visible()
-
-        # Check to see if event is associated with the figure
-        if event.inaxes == self.fig.ax:
-            # Intialize variables
-            cont_beam1 = False
-            cont_beam2 = False
-            cont_beam3 = False
-            cont_beam4 = False
-            cont_vb = False
-            cont_ds = False
-            ind_beam1 = None
-            ind_beam2 = None
-            ind_beam3 = None
-            ind_beam4 = None
-            ind_vb = None
-            ind_ds = None
-
-            # Identify beam selected
-            if self.beam1 is not None:
-                cont_beam1, ind_beam1 = self.beam1[0].contains(event)
-            if self.beam2 is not None:
-                cont_beam2, ind_beam2 = self.beam2[0].contains(event)
-            if self.beam3 is not None:
-                cont_beam3, ind_beam3 = self.beam3[0].contains(event)
-            if self.beam4 is not None:
-                cont_beam4, ind_beam4 = self.beam4[0].contains(event)
-            if self.vb is not None:
-                cont_vb, ind_vb = self.vb[0].contains(event)
-            if self.ds is not None:
-                cont_ds, ind_ds = self.ds[0].contains(event)
-
-            # Display result
-            if cont_beam1 and self.beam1[0].get_visible():
-                self.update_annot(ind_beam1, self.beam1[0], 'B1')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            elif cont_beam2 and self.beam2[0].get_visible():
-                self.update_annot(ind_beam2, self.beam2[0], 'B2')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            elif cont_beam3 and self.beam3[0].get_visible():
-                self.update_annot(ind_beam3, self.beam3[0], 'B3')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            if cont_beam4 and self.beam4[0].get_visible():
-                self.update_annot(ind_beam4, self.beam4[0], 'B4')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            elif cont_vb and self.vb[0].get_visible():
-                self.update_annot(ind_vb, self.vb[0], 'VB')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            elif cont_ds and self.ds[0].get_visible():
-                self.update_annot(ind_ds, self.ds[0], 'VTG')
-                self.annot.set_visible(True)
-                self.canvas.draw_idle()
-            else:
-                if vis:
-                    self.annot.set_visible(False)
-                    self.canvas.draw_idle()
-
-    def set_hover_connection(self, setting):
-        """Provides connection between data cursor and canvas.
-        Parameters
-        ----------
-        setting: bool
-            Identifies if the data cursor is selected.
-        """
-
-        if setting and self.hover_connection is None:
-            self.hover_connection = self.canvas.mpl_connect('button_press_event', self.hover)
-        elif not setting:
-            self.canvas.mpl_disconnect(self.hover_connection)
-            self.hover_connection = None
-            self.annot.set_visible(False)
-            self.canvas.draw_idle()
+import numpy as np
+from PyQt5 import QtCore
+
+
+class BeamDepths(object):
+    """Class to generate cross section using the depths of each beam available.
+    What beams are plotted are controlled by the user through checkboxes.
+
+    Attributes
+    ----------
+    canvas: MplCanvas
+        Object of MplCanvas a FigureCanvas
+    fig: Object
+        Figure object of the canvas
+    units: dict
+        Dictionary of units conversions
+    cb_beam1: QCheckBox
+        Checkbox to plot beam 1
+    cb_beam2: QCheckBox
+        Checkbox to plot beam 2
+    cb_beam3: QCheckBox
+        Checkbox to plot beam 3
+    cb_beam4: QCheckBox
+        Checkbox to plot beam 4
+    cb_vert: QCheckBox
+        Checkbox to plot vertical beam
+    cb_ds: QCheckBox
+        Checkbox to plot depth sounder
+    beam1: list
+        Plot reference for beam 1
+    beam2: list
+        Plot reference for beam 2
+    beam3: list
+        Plot reference for beam 3
+    beam4: list
+        Plot reference for beam 4
+    vb: list
+        Plot reference for vertical beam
+    ds: list
+        Plot reference for depth sounder
+    hover_connection: int
+        Index to data cursor connection
+    annot: Annotation
+        Annotation for data cursor
+    """
+
+    def __init__(self, canvas):
+        """Initialize object using the specified canvas.
+
+        Parameters
+        ----------
+        canvas: MplCanvas
+            Object of MplCanvas
+        """
+
+        # Initialize attributes
+        self.canvas = canvas
+        self.fig = canvas.fig
+        self.units = None
+        self.cb_beam1 = None
+        self.cb_beam2 = None
+        self.cb_beam3 = None
+        self.cb_beam4 = None
+        self.cb_vert = None
+        self.cb_ds = None
+        self.beam1 = None
+        self.beam2 = None
+        self.beam3 = None
+        self.beam4 = None
+        self.vb = None
+        self.ds = None
+        self.hover_connection = None
+        self.annot = None
+        self._shape_key = None
+        self._groups = []
+
+    def create(self, transect, units, cb_beam1=None, cb_beam2=None, cb_beam3=None, cb_beam4=None,
+               cb_vert=None, cb_ds=None):
+
+        """Create the axes and lines for the figure.
+
+        Parameters
+        ----------
+        transect: TransectData
+            Object of TransectData containing boat speeds to be plotted
+        units: dict
+            Dictionary of units conversions
+        cb_beam1: QCheckBox
+            Checkbox to plot beam 1
+        cb_beam2: QCheckBox
+            Checkbox to plot beam 2
+        cb_beam3: QCheckBox
+            Checkbox to plot beam 3
+        cb_beam4: QCheckBox
+            Checkbox to plot beam 4
+        cb_vert: QCheckBox
+            Checkbox to plot vertical beam
+        cb_ds: QCheckBox
+            Checkbox to plot depth sounder
+        """
+
+        # Assign and save parameters
+        self.cb_beam1 = cb_beam1
+        self.cb_beam2 = cb_beam2
+        self.cb_beam3 = cb_beam3
+        self.cb_beam4 = cb_beam4
+        self.cb_vert = cb_vert
+        self.cb_ds = cb_ds
+
+        # Compute x axis data
+        boat_track = transect.boat_vel.compute_boat_track(transect=transect)
+
+        # Check to make sure there is valib boat track data
+        if np.isfinite(boat_track['track_x_m']).any():
+            # Rebuild the axes and artists only when the data shape, available
+            # beams, or units changed; otherwise refresh the existing artists
+            # in place, which avoids recreating the figure from scratch
+            shape_key = (transect.depths.bt_depths.depth_beams_m.shape,
+                         transect.depths.vb_depths is not None,
+                         transect.depths.ds_depths is not None,
+                         units['L'])
+            if shape_key == self._shape_key:
+                self.update_data(transect, units, boat_track)
+            else:
+                self.build(transect, units, boat_track)
+                self._shape_key = shape_key
+
+            # Pair each checkbox with its artist group for the visibility loops
+            self._groups = [(cb_beam1, self.beam1), (cb_beam2, self.beam2),
+                            (cb_beam3, self.beam3), (cb_beam4, self.beam4)]
+            if self.vb is not None:
+                self._groups.append((cb_vert, self.vb))
+            if self.ds is not None:
+                self._groups.append((cb_ds, self.ds))
+
+            # Based on checkbox control make beams visible
+            self.apply_visibility()
+
+            self.canvas.draw_idle()
+
+        else:
+            # No valid track, so clear the figure to avoid leaving the
+            # previous transect's plot on screen and force a rebuild on the
+            # next transect with valid data
+            self.fig.clear()
+            self._shape_key = None
+            self._groups = []
+            self.beam1 = None
+            self.beam2 = None
+            self.beam3 = None
+            self.beam4 = None
+            self.vb = None
+            self.ds = None
+
+            self.canvas.draw_idle()
+
+    def apply_visibility(self):
+        """Sets the visibility of each artist group to match its checkbox.
+
+        Groups whose visibility already matches are left untouched so their
+        artists are not marked dirty.
+
+        Returns
+        -------
+        changed: bool
+            Indicates if the visibility of any group changed
+        """
+
+        changed = False
+        for checkbox, group in self._groups:
+            if checkbox is None or not checkbox.isEnabled():
+                continue
+            visible = checkbox.checkState() == QtCore.Qt.Checked
+            if group[0].get_visible() != visible:
+                changed = True
+                for item in group:
+                    item.set_visible(visible)
+        return changed
+
+    def build(self, transect, units, boat_track):
+        """Creates the axes and line artists for the figure.
+
+        Parameters
+        ----------
+        transect: TransectData
+            Object of TransectData containing depths to be plotted
+        units: dict
+            Dictionary of units conversions
+        boat_track: dict
+            Dictionary of boat track distances computed from the transect
+        """
+
+        # Clear the plot
+        self.fig.clear()
+
+        # Configure axis
+        self.fig.ax = self.fig.add_subplot(1, 1, 1)
+
+        # Set margins and padding for figure
+        self.fig.subplots_adjust(left=0.08, bottom=0.2, right=0.98, top=0.98, wspace=0.1, hspace=0)
+
+        # Hoist the units conversions out of the plot calls
+        unit_l = units['L']
+        label_l = units['label_L']
+
+        # Configure axes
+        self.fig.ax.set_xlabel(self.canvas.tr('Length' + label_l))
+        self.fig.ax.set_ylabel(self.canvas.tr('Depth' + label_l))
+        self.fig.ax.grid()
+        self.fig.ax.xaxis.label.set_fontsize(12)
+        self.fig.ax.yaxis.label.set_fontsize(12)
+        self.fig.ax.tick_params(axis='both', direction='in', bottom=True, top=True, left=True, right=True)
+
+        # Scale the plotted arrays once rather than at each plot call
+        x_l = (boat_track['distance_m'] * unit_l).astype(np.float32, copy=False)
+        invalid_beams = ~transect.depths.bt_depths.valid_beams
+        bd_l = (transect.depths.bt_depths.depth_beams_m * unit_l).astype(np.float32, copy=False)
+
+        # Plot beams
+        self.beam1 = self.fig.ax.plot(x_l,
+                                      bd_l[0, :],
+                                      'r-', rasterized=True)
+        self.beam1.append(self.fig.ax.plot(x_l[invalid_beams[0, :]],
+                                           bd_l[0, invalid_beams[0, :]],
+                                           'r', linestyle='',
+                                           marker='o', markerfacecolor='none',
+                                           rasterized=True)[0])
+
+        self.beam2 = self.fig.ax.plot(x_l,
+                                      bd_l[1, :],
+                                      color='#005500', rasterized=True)
+        self.beam2.append(self.fig.ax.plot(x_l[invalid_beams[1, :]],
+                                           bd_l[1, invalid_beams[1, :]],
+                                           color='#005500',
+                                           linestyle='',
+                                           marker='o', markerfacecolor='none',
+                                           rasterized=True)[0])
+
+        self.beam3 = self.fig.ax.plot(x_l,
+                                      bd_l[2, :],
+                                      'b-', rasterized=True)
+        self.beam3.append(self.fig.ax.plot(x_l[invalid_beams[2, :]],
+                                           bd_l[2, invalid_beams[2, :]],
+                                           'b',
+                                           linestyle='',
+                                           marker='o', markerfacecolor='none',
+                                           rasterized=True)[0])
+
+        self.beam4 = self.fig.ax.plot(x_l,
+                                      bd_l[3, :],
+                                      color='#aa5500',
+                                      linestyle='-', rasterized=True)
+        self.beam4.append(self.fig.ax.plot(x_l[invalid_beams[3, :]],
+                                           bd_l[3, invalid_beams[3, :]],
+                                           color='#aa5500',
+                                           linestyle='',
+                                           marker='o', markerfacecolor='none',
+                                           rasterized=True)[0])
+
+        # Plot vertical beam
+        self.vb = None
+        if transect.depths.vb_depths is not None:
+            invalid_beams = ~transect.depths.vb_depths.valid_beams[0, :]
+            bd_l = (transect.depths.vb_depths.depth_beams_m[0, :] * unit_l).astype(np.float32, copy=False)
+            self.vb = self.fig.ax.plot(x_l,
+                                       bd_l,
+                                       color='#aa00ff',
+                                       linestyle='-', rasterized=True)
+            self.vb.append(self.fig.ax.plot(x_l[invalid_beams],
+                                            bd_l[invalid_beams],
+                                            color='#aa00ff',
+                                            linestyle='',
+                                            marker='o', markerfacecolor='none',
+                                            rasterized=True)[0])
+
+        # Plot depth sounder
+        self.ds = None
+        if transect.depths.ds_depths is not None:
+            invalid_beams = ~transect.depths.ds_depths.valid_beams[0, :]
+            bd_l = (transect.depths.ds_depths.depth_beams_m[0, :] * unit_l).astype(np.float32, copy=False)
+            self.ds = self.fig.ax.plot(x_l,
+                                       bd_l,
+                                       color='#00aaff', rasterized=True)
+            self.ds.append(self.fig.ax.plot(x_l[invalid_beams],
+                                            bd_l[invalid_beams],
+                                            color='#00aaff',
+                                            linestyle='',
+                                            marker='o', markerfacecolor='none',
+                                            rasterized=True)[0])
+
+        # Set axis limits
+        self.set_limits(transect, units, boat_track['distance_m'])
+
+        self.annot = self.fig.ax.annotate("", xy=(0, 0), xytext=(-20, 20), textcoords="offset points",
+                                          bbox=dict(boxstyle="round", fc="w"),
+                                          arrowprops=dict(arrowstyle="->"))
+
+        self.annot.set_visible(False)
+
+    def update_data(self, transect, units, boat_track):
+        """Updates the data of the existing line artists in place.
+
+        Parameters
+        ----------
+        transect: TransectData
+            Object of TransectData containing depths to be plotted
+        units: dict
+            Dictionary of units conversions
+        boat_track: dict
+            Dictionary of boat track distances computed from the transect
+        """
+
+        # Scale the plotted arrays once rather than at each set_data call
+        unit_l = units['L']
+        x_l = (boat_track['distance_m'] * unit_l).astype(np.float32, copy=False)
+        invalid_beams = ~transect.depths.bt_depths.valid_beams
+        bd_l = (transect.depths.bt_depths.depth_beams_m * unit_l).astype(np.float32, copy=False)
+
+        # Update beams
+        for n, beam in enumerate((self.beam1, self.beam2, self.beam3, self.beam4)):
+            invalid = invalid_beams[n, :]
+            beam[0].set_data(x_l, bd_l[n, :])
+            beam[1].set_data(x_l[invalid], bd_l[n, invalid])
+
+        # Update vertical beam
+        if self.vb is not None:
+            invalid_beams = ~transect.depths.vb_depths.valid_beams[0, :]
+            bd_l = (transect.depths.vb_depths.depth_beams_m[0, :] * unit_l).astype(np.float32, copy=False)
+            self.vb[0].set_data(x_l, bd_l)
+            self.vb[1].set_data(x_l[invalid_beams],
+                                bd_l[invalid_beams])
+
+        # Update depth sounder
+        if self.ds is not None:
+            invalid_beams = ~transect.depths.ds_depths.valid_beams[0, :]
+            bd_l = (transect.depths.ds_depths.depth_beams_m[0, :] * unit_l).astype(np.float32, copy=False)
+            self.ds[0].set_data(x_l, bd_l)
+            self.ds[1].set_data(x_l[invalid_beams],
+                                bd_l[invalid_beams])
+
+        # Set axis limits
+        self.set_limits(transect, units, boat_track['distance_m'])
+
+        self.annot.set_visible(False)
+
+    def set_limits(self, transect, units, x):
+        """Sets the axis limits for the current data.
+
+        Parameters
+        ----------
+        transect: TransectData
+            Object of TransectData containing depths to be plotted
+        units: dict
+            Dictionary of units conversions
+        x: np.array(float)
+            Boat track distances in meters
+        """
+
+        # Compute max depth from available beams
+        max_beams = np.nanmax(transect.depths.bt_depths.depth_beams_m)
+        max_vert = np.nan
+        max_ds = np.nan
+        if transect.depths.vb_depths is not None:
+            max_vert = np.nanmax(transect.depths.vb_depths.depth_beams_m[0, :])
+        if transect.depths.ds_depths is not None:
+            max_ds = np.nanmax(transect.depths.ds_depths.depth_beams_m[0, :])
+
+        # Set axis limits. The argument order encodes the axis direction, so
+        # the invert_axis calls and their transform rebuilds are unneeded.
+        # Depth increases downward and all transects plot left to right.
+        unit_l = units['L']
+        x_last = float(x[-1])
+        max_y = np.nanmax([max_beams, max_vert, max_ds]) * 1.1
+        self.fig.ax.set_ylim(np.ceil(max_y * unit_l), 0)
+        x_left = -1 * x_last * 0.02 * unit_l
+        x_right = x_last * 1.02 * unit_l
+        if transect.start_edge == 'Right':
+            x_left, x_right = x_right, x_left
+        self.fig.ax.set_xlim(x_left, x_right)
+
+    def change(self):
+        """Changes the visibility of the available beams based on user input via checkboxes.
+        """
+
+        # Set visibility of beams based on user input and only redraw when
+        # something actually changed
+        if self.apply_visibility():
+            self.canvas.draw_idle()
+
+    def update_annot(self, ind, plt_ref, ref_label):
+        """Creates annotation for data cursor event.
+
+        Parameters
+        ----------
+        ind: dict
+            Contains array of position data from mouse click.
+        plt_ref: Line2D
+            Line on graph that was clicked
+        ref_label: str
+            Label for line that was clicked
+
+        """
+
+        pos = plt_ref._xy[ind["ind"][0]]
+
+        # Shift annotation box left or right depending on which half of the axis the pos x is located and the
+        # direction of x increasing.
+        if plt_ref.axes.viewLim.intervalx[0] < plt_ref.axes.viewLim.intervalx[1]:
+            if pos[0] < (plt_ref.axes.viewLim.intervalx[0] + plt_ref.axes.viewLim.intervalx[1]) / 2:
+                self.annot._x = -20
+            else:
+                self.annot._x = -80
+        else:
+            if pos[0] < (plt_ref.axes.viewLim.intervalx[0] + plt_ref.axes.viewLim.intervalx[1]) / 2:
+                self.annot._x = -80
+            else:
+                self.annot._x = -20
+
+        # Shift annotation box up or down depending on which half of the axis the pos y is located and the
+        # direction of y increasing.
+        if plt_ref.axes.viewLim.intervaly[0] < plt_ref.axes.viewLim.intervaly[1]:
+            if pos[1] > (plt_ref.axes.viewLim.intervaly[0] + plt_ref.axes.viewLim.intervaly[1]) / 2:
+                self.annot._y = -40
+            else:
+                self.annot._y = 20
+        else:
+            if pos[1] > (plt_ref.axes.viewLim.intervaly[0] + plt_ref.axes.viewLim.intervaly[1]) / 2:
+                self.annot._y = 20
+            else:
+                self.annot._y = -40
+
+        # Create annotation box
+        self.annot.xy = pos
+        text = 'x: {:.2f}, {}: {:.2f}'.format(pos[0], ref_label, pos[1])
+        self.annot.set_text(text)
+
+    def hover(self, event):
+        """Handles data cursor events.
+
+        Parameters
+        ----------
+        event: MouseEvent
+            Results of mouse click
+        """
+
+        vis = self.annot.get_visible()
+
+        # Check to see if event is associated with the figure
+        if event.inaxes == self.fig.ax:
+            # Intialize variables
+            cont_beam1 = False
+            cont_beam2 = False
+            cont_beam3 = False
+            cont_beam4 = False
+            cont_vb = False
+            cont_ds = False
+            ind_beam1 = None
+            ind_beam2 = None
+            ind_beam3 = None
+            ind_beam4 = None
+            ind_vb = None
+            ind_ds = None
+
+            # Identify beam selected
+            if self.beam1 is not None:
+                cont_beam1, ind_beam1 = self.beam1[0].contains(event)
+            if self.beam2 is not None:
+                cont_beam2, ind_beam2 = self.beam2[0].contains(event)
+            if self.beam3 is not None:
+                cont_beam3, ind_beam3 = self.beam3[0].contains(event)
+            if self.beam4 is not None:
+                cont_beam4, ind_beam4 = self.beam4[0].contains(event)
+            if self.vb is not None:
+                cont_vb, ind_vb = self.vb[0].contains(event)
+            if self.ds is not None:
+                cont_ds, ind_ds = self.ds[0].contains(event)
+
+            # Display result
+            if cont_beam1 and self.beam1[0].get_visible():
+                self.update_annot(ind_beam1, self.beam1[0], 'B1')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            elif cont_beam2 and self.beam2[0].get_visible():
+                self.update_annot(ind_beam2, self.beam2[0], 'B2')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            elif cont_beam3 and self.beam3[0].get_visible():
+                self.update_annot(ind_beam3, self.beam3[0], 'B3')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            if cont_beam4 and self.beam4[0].get_visible():
+                self.update_annot(ind_beam4, self.beam4[0], 'B4')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            elif cont_vb and self.vb[0].get_visible():
+                self.update_annot(ind_vb, self.vb[0], 'VB')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            elif cont_ds and self.ds[0].get_visible():
+                self.update_annot(ind_ds, self.ds[0], 'VTG')
+                self.annot.set_visible(True)
+                self.canvas.draw_idle()
+            else:
+                if vis:
+                    self.annot.set_visible(False)
+                    self.canvas.draw_idle()
+
+    def set_hover_connection(self, setting):
+        """Provides connection between data cursor and canvas.
+        Parameters
+        ----------
+        setting: bool
+            Identifies if the data cursor is selected.
+        """
+
+        if setting and self.hover_connection is None:
+            self.hover_connection = self.canvas.mpl_connect('button_press_event', self.hover)
+        elif not setting:
+            self.canvas.mpl_disconnect(self.hover_connection)
+            self.hover_connection = None
+            self.annot.set_visible(False)
+            self.canvas.draw_idle()
@@ -1,7 +1,14 @@
 from PyQt5 import QtWidgets
+import matplotlib
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Skip points that move the line less than a pixel and chunk long paths so
+# the Agg renderer handles transects with many ensembles efficiently
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
 
 class MplCanvas(FigureCanvas):
     """Initializes a QT5 figure canvas for matplotlib plots.
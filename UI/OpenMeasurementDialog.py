@@ -114,7 +114,10 @@ class OpenMeasurementDialog(QtWidgets.QDialog):
 
             # SonTek, Nortek, or QRev file
             else:
-                mat_data = sio.loadmat(self.fullName[0], struct_as_record=False, squeeze_me=True)
+                # Only the version and System variables are needed to identify
+                # the file type, so skip parsing the rest of the file
+                mat_data = sio.loadmat(self.fullName[0], struct_as_record=False, squeeze_me=True,
+                                       variable_names=['version', 'System'])
                 if 'version' in mat_data:
                     self.type = 'QRev'
                 elif hasattr(mat_data['System'], 'InstrumentModel'):
@@ -130,7 +133,8 @@ class OpenMeasurementDialog(QtWidgets.QDialog):
                     self.popup_message("Selected files contain an mmt file. An mmt file must be loaded separately")
                     break
                 elif file_extension == '.mat':
-                    mat_data = sio.loadmat(self.fullName[0], struct_as_record=False, squeeze_me=True)
+                    mat_data = sio.loadmat(self.fullName[0], struct_as_record=False, squeeze_me=True,
+                                           variable_names=['version', 'System'])
                     if 'version' in mat_data:
                         self.popup_message("Selected files contain a QRev file. A QRev file must be opened separately")
                         break
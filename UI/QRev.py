@@ -691,9 +691,12 @@ class QRev(QtWidgets.QMainWindow, QRev_gui.Ui_MainWindow):
             elif select.type == 'QRev':
                 # Show QRev filename in GUI header
                 self.setWindowTitle(self.QRev_version + ': ' + select.fullName[0])
+                # Only parse the variables actually used to avoid
+                # materializing the entire file into mat_struct objects
                 mat_data = sio.loadmat(select.fullName[0],
                                        struct_as_record=False,
-                                       squeeze_me=True)
+                                       squeeze_me=True,
+                                       variable_names=['meas_struct', 'version'])
 
                 # Check QRev version and display message for update if appropriate
                 if not self.QRev_version == mat_data['version']:
@@ -6629,8 +6632,11 @@ class QRev(QtWidgets.QMainWindow, QRev_gui.Ui_MainWindow):
             self.depth_top_toolbar = NavigationToolbar(self.depth_top_canvas, self)
             self.depth_top_toolbar.hide()
 
-        # Initialize the top figure and assign to the canvas
-        self.depth_top_fig = BeamDepths(canvas=self.depth_top_canvas)
+        # Initialize the top figure and assign to the canvas. The figure
+        # object is reused so BeamDepths can refresh its artists in place
+        # when only the data changed.
+        if self.depth_top_fig is None:
+            self.depth_top_fig = BeamDepths(canvas=self.depth_top_canvas)
         # Create the figure with the specified data
         self.depth_top_fig.create(transect=self.transect,
                                   units=self.units,